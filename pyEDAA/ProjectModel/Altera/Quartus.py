@@ -28,17 +28,44 @@
 # SPDX-License-Identifier: Apache-2.0                                                                                  #
 # ==================================================================================================================== #
 #
-"""Specific file types and attributes for Altera Quartus."""
+"""
+Specific file types and attributes for Altera Quartus.
+
+Quartus II uses the same project (``*.qpf``) and settings file (``*.qsf``) formats as Intel Quartus Prime, so the readers
+of :mod:`pyEDAA.ProjectModel.Intel.QuartusPrime` are reused.
+
+The classes derive from their Intel Quartus Prime counterparts of the same name. File types are registered by class name
+(see :class:`~pyEDAA.ProjectModel.FileType`), so after importing this module, e.g. an Intel ``SDCConstraintFile`` is
+registered as an Altera ``SDCConstraintFile``. Deriving keeps filtering by either class (e.g. ``FileCount(SDCConstraintFile)``)
+working for files created by both readers.
+"""
 from pyTooling.Decorators import export
 
-from pyEDAA.ProjectModel import ConstraintFile, ProjectFile, SDCContent, TCLContent
+from pyEDAA.ProjectModel.Intel.QuartusPrime import SDCConstraintFile as QuartusPrime_SDCConstraintFile
+from pyEDAA.ProjectModel.Intel.QuartusPrime import QuartusSettingsFile as QuartusPrime_SettingsFile
+from pyEDAA.ProjectModel.Intel.QuartusPrime import QuartusProjectFile as QuartusPrime_ProjectFile
 
 
 @export
-class QuartusProjectFile(ProjectFile, TCLContent):
-	"""A Quartus project file (``*.qpf``)."""
+class SDCConstraintFile(QuartusPrime_SDCConstraintFile):
+	"""A Quartus constraint file (Synopsys Design Constraints; ``*.sdc``)."""
 
 
 @export
-class SDCConstraintFile(ConstraintFile, SDCContent):
-	"""A Quartus constraint file (Synopsys Design Constraints; ``*.sdc``)."""
+class QuartusSettingsFile(QuartusPrime_SettingsFile):
+	"""A Quartus settings file (``*.qsf``)."""
+
+	FILE_TYPES = {**QuartusPrime_SettingsFile.FILE_TYPES, "SDC_FILE": SDCConstraintFile}
+
+
+@export
+class QuartusProjectFile(QuartusPrime_ProjectFile):
+	"""
+	A Quartus project file (``*.qpf``).
+
+	This is still a :class:`~pyEDAA.ProjectModel.ProjectFile` with :class:`~pyEDAA.ProjectModel.TCLContent`. In addition,
+	it inherits :meth:`~pyEDAA.ProjectModel.Intel.QuartusPrime.QuartusProjectFile.Parse` and the revision handling from
+	the Intel Quartus Prime reader.
+	"""
+
+	SETTINGS_FILE = QuartusSettingsFile
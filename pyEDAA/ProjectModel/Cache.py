@@ -0,0 +1,172 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2022 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""An on-disk cache for project models created by parsing tool-specific project files."""
+from hashlib  import sha256
+from os       import environ, getpid, replace as os_replace
+from pathlib  import Path
+from pickle   import dump as pickle_dump, load as pickle_load, HIGHEST_PROTOCOL
+from typing   import Dict, Iterable, List, Mapping, Tuple, Optional as Nullable
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+
+from pyEDAA.ProjectModel import __version__, Project, ProjectFile
+
+
+#: Fingerprint of a dependency: path, modification time in nanoseconds and size in bytes.
+Fingerprint = Tuple[str, int, int]
+
+
+@export
+class ParseCache(metaclass=ExtendedType, slots=True):
+	"""
+	An on-disk cache of project models created by parsing project files (e.g. ``*.xpr`` or ``*.pro``).
+
+	A cache entry is keyed by the project file's content hash, its resolved path, its kind and the package version. It
+	additionally records modification time and size of all further files read while parsing (e.g. included files) and the
+	values of environment variables the project model depends on. An entry is only used, if none of these files and
+	variables changed. Otherwise, the project file is parsed again and the entry is replaced.
+
+	The root directory of a loaded project model is rebound to the directory of the project file as passed by the caller,
+	so a model cached from another working directory or via another relative path resolves to the same files as a freshly
+	parsed model.
+
+	:arg directory: Directory for cache entries. Default: ``$XDG_CACHE_HOME/pyEDAA.ProjectModel`` or
+	                ``~/.cache/pyEDAA.ProjectModel``.
+	"""
+
+	_directory: Path
+
+	def __init__(self, directory: Nullable[Path] = None):
+		if directory is None:
+			cacheHome = environ.get("XDG_CACHE_HOME")
+			directory = (Path(cacheHome) if cacheHome else Path.home() / ".cache") / "pyEDAA.ProjectModel"
+
+		self._directory = directory
+
+	@property
+	def Directory(self) -> Path:
+		"""Read-only property returning the directory of cache entries."""
+		return self._directory
+
+	@staticmethod
+	def _ProjectFilePath(projectFile: ProjectFile) -> Path:
+		if projectFile.FileSet is None:
+			return projectFile.Path.resolve()
+		return projectFile.ResolvedPath.resolve()
+
+	@staticmethod
+	def _Fingerprint(path: Path) -> Fingerprint:
+		stat = path.stat()
+		return str(path), stat.st_mtime_ns, stat.st_size
+
+	def _EntryPath(self, projectFile: ProjectFile, path: Path, content: bytes) -> Path:
+		projectFileClass = projectFile.__class__
+		digest = sha256(content)
+		digest.update(f"\0{projectFileClass.__module__}.{projectFileClass.__qualname__}\0{__version__}\0{path}".encode())
+		return self._directory / f"{digest.hexdigest()}.pickle"
+
+	def Load(self, projectFile: ProjectFile) -> Nullable[Project]:
+		"""
+		Load the project model of a project file from cache.
+
+		:arg projectFile: The project file.
+		:returns:         The cached project model or ``None``, if no valid cache entry exists.
+		"""
+		path = self._ProjectFilePath(projectFile)
+		try:
+			content = path.read_bytes()
+		except OSError:
+			return None
+
+		try:
+			with self._EntryPath(projectFile, path, content).open("rb") as file:
+				dependencies, environment, project = pickle_load(file)
+		except Exception:
+			# missing, corrupted or incompatible entry; it will be replaced by the next store
+			return None
+
+		try:
+			for fingerprint in dependencies:
+				if self._Fingerprint(Path(fingerprint[0])) != fingerprint:
+					return None
+		except OSError:
+			return None
+
+		for name, value in environment.items():
+			if environ.get(name) != value:
+				return None
+
+		# The pickled root directory and all resolved paths derived from it are relative to the working directory at the time
+		# the entry was stored. Setting the root directory drops these caches.
+		project.RootDirectory = projectFile.Path.parent
+		return project
+
+	def Store(
+		self,
+		projectFile: ProjectFile,
+		project: Project,
+		dependencies: Iterable[Path] = (),
+		environment: Nullable[Mapping[str, Nullable[str]]] = None,
+		content: Nullable[bytes] = None
+	) -> None:
+		"""
+		Store the project model of a project file in cache.
+
+		:arg projectFile:  The project file.
+		:arg project:      The project model created from the project file.
+		:arg dependencies: Further files read while parsing the project file, e.g. included files.
+		:arg environment:  Values of environment variables (``None`` if unset) the project model depends on.
+		:arg content:      Content of the project file, which was parsed. If ``None``, the project file is read again, so a
+		                   change made while parsing isn't detected.
+		"""
+		path = self._ProjectFilePath(projectFile)
+		if content is None:
+			content = path.read_bytes()
+
+		entryPath = self._EntryPath(projectFile, path, content)
+		fingerprints: List[Fingerprint] = [self._Fingerprint(path) for path in dependencies]
+		variables: Dict[str, Nullable[str]] = dict(environment) if environment is not None else {}
+
+		self._directory.mkdir(parents=True, exist_ok=True)
+		temporaryPath = entryPath.with_name(f"{entryPath.name}.{getpid()}.tmp")
+		try:
+			with temporaryPath.open("wb") as file:
+				pickle_dump((fingerprints, variables, project), file, protocol=HIGHEST_PROTOCOL)
+			os_replace(temporaryPath, entryPath)
+		finally:
+			temporaryPath.unlink(missing_ok=True)
+
+	def Clear(self) -> None:
+		"""Remove all cache entries."""
+		if self._directory.exists():
+			for entryPath in self._directory.glob("*.pickle"):
+				entryPath.unlink(missing_ok=True)
@@ -29,16 +29,523 @@
 # ==================================================================================================================== #
 #
 """Specific file types and attributes for Intel FPGA Quartus Prime."""
-from pyTooling.Decorators import export
+from array    import array
+from io       import BytesIO, TextIOWrapper
+from pathlib  import Path
+from re       import compile as re_compile
+from sys      import intern
+from typing   import Dict, Generator, Iterable, Iterator, List, NamedTuple, Optional as Nullable, Type
 
-from pyEDAA.ProjectModel import ConstraintFile, ProjectFile, SDCContent, TCLContent
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+from pySVModel             import VerilogVersion, SystemVerilogVersion
+from pyVHDLModel           import VHDLVersion
+
+from pyEDAA.ProjectModel       import ConstraintFile, ProjectFile, SDCContent, TCLContent, File, FileSet, Design, Project
+from pyEDAA.ProjectModel       import VHDLSourceFile, VerilogSourceFile, SystemVerilogSourceFile, TCLSourceFile
+from pyEDAA.ProjectModel.Cache import ParseCache
 
 
 @export
-class QuartusProjectFile(ProjectFile, TCLContent):
-	"""A Quartus project file (``*.qpf``)."""
+class Assignment(NamedTuple):
+	"""A single assignment (``set_*_assignment``) of a Quartus settings file."""
+
+	Name:      str
+	Value:     str
+	Target:    Nullable[str]  #: Value of ``-to``.
+	Source:    Nullable[str]  #: Value of ``-from``.
+	Entity:    Nullable[str]  #: Value of ``-entity``.
+	SectionId: Nullable[str]  #: Value of ``-section_id``.
+
+
+@export
+class QuartusAssignments(metaclass=ExtendedType, slots=True):
+	"""
+	A compact, column-oriented store of assignments read from a Quartus settings file.
+
+	Instead of one object per assignment, each field is kept in its own column. Assignment names are stored as indices into
+	a table of distinct names, values, entity names and section IDs are interned, because they repeat for most rows.
+	Additionally, the rows of each name are indexed, so assignments are found by name without scanning all rows.
+	:class:`Assignment` tuples are only created when rows are accessed.
+	"""
+
+	_names:       List[str]
+	_nameIndices: Dict[str, int]
+	_nameColumn:  array
+	_nameRows:    List[array]
+	_values:      List[str]
+	_targets:     List[Nullable[str]]
+	_sources:     List[Nullable[str]]
+	_entities:    List[Nullable[str]]
+	_sectionIds:  List[Nullable[str]]
+
+	def __init__(self):
+		self._names = []
+		self._nameIndices = {}
+		self._nameColumn = array("I")
+		self._nameRows = []
+		self._values = []
+		self._targets = []
+		self._sources = []
+		self._entities = []
+		self._sectionIds = []
+
+	@property
+	def Names(self) -> List[str]:
+		"""Read-only property returning the distinct assignment names in order of first appearance."""
+		return self._names
+
+	def Append(
+		self,
+		name: str,
+		value: str,
+		target: Nullable[str] = None,
+		source: Nullable[str] = None,
+		entity: Nullable[str] = None,
+		sectionId: Nullable[str] = None
+	) -> None:
+		"""
+		Append an assignment.
+
+		:arg name:      Assignment name (``-name``).
+		:arg value:     Assigned value.
+		:arg target:    Optional target (``-to``).
+		:arg source:    Optional source (``-from``).
+		:arg entity:    Optional entity (``-entity``).
+		:arg sectionId: Optional section ID (``-section_id``).
+		"""
+		try:
+			index = self._nameIndices[name]
+		except KeyError:
+			index = self._nameIndices[name] = len(self._names)
+			self._names.append(name)
+			self._nameRows.append(array("I"))
+
+		self._nameRows[index].append(len(self._nameColumn))
+		self._nameColumn.append(index)
+		self._values.append(intern(value))
+		self._targets.append(target)
+		self._sources.append(source)
+		self._entities.append(intern(entity) if entity is not None else None)
+		self._sectionIds.append(intern(sectionId) if sectionId is not None else None)
+
+	def Find(self, name: str) -> Generator[Assignment, None, None]:
+		"""
+		Generator returning all assignments of the given name in file order.
+
+		:arg name: Assignment name.
+		:returns:  A generator of assignments.
+		"""
+		index = self._nameIndices.get(name)
+		if index is None:
+			return
+
+		for row in self._nameRows[index]:
+			yield self[row]
+
+	def GetValue(self, name: str, default: Nullable[str] = None) -> Nullable[str]:
+		"""
+		Return the value of the last assignment of the given name (later assignments override earlier ones).
+
+		:arg name:    Assignment name.
+		:arg default: Value returned, if no such assignment exists.
+		:returns:     The assigned value.
+		"""
+		index = self._nameIndices.get(name)
+		if index is None:
+			return default
+
+		return self._values[self._nameRows[index][-1]]
+
+	def __len__(self) -> int:
+		return len(self._nameColumn)
+
+	def __getitem__(self, row: int) -> Assignment:
+		return Assignment(
+			self._names[self._nameColumn[row]],
+			self._values[row],
+			self._targets[row],
+			self._sources[row],
+			self._entities[row],
+			self._sectionIds[row]
+		)
+
+	def __iter__(self) -> Iterator[Assignment]:
+		return (self[row] for row in range(len(self._nameColumn)))
+
+
+@export
+class QuartusProject(Project):
+	"""
+	A Quartus project (revision) including its global and instance assignments.
+
+	Global assignments adding files to the project (e.g. ``VHDL_FILE``) aren't stored as assignments, but as files in the
+	design's default fileset.
+
+	:arg name:          The project's name.
+	:arg rootDirectory: Base-path to the project.
+	:arg revision:      The project's revision.
+	"""
+
+	_revision:            str
+	_globalAssignments:   QuartusAssignments
+	_instanceAssignments: QuartusAssignments
+
+	def __init__(self, name: str, rootDirectory: Path = Path("."), revision: Nullable[str] = None):
+		super().__init__(name, rootDirectory=rootDirectory)
+		self._revision = revision if revision is not None else name
+		self._globalAssignments = QuartusAssignments()
+		self._instanceAssignments = QuartusAssignments()
+
+	@property
+	def Revision(self) -> str:
+		"""Read-only property returning the project's revision."""
+		return self._revision
+
+	@property
+	def GlobalAssignments(self) -> QuartusAssignments:
+		"""Read-only property returning all global assignments (``set_global_assignment``) except file assignments."""
+		return self._globalAssignments
+
+	@property
+	def InstanceAssignments(self) -> QuartusAssignments:
+		"""Read-only property returning all instance (``set_instance_assignment``) and location assignments (``set_location_assignment``)."""
+		return self._instanceAssignments
+
+	@property
+	def Family(self) -> Nullable[str]:
+		"""Read-only property returning the device family (``FAMILY``)."""
+		return self._globalAssignments.GetValue("FAMILY")
+
+	@property
+	def Device(self) -> Nullable[str]:
+		"""Read-only property returning the device (``DEVICE``)."""
+		return self._globalAssignments.GetValue("DEVICE")
+
+	def PinAssignments(self) -> Dict[str, str]:
+		"""
+		Return all pin locations (``set_location_assignment``).
+
+		:returns: A dictionary of pin names by port name.
+		"""
+		return {assignment.Target: assignment.Value for assignment in self._instanceAssignments.Find("LOCATION")}
 
 
 @export
 class SDCConstraintFile(ConstraintFile, SDCContent):
 	"""A Quartus constraint file (Synopsys Design Constraints; ``*.sdc``)."""
+
+
+#: Words of a Tcl command: a double-quoted word, a braced word or a bare word.
+_TOKEN = re_compile(r'"((?:[^"\\]|\\.)*)"|\{([^{}]*)\}|(\S+)')
+
+#: Options of assignment commands followed by a value.
+_VALUE_OPTIONS = frozenset(("-name", "-to", "-from", "-entity", "-section_id", "-library", "-hdl_version", "-tag", "-comment"))
+
+#: Options of assignment commands without a value.
+_FLAG_OPTIONS = frozenset(("-disable", "-remove", "-rise", "-fall"))
+
+
+def _ParseVersion(versionClass, value: Nullable[str]):
+	"""Parse a Quartus language version like ``VHDL_2008`` or ``SYSTEMVERILOG_2005``."""
+	if value is None:
+		return None
+
+	return versionClass.Parse(value.rpartition("_")[2])
+
+
+class _QSFReader(metaclass=ExtendedType, slots=True):
+	"""
+	Builds the project model from the assignment commands of a Quartus settings file (``*.qsf``).
+
+	Lines are split into Tcl words by a single regular expression. No Tcl interpreter is involved, so variables, command
+	substitution and control structures aren't supported. Quartus itself writes ``*.qsf`` files as a flat list of
+	assignment commands. Unknown commands are skipped.
+	"""
+
+	_project:   QuartusProject
+	_fileSet:   FileSet
+	_fileTypes: Dict[str, Type[File]]
+
+	def __init__(self, project: QuartusProject, fileSet: FileSet, fileTypes: Dict[str, Type[File]]):
+		self._project = project
+		self._fileSet = fileSet
+		self._fileTypes = fileTypes
+
+	def Read(self, lines: Iterable[str]) -> None:
+		handlers = self._COMMAND_HANDLERS
+		findall = _TOKEN.findall
+
+		continued = ""
+		for line in lines:
+			line = line.strip()
+			if continued != "":
+				line = continued + line
+				continued = ""
+
+			if line == "" or line[0] == "#":
+				continue
+			elif line[-1] == "\\":
+				continued = line[:-1] + " "
+				continue
+
+			tokens = [quoted + braced + bare for quoted, braced, bare in findall(line)]
+			handler = handlers.get(tokens[0])
+			if handler is not None:
+				handler(self, tokens)
+
+	@staticmethod
+	def _Arguments(tokens: List[str]) -> Nullable[Dict[str, str]]:
+		"""
+		Split the words of an assignment command into options and a positional value (stored as key ``""``).
+
+		:returns: A dictionary of option values by option name or ``None``, if the assignment is disabled or removed.
+		"""
+		arguments = {}
+		i = 1
+		count = len(tokens)
+		while i < count:
+			token = tokens[i]
+			if token in _VALUE_OPTIONS and i + 1 < count:
+				arguments[token] = tokens[i + 1]
+				i += 2
+				continue
+			elif token in _FLAG_OPTIONS:
+				if token == "-disable" or token == "-remove":
+					return None
+			else:
+				arguments[""] = token
+			i += 1
+
+		return arguments
+
+	def _GlobalAssignment(self, tokens: List[str]) -> None:
+		arguments = self._Arguments(tokens)
+		if arguments is None or (name := arguments.get("-name")) is None:
+			return
+
+		value = arguments.get("", "")
+		fileType = self._fileTypes.get(name)
+		if fileType is not None:
+			self._AddFile(fileType, value, arguments)
+			return
+
+		if name == "TOP_LEVEL_ENTITY":
+			self._project.DefaultDesign.TopLevel = value
+		elif name == "VHDL_INPUT_VERSION":
+			self._project.VHDLVersion = _ParseVersion(VHDLVersion, value)
+		elif name == "VERILOG_INPUT_VERSION":
+			if value.startswith("SYSTEMVERILOG"):
+				self._project.SVVersion = _ParseVersion(SystemVerilogVersion, value)
+			else:
+				self._project.VerilogVersion = _ParseVersion(VerilogVersion, value)
+
+		self._project._globalAssignments.Append(name, value, None, None, arguments.get("-entity"), arguments.get("-section_id"))
+
+	def _InstanceAssignment(self, tokens: List[str]) -> None:
+		arguments = self._Arguments(tokens)
+		if arguments is None or (name := arguments.get("-name")) is None:
+			return
+
+		self._project._instanceAssignments.Append(
+			name,
+			arguments.get("", ""),
+			arguments.get("-to"),
+			arguments.get("-from"),
+			arguments.get("-entity"),
+			arguments.get("-section_id")
+		)
+
+	def _LocationAssignment(self, tokens: List[str]) -> None:
+		arguments = self._Arguments(tokens)
+		if arguments is None:
+			return
+
+		self._project._instanceAssignments.Append(
+			"LOCATION",
+			arguments.get("", ""),
+			arguments.get("-to"),
+			arguments.get("-from"),
+			arguments.get("-entity"),
+			arguments.get("-section_id")
+		)
+
+	def _AddFile(self, fileType: Type[File], value: str, arguments: Dict[str, str]) -> None:
+		path = Path(value)
+		hdlVersion = arguments.get("-hdl_version")
+
+		if issubclass(fileType, VHDLSourceFile):
+			file = fileType(path, vhdlVersion=_ParseVersion(VHDLVersion, hdlVersion))
+			self._fileSet.AddFile(file)
+			if (library := arguments.get("-library")) is not None:
+				file.VHDLLibrary = self._fileSet.GetOrCreateVHDLLibrary(library)
+		elif issubclass(fileType, VerilogSourceFile):
+			file = fileType(path, verilogVersion=_ParseVersion(VerilogVersion, hdlVersion))
+			self._fileSet.AddFile(file)
+		elif issubclass(fileType, SystemVerilogSourceFile):
+			file = fileType(path, svVersion=_ParseVersion(SystemVerilogVersion, hdlVersion))
+			self._fileSet.AddFile(file)
+		else:
+			self._fileSet.AddFile(fileType(path))
+
+	_COMMAND_HANDLERS = {
+		"set_global_assignment":   _GlobalAssignment,
+		"set_instance_assignment": _InstanceAssignment,
+		"set_location_assignment": _LocationAssignment,
+	}
+
+
+@export
+class QuartusSettingsFile(ProjectFile, TCLContent):
+	"""A Quartus settings file (``*.qsf``)."""
+
+	#: File classes by assignment name of file assignments (``set_global_assignment -name <name> <path>``).
+	FILE_TYPES = {
+		"VHDL_FILE":          VHDLSourceFile,
+		"VERILOG_FILE":       VerilogSourceFile,
+		"SYSTEMVERILOG_FILE": SystemVerilogSourceFile,
+		"SDC_FILE":           SDCConstraintFile,
+		"TCL_SCRIPT_FILE":    TCLSourceFile,
+	}
+
+	_qsfProject: Nullable[QuartusProject]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Project = None,
+		design: Design = None,
+		fileSet: FileSet = None
+	):
+		super().__init__(path, project, design, fileSet)
+
+		self._qsfProject = None
+
+	@property
+	def ProjectModel(self) -> QuartusProject:
+		return self._qsfProject
+
+	def Parse(self, cache: Nullable[ParseCache] = None):
+		"""
+		Parse the Quartus settings file and create a project model.
+
+		The file is read line by line, so the runtime grows linearly with the number of assignments. Assignments, which aren't
+		file assignments, are kept in column-oriented stores (see :class:`QuartusAssignments`).
+
+		:arg cache: Optional parse cache. If it holds a valid entry for this file, the model is loaded from cache.
+		"""
+		if not self._path.exists():
+			raise Exception(f"Quartus settings file '{self._path!s}' not found.") from FileNotFoundError(f"File '{self._path!s}' not found.")
+
+		if cache is not None and (project := cache.Load(self)) is not None:
+			self._qsfProject = project
+			return
+
+		# A cache entry is keyed by the content, which was parsed. So read it once instead of streaming the file.
+		content = None
+		if cache is not None:
+			try:
+				content = self._path.read_bytes()
+			except OSError as ex:
+				raise Exception(f"Couldn't open '{self._path!s}'.") from ex
+
+		project = QuartusProject(self._path.stem, rootDirectory=self._path.parent)
+		self._Read(project, content)
+		self._qsfProject = project
+
+		if cache is not None:
+			cache.Store(self, project, content=content)
+
+	def _Read(self, project: QuartusProject, content: Nullable[bytes] = None) -> None:
+		"""
+		Read the assignments of this settings file into a project model.
+
+		:arg project: The project model to fill.
+		:arg content: Already read content of this file. If ``None``, the file is read line by line.
+		"""
+		reader = _QSFReader(project, project.DefaultDesign.DefaultFileSet, self.FILE_TYPES)
+		try:
+			if content is not None:
+				with TextIOWrapper(BytesIO(content), encoding="utf-8", errors="replace") as file:
+					reader.Read(file)
+			else:
+				with self._path.open("r", encoding="utf-8", errors="replace") as file:
+					reader.Read(file)
+		except OSError as ex:
+			raise Exception(f"Couldn't open '{self._path!s}'.") from ex
+
+
+#: A ``<key> = "<value>"`` line of a Quartus project file.
+_QPF_LINE = re_compile(r'^\s*(\w+)\s*=\s*"([^"]*)"')
+
+
+@export
+class QuartusProjectFile(ProjectFile, TCLContent):
+	"""A Quartus project file (``*.qpf``)."""
+
+	#: Class used to read the settings file (``<revision>.qsf``) of a revision.
+	SETTINGS_FILE = QuartusSettingsFile
+
+	_qpfProject: Nullable[QuartusProject]
+	_revisions:  List[str]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Project = None,
+		design: Design = None,
+		fileSet: FileSet = None
+	):
+		super().__init__(path, project, design, fileSet)
+
+		self._qpfProject = None
+		self._revisions = []
+
+	@property
+	def ProjectModel(self) -> QuartusProject:
+		return self._qpfProject
+
+	@property
+	def Revisions(self) -> List[str]:
+		"""Read-only property returning the project's revisions (``PROJECT_REVISION``)."""
+		return self._revisions
+
+	def Parse(self, revision: Nullable[str] = None, cache: Nullable[ParseCache] = None):
+		"""
+		Parse the Quartus project file and the settings file of a revision, then create a project model.
+
+		:arg revision: Name of the revision to read. Default: the first revision listed in the project file.
+		:arg cache:    Optional parse cache. If it holds a valid entry for this file and the revision's settings file didn't
+		               change, the model is loaded from cache.
+		"""
+		if not self._path.exists():
+			raise Exception(f"Quartus project file '{self._path!s}' not found.") from FileNotFoundError(f"File '{self._path!s}' not found.")
+
+		# A project file lists only a few revisions. It's read once, so a cache entry is keyed by the content, which was parsed.
+		try:
+			content = self._path.read_bytes()
+		except OSError as ex:
+			raise Exception(f"Couldn't open '{self._path!s}'.") from ex
+
+		with TextIOWrapper(BytesIO(content), encoding="utf-8", errors="replace") as file:
+			self._revisions = [match[2] for line in file if (match := _QPF_LINE.match(line)) is not None and match[1] == "PROJECT_REVISION"]
+
+		if revision is None:
+			revision = self._revisions[0] if len(self._revisions) > 0 else self._path.stem
+		elif revision not in self._revisions:
+			raise Exception(f"Revision '{revision}' not found in Quartus project file '{self._path!s}'.")
+
+		if cache is not None and (project := cache.Load(self)) is not None and project.Revision == revision:
+			self._qpfProject = project
+			return
+
+		settingsFile = self.SETTINGS_FILE(self._path.parent / f"{revision}.qsf")
+		if not settingsFile.Path.exists():
+			raise Exception(f"Quartus settings file '{settingsFile.Path!s}' of revision '{revision}' not found.") from FileNotFoundError(f"File '{settingsFile.Path!s}' not found.")
+
+		project = QuartusProject(self._path.stem, rootDirectory=self._path.parent, revision=revision)
+		settingsFile._Read(project)
+		self._qpfProject = project
+
+		if cache is not None:
+			cache.Store(self, project, (settingsFile.Path, ), content=content)
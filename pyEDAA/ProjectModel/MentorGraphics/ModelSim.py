@@ -29,21 +29,383 @@
 # ==================================================================================================================== #
 #
 """Specific file types and attributes for Mentor Graphics ModelSim."""
+from hashlib  import sha256
+from os       import environ, stat
+from pathlib  import Path
+from re       import compile as re_compile
+from typing   import Dict, List, NamedTuple, Optional as Nullable, Tuple
+
 from pyTooling.Decorators import export
+from pyVHDLModel          import VHDLVersion
 
-from pyEDAA.ProjectModel import ProjectFile, SettingFile, INIContent, WaveformConfigFile, TCLContent
+from pyEDAA.ProjectModel       import ProjectFile, SettingFile, INIContent, WaveformConfigFile, TCLContent, File, FileSet
+from pyEDAA.ProjectModel       import Design, Project, VHDLSourceFile, VerilogSourceFile, SystemVerilogSourceFile, TCLSourceFile
+from pyEDAA.ProjectModel.Cache import ParseCache
 
 
-@export
-class ModelSimProjectFile(ProjectFile):
-	pass
+#: Library mapping: a path by library name.
+LibraryMapping = Dict[str, Path]
+
+#: Fingerprint of an included file: path, modification time in nanoseconds and size in bytes.
+_Fingerprint = Tuple[str, int, int]
+
+#: Environment variable references: ``$NAME``, ``${NAME}``, ``$(NAME)`` or ``%NAME%``.
+_VARIABLE = re_compile(r"\$(?:\{(\w+)\}|\((\w+)\)|(\w+))|%(\w+)%")
+
+
+class _ResolvedLibraryMapping(NamedTuple):
+	Mapping:       LibraryMapping            #: Merged library mapping.
+	Unresolved:    Dict[str, str]            #: Unexpanded values by library name (or ``others``), which reference unset variables.
+	IncludedFiles: List[Path]                #: Paths of all included files.
+	Variables:     Dict[str, Nullable[str]]  #: Values of all referenced environment variables (``None`` if unset).
+
+
+#: Merged library mappings by resolved path and content hash of a ``modelsim.ini`` file. An entry stores the fingerprints
+#: of all included files, the values of all referenced environment variables, the merged mapping and unresolved entries.
+_LIBRARY_MAPPINGS: Dict[Tuple[Path, bytes], Tuple[Tuple[_Fingerprint, ...], Dict[str, Nullable[str]], LibraryMapping, Dict[str, str]]] = {}
+
+
+def _ReadSection(content: str, sectionName: str) -> List[Tuple[int, str, str]]:
+	"""
+	Return the ``key = value`` pairs of a section of an INI file in file order, each with its line number.
+
+	Comments (``;``) are removed. Lines of other sections aren't split, so e.g. the large ``[vsim]`` section of a
+	``modelsim.ini`` is skipped quickly.
+	"""
+	header = f"[{sectionName.lower()}]"
+	entries = []
+	inSection = False
+	for lineNumber, line in enumerate(content.splitlines(), start=1):
+		line = line.strip()
+		if line == "" or line[0] == ";":
+			continue
+		elif line[0] == "[":
+			if inSection:
+				break
+			inSection = line.lower() == header
+		elif inSection:
+			key, equal, value = line.partition("=")
+			if equal != "":
+				entries.append((lineNumber, key.strip(), value.partition(";")[0].strip()))
+
+	return entries
+
+
+def _Expand(value: str, variables: Dict[str, Nullable[str]]) -> Nullable[str]:
+	"""
+	Replace references to environment variables. All referenced variables are recorded in ``variables``.
+
+	:returns: The expanded value or ``None``, if a referenced variable isn't set.
+	"""
+	if "$" not in value and "%" not in value:
+		return value
+
+	unset = False
+
+	def replace(match) -> str:
+		nonlocal unset
+		name = match[1] or match[2] or match[3] or match[4]
+		variables[name] = environ.get(name)
+		if variables[name] is None:
+			unset = True
+			return match[0]
+		return variables[name]
+
+	value = _VARIABLE.sub(replace, value)
+	return None if unset else value
+
+
+def _FingerprintOf(path: Path) -> _Fingerprint:
+	status = stat(path)
+	return str(path), status.st_mtime_ns, status.st_size
+
+
+def _ResolveLibraryMapping(path: Path, content: Nullable[bytes] = None) -> _ResolvedLibraryMapping:
+	"""
+	Return the merged library mapping (section ``[Library]``) of a ``modelsim.ini`` file.
+
+	An ``others = <path>`` entry includes the library mapping of another ``modelsim.ini`` file. Libraries mapped by the
+	including file take precedence. Relative paths are relative to the directory of the file, which maps the library.
+	Entries referencing an unset environment variable (e.g. ``$MODEL_TECH``) aren't resolved, because the literal
+	reference would be read as a directory name. They are returned as unresolved entries instead.
+
+	The result is memoized by path and content hash. It's reused as long as no included file was modified and all
+	referenced environment variables are unchanged, so an include chain is read only once per process.
+
+	:arg path:    Path to the ``modelsim.ini`` (or ``*.mpf``) file.
+	:arg content: Content of the file, if already read.
+	:returns:     Merged library mapping, unresolved entries, paths of all included files and referenced variables.
+	"""
+	path = path.resolve()
+	if content is None:
+		try:
+			content = path.read_bytes()
+		except OSError as ex:
+			raise Exception(f"Couldn't open '{path!s}'.") from ex
+
+	key = (path, sha256(content).digest())
+	if (entry := _LIBRARY_MAPPINGS.get(key)) is not None:
+		fingerprints, variables, mapping, unresolved = entry
+		try:
+			if all(_FingerprintOf(Path(fingerprint[0])) == fingerprint for fingerprint in fingerprints) and \
+				all(environ.get(name) == value for name, value in variables.items()):
+				return _ResolvedLibraryMapping(dict(mapping), dict(unresolved), [Path(fingerprint[0]) for fingerprint in fingerprints], dict(variables))
+		except OSError:
+			pass
+
+	fingerprints: List[_Fingerprint] = []
+	variables: Dict[str, Nullable[str]] = {}
+	mapping: LibraryMapping = {}
+	unresolved: Dict[str, str] = {}
+	visited = [path]
+
+	while True:
+		includePath = None
+		for _, name, rawValue in _ReadSection(content.decode("utf-8", errors="replace"), "Library"):
+			if (value := _Expand(rawValue, variables)) is None:
+				if name not in mapping:
+					unresolved.setdefault(name, rawValue)
+			elif name.lower() == "others":
+				includePath = path.parent / value
+			elif name not in unresolved:
+				mapping.setdefault(name, path.parent / value)
+
+		if includePath is None:
+			break
+
+		path = includePath.resolve()
+		if path in visited:
+			raise Exception(f"Circular include of '{path!s}' via 'others' in '{visited[-1]!s}'.")
+		visited.append(path)
+
+		try:
+			fingerprints.append(_FingerprintOf(path))
+			content = path.read_bytes()
+		except OSError as ex:
+			raise Exception(f"Couldn't open '{path!s}' included via 'others' in '{visited[-2]!s}'.") from ex
+
+	_LIBRARY_MAPPINGS[key] = (tuple(fingerprints), variables, mapping, unresolved)
+	return _ResolvedLibraryMapping(dict(mapping), dict(unresolved), visited[1:], dict(variables))
 
 
 @export
 class ModelSimINIFile(SettingFile, INIContent):
-	pass
+	"""A ModelSim configuration file (``modelsim.ini``)."""
+
+	_libraryMapping:           Nullable[LibraryMapping]
+	_unresolvedLibraryMapping: Nullable[Dict[str, str]]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Project = None,
+		design: Design = None,
+		fileSet: FileSet = None
+	):
+		super().__init__(path, project, design, fileSet)
+
+		self._libraryMapping = None
+		self._unresolvedLibraryMapping = None
+
+	@property
+	def LibraryMapping(self) -> Nullable[LibraryMapping]:
+		"""Read-only property returning the merged library mapping (paths by library name) after parsing."""
+		return self._libraryMapping
+
+	@property
+	def UnresolvedLibraryMapping(self) -> Nullable[Dict[str, str]]:
+		"""
+		Read-only property returning library mapping entries (unexpanded values by library name or ``others``), which
+		reference an unset environment variable, after parsing.
+		"""
+		return self._unresolvedLibraryMapping
+
+	def Parse(self):
+		"""
+		Parse the library mapping (section ``[Library]``) incl. all files included via ``others``.
+
+		Merged library mappings are memoized per file content, so parsing the same file again is cheap.
+		"""
+		if not self._path.exists():
+			raise Exception(f"ModelSim configuration file '{self._path!s}' not found.") from FileNotFoundError(f"File '{self._path!s}' not found.")
+
+		self._libraryMapping, self._unresolvedLibraryMapping, _, _ = _ResolveLibraryMapping(self._path)
+
+
+@export
+class ModelSimProject(Project):
+	"""
+	A ModelSim project including its library mapping.
+
+	:arg name:          The project's name.
+	:arg rootDirectory: Base-path to the project.
+	"""
+
+	_libraryMapping:           LibraryMapping
+	_unresolvedLibraryMapping: Dict[str, str]
+
+	def __init__(self, name: str, rootDirectory: Path = Path(".")):
+		super().__init__(name, rootDirectory=rootDirectory)
+		self._libraryMapping = {}
+		self._unresolvedLibraryMapping = {}
+
+	@property
+	def LibraryMapping(self) -> LibraryMapping:
+		"""Read-only property returning the merged library mapping (paths by library name)."""
+		return self._libraryMapping
+
+	@property
+	def UnresolvedLibraryMapping(self) -> Dict[str, str]:
+		"""
+		Read-only property returning library mapping entries (unexpanded values by library name or ``others``), which
+		reference an unset environment variable.
+		"""
+		return self._unresolvedLibraryMapping
+
+
+#: Words of a Tcl list: a braced word or a bare word.
+_TCL_WORD = re_compile(r"\{([^{}]*)\}|(\S+)")
+
+
+def _ReadProperties(value: str) -> Dict[str, str]:
+	"""Read the properties (``Project_File_P_<n>`` or ``Project_Folder_P_<n>``) of a project file entry."""
+	words = [braced or bare for braced, bare in _TCL_WORD.findall(value)]
+	return dict(zip(words[::2], words[1::2]))
+
+
+@export
+class ModelSimProjectFile(ProjectFile, INIContent):
+	"""A ModelSim project file (``*.mpf``)."""
+
+	#: File classes by file type (property ``file_type``). Other file types are read as :class:`File`.
+	FILE_TYPES = {
+		"vhdl":          VHDLSourceFile,
+		"verilog":       VerilogSourceFile,
+		"systemverilog": SystemVerilogSourceFile,
+		"tcl":           TCLSourceFile,
+	}
+
+	_mpfProject: Nullable[ModelSimProject]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Project = None,
+		design: Design = None,
+		fileSet: FileSet = None
+	):
+		super().__init__(path, project, design, fileSet)
+
+		self._mpfProject = None
+
+	@property
+	def ProjectModel(self) -> ModelSimProject:
+		return self._mpfProject
+
+	def Parse(self, cache: Nullable[ParseCache] = None):
+		"""
+		Parse the ModelSim project file and create a project model.
+
+		Files (``Project_File_<n>``) are added in compile order to the fileset of their folder (``Project_Folder_<n>``).
+		Files in the folder ``Top Level`` are added to the design's default fileset. VHDL files are added to the VHDL
+		library given by their ``compile_to`` property. The library mapping (section ``[Library]``) incl. all files
+		included via ``others`` is resolved once and stored in the project model.
+
+		:arg cache: Optional parse cache. If it holds a valid entry for this file and neither an included ``modelsim.ini``
+		            nor a referenced environment variable (e.g. ``MODEL_TECH``) changed, the model is loaded from cache.
+		"""
+		if not self._path.exists():
+			raise Exception(f"ModelSim project file '{self._path!s}' not found.") from FileNotFoundError(f"File '{self._path!s}' not found.")
+
+		if cache is not None and (project := cache.Load(self)) is not None:
+			self._mpfProject = project
+			return
+
+		try:
+			content = self._path.read_bytes()
+		except OSError as ex:
+			raise Exception(f"Couldn't open '{self._path!s}'.") from ex
+
+		project = ModelSimProject(self._path.stem, rootDirectory=self._path.parent)
+		project._libraryMapping, project._unresolvedLibraryMapping, includedFiles, variables = _ResolveLibraryMapping(self._path, content)
+		design = project.DefaultDesign
+
+		files: Dict[str, str] = {}
+		fileLines: Dict[str, int] = {}
+		fileProperties: Dict[str, Dict[str, str]] = {}
+		filePropertyLines: Dict[str, int] = {}
+		folderNames: Dict[str, str] = {}
+		folderProperties: Dict[str, Dict[str, str]] = {}
+		for lineNumber, key, value in _ReadSection(content.decode("utf-8", errors="replace"), "Project"):
+			if key.startswith("Project_File_P_"):
+				fileProperties[key[15:]] = _ReadProperties(value)
+				filePropertyLines[key[15:]] = lineNumber
+			elif key.startswith("Project_File_"):
+				files[key[13:]] = value
+				fileLines[key[13:]] = lineNumber
+			elif key.startswith("Project_Folder_P_"):
+				folderProperties[key[17:]] = _ReadProperties(value)
+			elif key.startswith("Project_Folder_") and key != "Project_Folder_Count":
+				folderNames[key[15:]] = value
+
+		# parent folder by folder name
+		folders = {name: folderProperties.get(index, {}).get("folder", "Top Level") for index, name in folderNames.items()}
+		fileSets: Dict[str, FileSet] = {"Top Level": design.DefaultFileSet}
+
+		def getFileSet(name: str) -> FileSet:
+			# collect the folders up to the first one with a fileset, then create filesets top-down
+			chain = []
+			visited = set()
+			while name not in fileSets:
+				if name in visited:
+					raise Exception(f"Circular folder hierarchy of folder '{name}' in ModelSim project file '{self._path!s}'.")
+				visited.add(name)
+				chain.append(name)
+				name = folders.get(name, "Top Level")
+
+			fileSet = fileSets[name]
+			for name in reversed(chain):
+				if fileSet is design.DefaultFileSet:
+					fileSet = FileSet(name, design=design)
+				else:
+					fileSet = FileSet(name, parent=fileSet)
+				fileSets[name] = fileSet
+
+			return fileSet
+
+		# without a 'compile_order' property, files are compiled in the order of their entry numbers
+		compileOrders: Dict[str, int] = {}
+		for index in files.keys():
+			if (compileOrder := fileProperties.get(index, {}).get("compile_order")) is None:
+				compileOrder, lineNumber = index, fileLines[index]
+			else:
+				lineNumber = filePropertyLines[index]
+			try:
+				compileOrders[index] = int(compileOrder)
+			except ValueError as ex:
+				raise Exception(
+					f"Compile order '{compileOrder}' of file '{files[index]}' isn't an integer in ModelSim project file '{self._path!s}' "
+					f"(line {lineNumber})."
+				) from ex
+
+		for index in sorted(files.keys(), key=compileOrders.__getitem__):
+			properties = fileProperties.get(index, {})
+			fileType = self.FILE_TYPES.get(properties.get("file_type"), File)
+			fileSet = getFileSet(properties.get("folder", "Top Level"))
+			if issubclass(fileType, VHDLSourceFile):
+				file = fileType(Path(files[index]), vhdlVersion=VHDLVersion.Parse(properties.get("vhdl_use93", "")))
+				fileSet.AddFile(file)
+				if (library := properties.get("compile_to")) is not None:
+					file.VHDLLibrary = fileSet.GetOrCreateVHDLLibrary(library)
+			else:
+				fileSet.AddFile(fileType(Path(files[index])))
+
+		self._mpfProject = project
+
+		if cache is not None:
+			cache.Store(self, project, includedFiles, variables, content)
 
 
 @export
 class WaveDoFile(WaveformConfigFile, TCLContent):
-	pass
+	"""A ModelSim waveform configuration file (``wave.do``)."""
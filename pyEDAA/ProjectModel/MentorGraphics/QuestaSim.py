@@ -28,22 +28,29 @@
 # SPDX-License-Identifier: Apache-2.0                                                                                  #
 # ==================================================================================================================== #
 #
-"""Specific file types and attributes for Mentor Graphics QuestaSim."""
+"""
+Specific file types and attributes for Mentor Graphics QuestaSim.
+
+QuestaSim uses the same project (``*.mpf``) and configuration file (``modelsim.ini``) formats as ModelSim, so the
+readers of :mod:`pyEDAA.ProjectModel.MentorGraphics.ModelSim` are reused.
+"""
 from pyTooling.Decorators import export
 
-from pyEDAA.ProjectModel import ProjectFile, SettingFile, INIContent, WaveformConfigFile, TCLContent
+from pyEDAA.ProjectModel.MentorGraphics.ModelSim import ModelSimProjectFile as ModelSim_ProjectFile
+from pyEDAA.ProjectModel.MentorGraphics.ModelSim import ModelSimINIFile as ModelSim_INIFile
+from pyEDAA.ProjectModel.MentorGraphics.ModelSim import WaveDoFile as ModelSim_WaveDoFile
 
 
 @export
-class ModelSimProjectFile(ProjectFile):
-	pass
+class ModelSimProjectFile(ModelSim_ProjectFile):
+	"""A QuestaSim project file (``*.mpf``)."""
 
 
 @export
-class ModelSimINIFile(SettingFile, INIContent):
-	pass
+class ModelSimINIFile(ModelSim_INIFile):
+	"""A QuestaSim configuration file (``modelsim.ini``)."""
 
 
 @export
-class WaveDoFile(WaveformConfigFile, TCLContent):
-	pass
+class WaveDoFile(ModelSim_WaveDoFile):
+	"""A QuestaSim waveform configuration file (``wave.do``)."""
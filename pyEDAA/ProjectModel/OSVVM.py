@@ -29,19 +29,605 @@
 # ==================================================================================================================== #
 #
 """Specific file types and attributes for `OSVVM <https://github.com/OSVVM>`__."""
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from enum     import Enum
+from io       import BytesIO, TextIOWrapper
+from operator import eq as operator_eq, ne as operator_ne, lt as operator_lt, le as operator_le, gt as operator_gt, ge as operator_ge
+from pathlib  import Path
+from re       import compile as re_compile
+from typing   import Any, Callable, Dict, Generator, Iterable, List, NamedTuple, Optional as Nullable, Tuple, Union
 
-from pyTooling.Decorators import export
-from typing import Optional as Nullable, List
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+from pyVHDLModel           import VHDLVersion
 
-from pyEDAA.ProjectModel import ProjectFile, TCLContent, Project, Design, FileSet, VHDLLibrary, VHDLSourceFile
+from pyEDAA.ProjectModel       import ProjectFile, TCLContent, Project, Design, FileSet, VHDLLibrary, VHDLSourceFile
+from pyEDAA.ProjectModel.Cache import ParseCache
+
+
+@export
+class DiagnosticSeverity(Enum):
+	"""Severity of a :class:`Diagnostic`."""
+
+	Info =    0  #: Informational message, e.g. a skipped command.
+	Warning = 1  #: The model might be incomplete, e.g. because of an unsupported command.
+
+
+@export
+class Diagnostic(NamedTuple):
+	"""A message emitted while reading an OSVVM project file."""
+
+	Severity: DiagnosticSeverity
+	Path:     Path
+	Line:     int
+	Message:  str
+
+
+#: A callable receiving diagnostics, e.g. ``list.append``.
+DiagnosticSink = Callable[[Diagnostic], None]
+
+
+#: Tokenized commands: a list of ``(line, words)`` tuples.
+Commands = List[Tuple[int, List[str]]]
+
+
+class _Braced(str):
+	"""
+	A Tcl word enclosed in braces. Its content is taken literally.
+
+	The attribute ``Line`` holds the line number of the opening brace, so commands in a braced body (e.g. of an ``if``
+	command) can be located.
+	"""
+
+
+#: Characters, which require the complete Tcl word splitting rules. Lines without them are split at whitespace.
+_SPECIAL = re_compile(r'[{}"\\;\[]')
+
+
+def _SplitCommands(text: str) -> Nullable[Commands]:
+	"""
+	Split Tcl source text into commands and each command into words.
+
+	Words in braces are returned as :class:`_Braced`. Double-quoted words and bare words are returned as :class:`str`,
+	they keep variable references (``$name``) for a later substitution. Line numbers are relative to the first line of
+	``text``, which is line 0.
+
+	:arg text: Tcl source text of one or more (possibly multi-line) commands.
+	:returns:  A list of commands or ``None``, if the text ends inside a braced or quoted word or with a line continuation.
+	"""
+	commands = []
+	words = []
+	line = 0
+	commandLine = 0
+	i = 0
+	length = len(text)
+	while i < length:
+		c = text[i]
+		if c == " " or c == "\t" or c == "\r":
+			i += 1
+		elif c == "\n" or c == ";":
+			if len(words) > 0:
+				commands.append((commandLine, words))
+				words = []
+			if c == "\n":
+				line += 1
+			i += 1
+		elif c == "\\" and i + 1 < length and text[i + 1] == "\n":
+			line += 1
+			i += 2
+		elif c == "#" and len(words) == 0:
+			end = text.find("\n", i)
+			i = length if end == -1 else end
+		else:
+			if len(words) == 0:
+				commandLine = line
+
+			if c == "{":
+				depth = 1
+				j = i + 1
+				while j < length:
+					c = text[j]
+					if c == "\\":
+						j += 1
+					elif c == "{":
+						depth += 1
+					elif c == "}":
+						depth -= 1
+						if depth == 0:
+							break
+					j += 1
+				else:
+					return None
+
+				word = _Braced(text[i + 1:j])
+				word.Line = line
+				i = j + 1
+			elif c == '"':
+				j = i + 1
+				while j < length and text[j] != '"':
+					j += 2 if text[j] == "\\" else 1
+				if j >= length:
+					return None
+
+				word = text[i + 1:j]
+				i = j + 1
+			else:
+				depth = 0
+				j = i
+				while j < length:
+					c = text[j]
+					if c == "[":
+						depth += 1
+					elif c == "]":
+						depth -= 1
+					elif depth == 0 and (c == " " or c == "\t" or c == "\r" or c == "\n" or c == ";"):
+						break
+					elif c == "\\":
+						j += 1
+					j += 1
+				if depth > 0 or text.endswith("\\"):
+					return None
+
+				word = text[i:j]
+				i = j
+
+			words.append(word)
+			line += word.count("\n")
+
+	if len(words) > 0:
+		commands.append((commandLine, words))
+
+	return commands
+
+
+def _Relocate(commands: Commands, firstLine: int) -> Generator[Tuple[int, List[str]], None, None]:
+	"""
+	Convert the relative line numbers returned by :func:`_SplitCommands` into absolute line numbers.
+
+	:arg commands:  Commands with line numbers relative to their source text.
+	:arg firstLine: Absolute line number of the first line of the source text.
+	:returns:       A generator of ``(line, words)`` tuples.
+	"""
+	for offset, words in commands:
+		for word in words:
+			if word.__class__ is _Braced:
+				word.Line += firstLine
+		yield firstLine + offset, words
+
+
+def _Tokenize(lines: Iterable[str]) -> Generator[Tuple[int, List[str]], None, None]:
+	"""
+	Tokenize Tcl source code into commands, each with its line number and a list of words.
+
+	Most lines of an OSVVM project file are simple commands like ``analyze file.vhd``. These are split at whitespace. Only
+	lines with braces, quotes, brackets, semicolons or line continuations use the complete word splitting rules. Such
+	commands may span multiple lines, e.g. an ``if`` command with its bodies. Comments and empty lines are skipped.
+
+	:arg lines: Lines of Tcl source code.
+	:returns:   A generator of ``(line, words)`` tuples.
+	"""
+	buffer = None
+	startLine = 0
+	lineNumber = 0
+	for line in lines:
+		lineNumber += 1
+		if buffer is None:
+			stripped = line.strip()
+			if stripped == "" or stripped[0] == "#":
+				continue
+			elif _SPECIAL.search(stripped) is None:
+				yield lineNumber, stripped.split()
+				continue
+
+			buffer = stripped
+			startLine = lineNumber
+		else:
+			buffer = f"{buffer}\n{line.rstrip()}"
+
+		commands = _SplitCommands(buffer)
+		if commands is not None:
+			yield from _Relocate(commands, startLine)
+			buffer = None
+
+	if buffer is not None:
+		raise Exception(f"Incomplete command starting at line {startLine}: missing closing brace, bracket or quote.")
+
+
+#: A Tcl variable reference: ``$name``, ``$::namespace::name`` or ``${name}``.
+_VARIABLE = re_compile(r"\$(?:\{([^}]*)\}|((?:::)?\w+(?:::\w+)*))")
+
+
+def _Substitute(word: str, variables: Dict[str, str]) -> str:
+	"""
+	Substitute variable references in a word.
+
+	Fully qualified names like ``::osvvm::ToolName`` are looked up without the leading ``::``.
+
+	:arg word:      A bare or double-quoted Tcl word.
+	:arg variables: Values by variable name.
+	:returns:       The word with all variable references replaced.
+	:raises KeyError: If a variable isn't defined.
+	"""
+	if "$" not in word:
+		return word
+
+	return _VARIABLE.sub(lambda match: variables[(match[1] if match[1] is not None else match[2]).lstrip(":")], word)
+
+
+def _Number(value: Any) -> Union[int, float, None]:
+	"""Convert an operand of an expression to a number or return ``None``, if it isn't numeric."""
+	if isinstance(value, (bool, int, float)):
+		return value
+	try:
+		return int(value)
+	except ValueError:
+		try:
+			return float(value)
+		except ValueError:
+			return None
+
+
+def _Truth(value: Any) -> bool:
+	"""Convert an operand of an expression to a boolean using the Tcl rules."""
+	if isinstance(value, bool):
+		return value
+
+	number = _Number(value)
+	if number is not None:
+		return number != 0
+
+	lowered = value.lower()
+	if lowered in ("true", "yes", "on"):
+		return True
+	elif lowered in ("false", "no", "off"):
+		return False
+
+	raise Exception(f"Expected a boolean value, but got '{value}'.")
+
+
+#: A token of a Tcl expression: a number, a double-quoted string, a braced string, a variable reference, an operator or a
+#: bare word.
+_EXPRESSION_TOKEN = re_compile(
+	r'\s*(?:(\d+(?:\.\d*)?)|"([^"]*)"|\{([^}]*)\}|(\$(?:\{[^}]*\}|(?:::)?\w+(?:::\w+)*))|(&&|\|\||==|!=|<=|>=|<|>|!|\(|\)|\beq\b|\bne\b)|(\w+))'
+)
+
+#: Comparison operators of Tcl expressions. ``eq`` and ``ne`` always compare strings.
+_COMPARISONS = {
+	"==": operator_eq,
+	"!=": operator_ne,
+	"<":  operator_lt,
+	"<=": operator_le,
+	">":  operator_gt,
+	">=": operator_ge,
+}
+
+
+class _Expression(metaclass=ExtendedType, slots=True):
+	"""
+	A Tcl expression as used in conditions of ``if`` commands.
+
+	Only the subset used in OSVVM scripts is supported: numbers, strings, variable references, comparisons (``==``,
+	``!=``, ``<``, ``<=``, ``>``, ``>=``, ``eq``, ``ne``), logical operators (``!``, ``&&``, ``||``) and parentheses.
+	Command substitution (``[...]``) isn't supported. Nothing is executed, so evaluating an untrusted script is safe.
+
+	:arg text:      Source text of the expression.
+	:arg variables: Values by variable name.
+	:raises KeyError: If a referenced variable isn't defined.
+	"""
+
+	_text:   str
+	_tokens: List[Tuple[bool, Any]]  #: ``(isOperator, value)`` tuples.
+	_index:  int
+
+	def __init__(self, text: str, variables: Dict[str, str]):
+		self._text = text
+		self._tokens = []
+		self._index = 0
+
+		text = text.strip()
+		position = 0
+		while position < len(text):
+			match = _EXPRESSION_TOKEN.match(text, position)
+			if match is None:
+				raise Exception(f"Unsupported expression '{self._text}'.")
+			position = match.end()
+
+			number, quoted, braced, variable, operator, word = match.groups()
+			if operator is not None:
+				self._tokens.append((True, operator))
+			elif variable is not None:
+				self._tokens.append((False, _Substitute(variable, variables)))
+			elif quoted is not None:
+				self._tokens.append((False, _Substitute(quoted, variables)))
+			elif braced is not None:
+				self._tokens.append((False, braced))
+			else:
+				self._tokens.append((False, number if number is not None else word))
+
+	def Evaluate(self) -> bool:
+		"""
+		Evaluate the expression.
+
+		:returns: The truth value of the expression.
+		"""
+		self._index = 0
+		value = self._Or()
+		if self._index != len(self._tokens):
+			raise Exception(f"Unexpected token in expression '{self._text}'.")
+
+		return _Truth(value)
+
+	def _Accept(self, operators: Tuple[str, ...]) -> Nullable[str]:
+		if self._index < len(self._tokens):
+			isOperator, value = self._tokens[self._index]
+			if isOperator and value in operators:
+				self._index += 1
+				return value
+		return None
+
+	def _Or(self) -> Any:
+		left = self._And()
+		while self._Accept(("||",)) is not None:
+			right = self._And()
+			left = _Truth(left) or _Truth(right)
+		return left
+
+	def _And(self) -> Any:
+		left = self._Equality()
+		while self._Accept(("&&",)) is not None:
+			right = self._Equality()
+			left = _Truth(left) and _Truth(right)
+		return left
+
+	def _Equality(self) -> Any:
+		left = self._Relational()
+		while (operator := self._Accept(("==", "!=", "eq", "ne"))) is not None:
+			right = self._Relational()
+			if operator == "eq":
+				left = str(left) == str(right)
+			elif operator == "ne":
+				left = str(left) != str(right)
+			else:
+				left = self._Compare(operator, left, right)
+		return left
+
+	def _Relational(self) -> Any:
+		left = self._Unary()
+		while (operator := self._Accept(("<", "<=", ">", ">="))) is not None:
+			left = self._Compare(operator, left, self._Unary())
+		return left
+
+	def _Unary(self) -> Any:
+		if self._Accept(("!",)) is not None:
+			return not _Truth(self._Unary())
+		return self._Primary()
+
+	def _Primary(self) -> Any:
+		if self._Accept(("(",)) is not None:
+			value = self._Or()
+			if self._Accept((")",)) is None:
+				raise Exception(f"Missing closing parenthesis in expression '{self._text}'.")
+			return value
+
+		if self._index == len(self._tokens) or self._tokens[self._index][0]:
+			raise Exception(f"Missing operand in expression '{self._text}'.")
+
+		value = self._tokens[self._index][1]
+		self._index += 1
+		return value
+
+	@staticmethod
+	def _Compare(operator: str, left: Any, right: Any) -> bool:
+		"""Compare numerically, if both operands are numeric, otherwise compare strings."""
+		leftNumber = _Number(left)
+		rightNumber = _Number(right)
+		if leftNumber is not None and rightNumber is not None:
+			return _COMPARISONS[operator](leftNumber, rightNumber)
+		return _COMPARISONS[operator](str(left), str(right))
+
+
+def _IncludeFile(workingDirectory: Path, name: str) -> Path:
+	"""
+	Return the path of the project file included by ``include`` or ``build``.
+
+	If the included path is a directory, OSVVM loads ``build.pro`` or ``<directory name>.pro`` from that directory.
+
+	:arg workingDirectory: Directory of the including file.
+	:arg name:             Parameter of the command.
+	:returns:              Path of the included file relative to the working directory.
+	"""
+	includeFile = Path(name)
+	directory = workingDirectory / includeFile
+	if directory.is_dir():
+		for candidate in ("build.pro", f"{directory.resolve().name}.pro"):
+			if (directory / candidate).is_file():
+				return includeFile / candidate
+		return includeFile / "build.pro"
+
+	return includeFile
+
+
+def _Includes(workingDirectory: Path, commands: Iterable[Tuple[int, List[str]]]) -> Generator[Path, None, None]:
+	"""
+	Find the resolved paths of all project files included by a list of commands.
+
+	Includes in the bodies of ``if`` commands are found regardless of the condition. Includes with a variable reference or
+	command substitution in their path are skipped. This is only used for reading files ahead of time, so the result may
+	contain more or less files than actually included.
+	"""
+	for _, words in commands:
+		command = words[0]
+		if command == "include" or command == "build":
+			if len(words) > 1 and "$" not in words[1] and "[" not in words[1]:
+				yield (workingDirectory / _IncludeFile(workingDirectory, words[1])).resolve()
+		elif command == "if":
+			for word in words[2:]:
+				if word.__class__ is _Braced and (body := _SplitCommands(word)) is not None:
+					yield from _Includes(workingDirectory, body)
+
+
+def _Discover(path: Path) -> Tuple[Commands, List[Path]]:
+	"""
+	Read and tokenize an OSVVM project file and resolve the paths of all files it includes.
+
+	:arg path: Resolved path of the project file.
+	:returns:  Tokenized commands and resolved paths of included files.
+	"""
+	with path.open("r") as file:
+		commands = list(_Tokenize(file))
+
+	return commands, list(_Includes(path.parent, commands))
+
+
+def _Prefetch(path: Path, maxWorkers: Nullable[int] = None) -> Dict[Path, Commands]:
+	"""
+	Discover the include graph of an OSVVM project file and tokenize all reachable files concurrently.
+
+	Each file is submitted to a thread pool as soon as an include of it was found, so reading the files of one directory
+	level overlaps with reading the next level. Files, which can't be read, are left out. Reading them again while the
+	model is built reports the error at the include.
+
+	:arg path:       Resolved path of the top-level project file.
+	:arg maxWorkers: Maximum number of worker threads.
+	:returns:        Tokenized commands by resolved path.
+	"""
+	results: Dict[Path, Commands] = {}
+	with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+		pending = {executor.submit(_Discover, path): path}
+		submitted = {path}
+		while len(pending) > 0:
+			done, _ = wait(pending, return_when=FIRST_COMPLETED)
+			for future in done:
+				filePath = pending.pop(future)
+				try:
+					commands, includes = future.result()
+				except Exception:
+					continue
+
+				results[filePath] = commands
+				for includePath in includes:
+					if includePath not in submitted:
+						submitted.add(includePath)
+						pending[executor.submit(_Discover, includePath)] = includePath
+
+	return results
+
+
+@export
+class Testcase(metaclass=ExtendedType, slots=True):
+	"""
+	A simulation of an OSVVM testbench, started by ``simulate`` or ``RunTest``.
+
+	:arg name:        Name of the testcase. It's the name of the simulated design unit unless set by ``TestName``.
+	:arg toplevel:    Name of the simulated design unit.
+	:arg vhdlLibrary: VHDL library containing the simulated design unit.
+	:arg file:        Source file analyzed by ``RunTest``.
+	"""
+
+	_name:        str
+	_toplevel:    str
+	_vhdlLibrary: Nullable[VHDLLibrary]
+	_file:        Nullable[VHDLSourceFile]
+
+	def __init__(self, name: str, toplevel: str, vhdlLibrary: Nullable[VHDLLibrary] = None, file: Nullable[VHDLSourceFile] = None):
+		self._name = name
+		self._toplevel = toplevel
+		self._vhdlLibrary = vhdlLibrary
+		self._file = file
+
+	@property
+	def Name(self) -> str:
+		return self._name
+
+	@property
+	def Toplevel(self) -> str:
+		return self._toplevel
+
+	@property
+	def VHDLLibrary(self) -> Nullable[VHDLLibrary]:
+		return self._vhdlLibrary
+
+	@property
+	def File(self) -> Nullable[VHDLSourceFile]:
+		return self._file
+
+
+@export
+class Testsuite(metaclass=ExtendedType, slots=True):
+	"""
+	A group of testcases, started by ``TestSuite``.
+
+	:arg name: Name of the testsuite.
+	"""
+
+	_name:      str
+	_testcases: Dict[str, Testcase]
+
+	def __init__(self, name: str):
+		self._name = name
+		self._testcases = {}
+
+	@property
+	def Name(self) -> str:
+		return self._name
+
+	@property
+	def Testcases(self) -> Dict[str, Testcase]:
+		"""Read-only property returning the testcases by name in the order they were added."""
+		return self._testcases
+
+	def AddTestcase(self, testcase: Testcase) -> None:
+		self._testcases[testcase.Name] = testcase
+
+
+@export
+class OSVVMProject(Project):
+	"""
+	An OSVVM project including the include graph of its project files and the testsuites defined by them.
+
+	:arg name:          The project's name.
+	:arg rootDirectory: Base-path to the project.
+	"""
+
+	_includeGraph: Dict[Path, List[Path]]
+	_testsuites:   Dict[str, Testsuite]
+
+	def __init__(self, name: str, rootDirectory: Path = Path(".")):
+		super().__init__(name, rootDirectory=rootDirectory)
+		self._includeGraph = {}
+		self._testsuites = {}
+
+	@property
+	def IncludeGraph(self) -> Dict[Path, List[Path]]:
+		"""
+		Read-only property returning the include graph: the resolved paths of included files by resolved path of the including
+		file, in load order. A file included by multiple files (diamond include) is a single node with multiple incoming edges.
+		"""
+		return self._includeGraph
+
+	@property
+	def Testsuites(self) -> Dict[str, Testsuite]:
+		"""Read-only property returning the testsuites by name in the order they were defined."""
+		return self._testsuites
 
 
 @export
 class OSVVMProjectFile(ProjectFile, TCLContent):
-	"""An OSVVM project file (``*.pro``)."""
+	"""
+	An OSVVM project file (``*.pro``).
 
-	_osvvmProject: Nullable[Project]
+	OSVVM project files are Tcl scripts. Instead of executing them in a Tcl interpreter, the commonly used subset of
+	commands is evaluated: ``library``, ``analyze``, ``include``, ``build``, ``SetVHDLVersion``, ``TestSuite``,
+	``TestName``, ``RunTest``, ``simulate``, ``set`` and ``if``/``elseif``/``else``. Variable references are substituted
+	in bare and double-quoted words. Other commands are skipped and reported as diagnostics.
+	"""
+
+	_osvvmProject: Nullable[OSVVMProject]
+
+	#: Predefined variables. OSVVM's default VHDL version is VHDL-2008.
+	VARIABLES = {
+		"osvvm::VhdlVersion": "2008",
+	}
 
 	def __init__(
 		self,
@@ -55,138 +641,480 @@ class OSVVMProjectFile(ProjectFile, TCLContent):
 		self._osvvmProject = None
 
 	@property
-	def ProjectModel(self) -> Project:
+	def ProjectModel(self) -> OSVVMProject:
 		return self._osvvmProject
 
 	class Instruction:
 		_line: int
 
-		def __init__(self, line: int):
-			self._line = line
+		#: If false, the parameters are passed without variable substitution.
+		SUBSTITUTE = True
 
-	class Empty(Instruction):
 		def __init__(self, line: int):
-			super().__init__(line)
-
-	class Comment(Instruction):
-		_commentText: str
-
-		def __init__(self, line: int, commentText: str):
-			super().__init__(line)
-			self._commentText = commentText.rstrip()
+			self._line = line
 
 		@property
-		def CommentText(self) -> str:
-			return self._commentText
+		def Line(self) -> int:
+			return self._line
 
 	class Analyze(Instruction):
 		_vhdlSourceFile: VHDLSourceFile
 
-		def __init__(self, line: int, parameterText: str):
+		def __init__(self, line: int, workingDirectory: Path, parameters: List[str]):
 			super().__init__(line)
-			self._vhdlSourceFile = VHDLSourceFile(Path(parameterText.strip()))
+			self._vhdlSourceFile = VHDLSourceFile(Path(parameters[0]))
 
 		@property
 		def VHDLSourceFile(self) -> VHDLSourceFile:
 			return self._vhdlSourceFile
 
+	class RunTest(Analyze):
+		"""``RunTest`` analyzes a file and simulates the design unit named like the file."""
+
+		@property
+		def Toplevel(self) -> str:
+			return self._vhdlSourceFile.Path.stem
+
 	class Library(Instruction):
-		_vhdlLibrary: VHDLLibrary
+		_name: str
 
-		def __init__(self, line: int, parameterText: str):
+		def __init__(self, line: int, workingDirectory: Path, parameters: List[str]):
 			super().__init__(line)
-			self._vhdlLibrary = VHDLLibrary(parameterText.strip())
+			self._name = parameters[0]
 
 		@property
-		def VHDLLibrary(self) -> VHDLLibrary:
-			return self._vhdlLibrary
+		def Name(self) -> str:
+			return self._name
 
 	class Include(Instruction):
-		_osvvmProjectFile: 'OSVVMProjectFile'
+		_includePath:      Path
+		_osvvmProjectFile: Nullable['OSVVMProjectFile']
 		_fileSet:          FileSet
 
-		def __init__(self, line: int, workingDirectory: Path, parameterText: str):
+		def __init__(self, line: int, workingDirectory: Path, parameters: List[str]):
 			super().__init__(line)
 
-			includeFile = Path(parameterText.strip())
-			includePath = (workingDirectory / includeFile).resolve()
-
+			includeFile = _IncludeFile(workingDirectory, parameters[0])
+			self._includePath = (workingDirectory / includeFile).resolve()
+			self._osvvmProjectFile = None
 			self._fileSet = FileSet(includeFile.name, directory=includeFile.parent)
-			self._osvvmProjectFile = OSVVMProjectFile(includePath)
+
+		@property
+		def IncludePath(self) -> Path:
+			"""Read-only property returning the resolved path of the included file."""
+			return self._includePath
 
 		@property
 		def OSVVMProjectFile(self) -> 'OSVVMProjectFile':
+			"""Read-only property returning the included project file. The object is created on first access."""
+			if self._osvvmProjectFile is None:
+				self._osvvmProjectFile = OSVVMProjectFile(self._includePath)
 			return self._osvvmProjectFile
 
-		def Parse(self, fileSet: FileSet):
-			self._fileSet.Parent = fileSet
+		@property
+		def FileSet(self) -> FileSet:
+			return self._fileSet
+
+	class Build(Include):
+		"""``build`` starts a new build in OSVVM. In the project model, it's applied like an ``include``."""
+
+	class SetVHDLVersion(Instruction):
+		_version:     str
+		_vhdlVersion: Nullable[VHDLVersion]
+
+		def __init__(self, line: int, workingDirectory: Path, parameters: List[str]):
+			super().__init__(line)
+			self._version = parameters[0]
+			self._vhdlVersion = VHDLVersion.Parse(parameters[0])
+
+		@property
+		def Version(self) -> str:
+			"""Read-only property returning the version as written in the project file."""
+			return self._version
+
+		@property
+		def VHDLVersion(self) -> Nullable[VHDLVersion]:
+			"""Read-only property returning the parsed VHDL version or ``None``, if it's unknown."""
+			return self._vhdlVersion
+
+	class TestSuite(Library):
+		pass
+
+	class TestName(Library):
+		pass
+
+	class Simulate(Library):
+		pass
+
+	class Set(Instruction):
+		_name:  str
+		_value: Nullable[str]
+
+		def __init__(self, line: int, workingDirectory: Path, parameters: List[str]):
+			super().__init__(line)
+			self._name = parameters[0].lstrip(":")
+			self._value = parameters[1] if len(parameters) > 1 else None
+
+		@property
+		def Name(self) -> str:
+			"""Read-only property returning the variable name without a leading ``::``."""
+			return self._name
+
+		@property
+		def Value(self) -> Nullable[str]:
+			"""Read-only property returning the assigned value or ``None``, if the variable is only read."""
+			return self._value
+
+	class If(Instruction):
+		_words: List[str]
+
+		SUBSTITUTE = False
+
+		def __init__(self, line: int, workingDirectory: Path, parameters: List[str]):
+			super().__init__(line)
+			self._words = parameters
+
+		@property
+		def Words(self) -> List[str]:
+			"""Read-only property returning the conditions, bodies and keywords following ``if``."""
+			return self._words
+
+	#: Instruction classes by command name.
+	COMMANDS = {
+		"analyze":        Analyze,
+		"library":        Library,
+		"include":        Include,
+		"build":          Build,
+		"SetVHDLVersion": SetVHDLVersion,
+		"TestSuite":      TestSuite,
+		"TestName":       TestName,
+		"RunTest":        RunTest,
+		"simulate":       Simulate,
+		"set":            Set,
+		"if":             If,
+	}
+
+	def Parse(
+		self,
+		cache: Nullable[ParseCache] = None,
+		diagnostics: Nullable[DiagnosticSink] = None,
+		concurrent: bool = False,
+		maxWorkers: Nullable[int] = None,
+		variables: Nullable[Dict[str, str]] = None
+	):
+		"""
+		Parse the OSVVM project file and all included files, then create a project model.
+
+		By default, included files are read one after another, when their ``include`` command is applied. In concurrent
+		mode, the include graph is discovered up front and all reachable files are read and tokenized by a thread pool.
+		Then, the model is built from the tokenized files in the same deterministic order as in sequential mode. This hides
+		the latency of opening and reading many small files, e.g. on network filesystems.
 
-			for instruction in self._osvvmProjectFile._Parse():
-				if isinstance(instruction, OSVVMProjectFile.Include):
-					instruction.Parse(self._fileSet)
-				elif isinstance(instruction, OSVVMProjectFile.Analyze):
-					self._fileSet.AddFile(instruction.VHDLSourceFile)
-				elif isinstance(instruction, OSVVMProjectFile.Library):
-					self._fileSet.Design.AddVHDLLibrary(instruction.VHDLLibrary)
-#				elif isinstance(instruction, OSVVMProjectFile.Build):
+		Each file is loaded at most once. If a file is included again, e.g. by two testbench scripts, its files aren't added a
+		second time. The project's :attr:`~OSVVMProject.IncludeGraph` records all includes. Cyclic includes raise an
+		exception.
 
-				elif not isinstance(instruction, (OSVVMProjectFile.Empty, OSVVMProjectFile.Comment)):
-					raise Exception(f"Unknown instruction '{instruction.__class__.__name__}' in OSVVM project file '{self._osvvmProjectFile.ResolvedPath}'")
+		:arg cache:       Optional parse cache. If it holds a valid entry for this file and none of the included files
+		                  changed, the model is loaded from cache. The cache isn't used, if ``variables`` are given.
+		:arg diagnostics: Optional callable receiving a :class:`Diagnostic` for each command, which isn't supported.
+		                  Diagnostics aren't emitted, if the model is loaded from cache.
+		:arg concurrent:  If true, read and tokenize all included files concurrently.
+		:arg maxWorkers:  Maximum number of worker threads in concurrent mode.
+		:arg variables:   Optional Tcl variables by name, e.g. ``{"osvvm::ToolName": "GHDL"}``. They extend and override
+		                  :attr:`VARIABLES`.
+		"""
+		if variables is not None:
+			cache = None
+		elif cache is not None and (project := cache.Load(self)) is not None:
+			self._osvvmProject = project
+			return
 
-	def Parse(self):
-		projectName = self._path.name
-		self._osvvmProject = Project(projectName, rootDirectory=self._path.parent)
+		initialVariables = dict(self.VARIABLES)
+		if variables is not None:
+			initialVariables.update((name.lstrip(":"), value) for name, value in variables.items())
 
-		fileSet = self._osvvmProject.DefaultDesign.DefaultFileSet
+		path = self.ResolvedPath.resolve()
+		prefetched = _Prefetch(path, maxWorkers) if concurrent else {}
 
-		for instruction in self._Parse():
-			if isinstance(instruction, OSVVMProjectFile.Include):
-				instruction.Parse(fileSet)
-			elif isinstance(instruction, OSVVMProjectFile.Analyze):
-				fileSet.AddFile(instruction.VHDLSourceFile)
-			elif not isinstance(instruction, (OSVVMProjectFile.Empty, OSVVMProjectFile.Comment)):
-				raise Exception(f"Unknown instruction '{instruction.__class__.__name__}' in OSVVM project file '{self.ResolvedPath}'")
+		# A cache entry is keyed by the content, which was parsed. So read the top-level file once and tokenize it from memory.
+		content = None
+		if cache is not None:
+			try:
+				content = path.read_bytes()
+			except FileNotFoundError as ex:
+				raise Exception(f"OSVVM project file '{path}' not found.") from ex
 
-	def _Parse(self):
+			with TextIOWrapper(BytesIO(content)) as file:
+				prefetched[path] = list(_Tokenize(file))
+
+		self._osvvmProject = OSVVMProject(self._path.name, rootDirectory=self._path.parent)
+		context = _Context(self._osvvmProject, diagnostics, prefetched, initialVariables)
+		context.Load(self, self._osvvmProject.DefaultDesign.DefaultFileSet)
+
+		if cache is not None:
+			cache.Store(self, self._osvvmProject, context.IncludedFiles, content=content)
+
+	def _Parse(
+		self,
+		diagnostics: Nullable[DiagnosticSink] = None,
+		commands: Nullable[Commands] = None,
+		variables: Nullable[Dict[str, str]] = None
+	) -> Generator[Instruction, None, None]:
+		"""
+		Generator returning the instructions of this file while it's read.
+
+		:arg diagnostics: Optional callable receiving a :class:`Diagnostic` for each command, which isn't supported.
+		:arg commands:    Already tokenized commands of this file. If ``None``, the file is read.
+		:arg variables:   Variables for substitution. They are looked up, when an instruction is created, so the generator
+		                  sees assignments made while the previous instructions were applied. If ``None``, parameters are
+		                  passed as written.
+		:returns:         A generator of instructions.
+		"""
 		path = self.ResolvedPath
-		if not path.exists():
-			raise Exception(f"OSVVM project file '{path}' not found.") from FileNotFoundError(f"File '{path}' not found.")
-
-		instructions: List = []
-		print()
-		with path.open("r") as file:
-			i = 1
-			for line in file:
-				line = line.lstrip()
-
-				if line.startswith("#"):
-					comment = OSVVMProjectFile.Comment(i, line[1:])
-					instructions.append(comment)
-
-				elif line.startswith("analyze"):
-					vhdlFile = OSVVMProjectFile.Analyze(i, line[8:])
-					instructions.append(vhdlFile)
-
-				elif line.startswith("library"):
-					vhdlLibrary = OSVVMProjectFile.Library(i, line[8:])
-					instructions.append(vhdlLibrary)
-
-				elif line.startswith("include"):
-					include = OSVVMProjectFile.Include(i, path.parent, line[8:])
-					instructions.append(include)
-
-				elif line.startswith("build"):
-					parameter = line[6:]
-					print(f"BUILD: {parameter}")
-				elif line.startswith("if"):
-					print(f"IF (line={i}): {line[3:].rstrip()}")
-				elif line.startswith("}"):
-					print(f"}} (line={i}): {line[2:].rstrip()}")
-				elif len(line) == 0:
-					instructions.append(OSVVMProjectFile.Empty(i))
-				else:
-					print(f"UNKNOWN (line={i}): '{line.rstrip()}'")
+		if commands is not None:
+			yield from self._Instructions(path, commands, diagnostics, variables)
+			return
+
+		try:
+			file = path.open("r")
+		except FileNotFoundError as ex:
+			raise Exception(f"OSVVM project file '{path}' not found.") from ex
+
+		with file:
+			yield from self._Instructions(path, _Tokenize(file), diagnostics, variables)
+
+	def _Instructions(
+		self,
+		path: Path,
+		commands: Iterable[Tuple[int, List[str]]],
+		diagnostics: Nullable[DiagnosticSink],
+		variables: Nullable[Dict[str, str]] = None
+	) -> Generator[Instruction, None, None]:
+		instructionClasses = self.COMMANDS
+		workingDirectory = path.parent
+		for line, words in commands:
+			instructionClass = instructionClasses.get(words[0])
+			if instructionClass is None:
+				if diagnostics is not None:
+					diagnostics(Diagnostic(DiagnosticSeverity.Warning, path, line, f"Unsupported command '{words[0]}'."))
+				continue
+			elif len(words) < 2:
+				raise Exception(f"Missing parameter for command '{words[0]}' in OSVVM project file '{path}' at line {line}.")
+
+			parameters = words[1:]
+			if variables is not None and instructionClass.SUBSTITUTE:
+				try:
+					parameters = [word if word.__class__ is _Braced else _Substitute(word, variables) for word in parameters]
+				except KeyError as ex:
+					if diagnostics is not None:
+						diagnostics(Diagnostic(DiagnosticSeverity.Warning, path, line, f"Variable '{ex.args[0]}' isn't defined. Skipped command '{words[0]}'."))
+					continue
+
+				if any("[" in word for word in parameters if word.__class__ is not _Braced):
+					if diagnostics is not None:
+						diagnostics(Diagnostic(DiagnosticSeverity.Warning, path, line, f"Command substitution isn't supported. Skipped command '{words[0]}'."))
+					continue
+
+			yield instructionClass(line, workingDirectory, parameters)
+
+
+class _Context(metaclass=ExtendedType, slots=True):
+	"""
+	State of loading an OSVVM project: variables, the current VHDL library, version and testsuite, the chain of open
+	includes and all files loaded so far.
+
+	Each file is loaded at most once. Including an already loaded file again (e.g. a library script included by two
+	testbench scripts) doesn't add its files a second time. It only restores the VHDL library selected at the end of
+	that file. Including a file, which is still open, raises an exception showing the include chain.
+	"""
+
+	_project:       'OSVVMProject'
+	_diagnostics:   Nullable[DiagnosticSink]
+	_prefetched:    Dict[Path, Commands]
+	_variables:     Dict[str, str]
+	_vhdlLibrary:   Nullable[VHDLLibrary]
+	_vhdlVersion:   Nullable[VHDLVersion]
+	_testsuite:     Nullable[Testsuite]
+	_testName:      Nullable[str]
+	_stack:         List[Tuple[Path, int, OSVVMProjectFile]]
+	_loaded:        Dict[Path, Tuple[FileSet, Nullable[VHDLLibrary]]]
+
+	def __init__(self, project: 'OSVVMProject', diagnostics: Nullable[DiagnosticSink], prefetched: Dict[Path, Commands], variables: Dict[str, str]):
+		self._project = project
+		self._diagnostics = diagnostics
+		self._prefetched = prefetched
+		self._variables = variables
+		self._vhdlLibrary = None
+		self._vhdlVersion = None
+		self._testsuite = None
+		self._testName = None
+		self._stack = []
+		self._loaded = {}
+
+	@property
+	def IncludedFiles(self) -> List[Path]:
+		"""Read-only property returning the paths of all loaded files except the top-level file."""
+		return list(self._project._includeGraph.keys())[1:]
 
+	def Load(self, projectFile: OSVVMProjectFile, fileSet: FileSet) -> None:
+		"""Apply the instructions of a top-level project file to a fileset."""
+		self._Apply(projectFile.ResolvedPath.resolve(), projectFile, fileSet)
+
+	def _Apply(self, path: Path, projectFile: OSVVMProjectFile, fileSet: FileSet) -> None:
+		self._project._includeGraph[path] = []
+		self._stack.append((path, 0, projectFile))
+
+		handlers = self._HANDLERS
+		for instruction in projectFile._Parse(self._diagnostics, self._prefetched.get(path), self._variables):
+			handlers[instruction.__class__](self, instruction, fileSet)
+
+		self._stack.pop()
+		self._loaded[path] = (fileSet, self._vhdlLibrary)
+
+	def _Report(self, severity: DiagnosticSeverity, line: int, message: str) -> None:
+		if self._diagnostics is not None:
+			self._diagnostics(Diagnostic(severity, self._stack[-1][0], line, message))
+
+	def _Analyze(self, instruction: OSVVMProjectFile.Analyze, fileSet: FileSet) -> None:
+		file = instruction.VHDLSourceFile
+		fileSet.AddFile(file)
+		if self._vhdlLibrary is not None:
+			file.VHDLLibrary = self._vhdlLibrary
+		if self._vhdlVersion is not None:
+			file.VHDLVersion = self._vhdlVersion
+
+	def _RunTest(self, instruction: OSVVMProjectFile.RunTest, fileSet: FileSet) -> None:
+		self._Analyze(instruction, fileSet)
+		self._AddTestcase(instruction.Toplevel, instruction.VHDLSourceFile)
+
+	def _Simulate(self, instruction: OSVVMProjectFile.Simulate, fileSet: FileSet) -> None:
+		self._AddTestcase(instruction.Name)
+
+	def _AddTestcase(self, toplevel: str, file: Nullable[VHDLSourceFile] = None) -> None:
+		if self._testsuite is None:
+			self._testsuite = self._GetTestsuite("Default")
+
+		name = toplevel if self._testName is None else self._testName
+		self._testsuite.AddTestcase(Testcase(name, toplevel, self._vhdlLibrary, file))
+		self._testName = None
+
+	def _GetTestsuite(self, name: str) -> Testsuite:
+		testsuite = self._project._testsuites.get(name)
+		if testsuite is None:
+			testsuite = Testsuite(name)
+			self._project._testsuites[name] = testsuite
+		return testsuite
+
+	def _TestSuite(self, instruction: OSVVMProjectFile.TestSuite, fileSet: FileSet) -> None:
+		self._testsuite = self._GetTestsuite(instruction.Name)
+
+	def _TestName(self, instruction: OSVVMProjectFile.TestName, fileSet: FileSet) -> None:
+		self._testName = instruction.Name
+
+	def _SetVHDLVersion(self, instruction: OSVVMProjectFile.SetVHDLVersion, fileSet: FileSet) -> None:
+		if instruction.VHDLVersion is None:
+			raise Exception(f"Unknown VHDL version '{instruction.Version}' in OSVVM project file '{self._stack[-1][0]}' at line {instruction.Line}.")
+
+		self._vhdlVersion = instruction.VHDLVersion
+		# OSVVM stores the version as 4-digit year, so scripts can compare it numerically, e.g. '>= 2019'.
+		year = self._vhdlVersion.value
+		self._variables["osvvm::VhdlVersion"] = str(year + 1900 if year < 100 else year)
+
+	def _Set(self, instruction: OSVVMProjectFile.Set, fileSet: FileSet) -> None:
+		if instruction.Value is not None:
+			self._variables[instruction.Name] = instruction.Value
+
+	def _If(self, instruction: OSVVMProjectFile.If, fileSet: FileSet) -> None:
+		path, _, projectFile = self._stack[-1]
+		words = instruction.Words
+		count = len(words)
+		i = 0
+		while True:
+			condition = words[i]
+			i += 1
+			if i < count and words[i] == "then":
+				i += 1
+			if i >= count:
+				raise Exception(f"Malformed 'if' command in OSVVM project file '{path}' at line {instruction.Line}.")
+
+			body = words[i]
+			i += 1
+
+			if "[" in condition:
+				self._Report(DiagnosticSeverity.Warning, instruction.Line, "Command substitution isn't supported. Skipped command 'if'.")
+				return
+
+			try:
+				result = _Expression(condition, self._variables).Evaluate()
+			except KeyError as ex:
+				self._Report(DiagnosticSeverity.Warning, instruction.Line, f"Variable '{ex.args[0]}' isn't defined. Skipped command 'if'.")
+				return
+			except Exception as ex:
+				raise Exception(f"Can't evaluate condition '{condition}' in OSVVM project file '{path}' at line {instruction.Line}.") from ex
+
+			if result:
+				break
+			elif i == count:
+				return
+			elif words[i] == "elseif" and i + 1 < count:
 				i += 1
+			elif words[i] == "else" and i + 2 == count:
+				body = words[i + 1]
+				break
+			elif i + 1 == count:
+				body = words[i]
+				break
+			else:
+				raise Exception(f"Malformed 'if' command in OSVVM project file '{path}' at line {instruction.Line}.")
+
+		bodyLine = body.Line if body.__class__ is _Braced else instruction.Line
+		commands = _SplitCommands(body)
+		if commands is None:
+			raise Exception(f"Incomplete command in 'if' body in OSVVM project file '{path}' at line {bodyLine}.")
+
+		handlers = self._HANDLERS
+		for bodyInstruction in projectFile._Instructions(path, _Relocate(commands, bodyLine), self._diagnostics, self._variables):
+			handlers[bodyInstruction.__class__](self, bodyInstruction, fileSet)
+
+	def _Library(self, instruction: OSVVMProjectFile.Library, fileSet: FileSet) -> None:
+		design = self._project.DefaultDesign
+		self._vhdlLibrary = design.VHDLLibraries.get(instruction.Name)
+		if self._vhdlLibrary is None:
+			self._vhdlLibrary = VHDLLibrary(instruction.Name, design=design)
+
+	def _Include(self, instruction: OSVVMProjectFile.Include, fileSet: FileSet) -> None:
+		path = instruction.IncludePath
+		includingPath, _, includingFile = self._stack[-1]
+		self._stack[-1] = (includingPath, instruction.Line, includingFile)
+		self._project._includeGraph[includingPath].append(path)
+
+		if any(openPath == path for openPath, _, _ in self._stack):
+			chain = " -> ".join(f"{openPath!s}:{line}" for openPath, line, _ in self._stack)
+			raise Exception(f"Include cycle in OSVVM project files: {chain} -> {path!s}")
+
+		loaded = self._loaded.get(path)
+		if loaded is not None:
+			loadedFileSet, self._vhdlLibrary = loaded
+			self._Report(DiagnosticSeverity.Info, instruction.Line, f"File '{path!s}' was already loaded into fileset '{loadedFileSet.Name}'.")
+			return
+
+		includedFileSet = instruction.FileSet
+		if includedFileSet.Name in fileSet.FileSets:
+			# e.g. 'build.pro' of two sub-directories
+			includedFileSet.Name = (includedFileSet.Directory / includedFileSet.Name).as_posix()
+		includedFileSet.Parent = fileSet
+		self._Apply(path, instruction.OSVVMProjectFile, includedFileSet)
 
-		return instructions
+	_HANDLERS = {
+		OSVVMProjectFile.Analyze:        _Analyze,
+		OSVVMProjectFile.RunTest:        _RunTest,
+		OSVVMProjectFile.Library:        _Library,
+		OSVVMProjectFile.Include:        _Include,
+		OSVVMProjectFile.Build:          _Include,
+		OSVVMProjectFile.SetVHDLVersion: _SetVHDLVersion,
+		OSVVMProjectFile.TestSuite:      _TestSuite,
+		OSVVMProjectFile.TestName:       _TestName,
+		OSVVMProjectFile.Simulate:       _Simulate,
+		OSVVMProjectFile.Set:            _Set,
+		OSVVMProjectFile.If:             _If,
+	}
@@ -0,0 +1,351 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2022 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""A lightweight scanner for dependencies between VHDL source files."""
+from concurrent.futures import ProcessPoolExecutor
+from enum     import Enum
+from hashlib  import sha256
+from os       import getpid, replace as os_replace
+from pathlib  import Path
+from pickle   import dump as pickle_dump, load as pickle_load, HIGHEST_PROTOCOL
+from re       import compile as re_compile, DOTALL, VERBOSE
+from typing   import Dict, List, NamedTuple, Optional as Nullable, Tuple
+
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+
+from pyEDAA.ProjectModel import __version__, Design, VHDLSourceFile
+
+
+@export
+class DesignUnitKind(Enum):
+	"""Kind of a :class:`DesignUnit`."""
+
+	Entity =        0
+	Architecture =  1
+	Package =       2
+	PackageBody =   3
+	Configuration = 4
+	Context =       5
+
+
+@export
+class DesignUnit(NamedTuple):
+	"""A design unit declared in a VHDL source file. Names are lower case."""
+
+	Kind:  DesignUnitKind
+	Name:  str
+	Of:    Nullable[str]  #: Entity of an architecture or configuration, package of a package body.
+
+
+@export
+class ReferenceKind(Enum):
+	"""Kind of a :class:`Reference`."""
+
+	Use =           0  #: ``use lib.pkg.all;`` or a package instantiation ``package p is new lib.pkg``.
+	Context =       1  #: ``context lib.ctx;``
+	Entity =        2  #: ``inst: entity lib.e`` or ``use entity lib.e`` in a configuration.
+	Configuration = 3  #: ``inst: configuration lib.cfg`` or ``use configuration lib.cfg``.
+	Component =     4  #: ``inst: comp port map (...)``, bound to an entity of the same name.
+
+
+@export
+class Reference(NamedTuple):
+	"""A reference to a design unit. Names are lower case. ``Library`` is ``None`` for component instantiations."""
+
+	Kind:    ReferenceKind
+	Library: Nullable[str]
+	Name:    str
+
+
+@export
+class ScanResult(NamedTuple):
+	"""Library clauses, declared design units and references to other design units of a VHDL source file."""
+
+	Libraries:   Tuple[str, ...]
+	DesignUnits: Tuple[DesignUnit, ...]
+	References:  Tuple[Reference, ...]
+
+
+#: Comments, string literals and character literals. They are removed before scanning.
+_NOISE = re_compile(r"""--[^\n]*|/\*.*?\*/|"(?:[^"\n]|"")*"|(?<![\w)\]])'.'""", DOTALL)
+
+#: Clauses and declarations relevant for dependencies in lower case VHDL source text without comments and literals.
+_CLAUSES = re_compile(r"""
+	\b(?:
+		library\s+(?P<libraries>\w+(?:\s*,\s*\w+)*)\s*;
+	|	use\s+(?P<uses>[\w.\s,()]+?)\s*;
+	|	context\s+(?P<contexts>\w+\.\w+(?:\s*,\s*\w+\.\w+)*)\s*;
+	|	context\s+(?P<context>\w+)\s+is\b
+	|	entity\s+(?P<entity>\w+)\s+is\b
+	|	architecture\s+(?P<architecture>\w+)\s+of\s+(?P<architectureOf>\w+)\s+is\b
+	|	package\s+body\s+(?P<packageBody>\w+)\s+is\b
+	|	package\s+(?P<package>\w+)\s+is(?:\s+new\s+(?P<instantiated>\w+(?:\.\w+)+))?
+	|	configuration\s+(?P<configuration>\w+)\s+of\s+(?P<configurationOf>\w+)\s+is\b
+	)
+	|	:\s*(?:
+		entity\s+(?!is\b)(?P<entityInstance>\w+(?:\.\w+)?)
+	|	configuration\s+(?P<configurationInstance>\w+(?:\.\w+)?)
+	|	component\s+(?P<componentInstance>\w+)
+	|	(?P<instance>\w+)\s+(?:generic|port)\s+map\b
+	)
+""", VERBOSE)
+
+
+def _SelectedName(kind: ReferenceKind, name: str) -> Reference:
+	"""Split ``lib.unit`` or ``unit`` (implicitly ``work.unit``) into a reference."""
+	parts = name.split(".")
+	if len(parts) == 1:
+		return Reference(kind, "work", parts[0])
+	return Reference(kind, parts[0], parts[1])
+
+
+@export
+def ScanVHDL(content: bytes) -> ScanResult:
+	"""
+	Scan VHDL source code for library clauses, design unit declarations and references to other design units.
+
+	The source code isn't parsed, but matched by regular expressions after comments and literals were removed. This is
+	sufficient for a compile order, but not a validation of the source code.
+
+	:arg content: VHDL source code. It's decoded as ISO 8859-1 (see IEEE 1076).
+	:returns:     Declarations and references found in the source code.
+	"""
+	text = _NOISE.sub(" ", content.decode("latin-1").lower())
+
+	libraries = []
+	designUnits = []
+	references = []
+	for match in _CLAUSES.finditer(text):
+		kind = match.lastgroup
+		value = match[kind]
+		if kind == "libraries":
+			libraries.extend(name.strip() for name in value.split(","))
+		elif kind == "uses":
+			for name in value.split(","):
+				name = name.strip()
+				if name.startswith("entity"):
+					references.append(_SelectedName(ReferenceKind.Entity, name[6:].split("(")[0].strip()))
+				elif name.startswith("configuration"):
+					references.append(_SelectedName(ReferenceKind.Configuration, name[13:].strip()))
+				else:
+					parts = name.split(".")
+					if len(parts) > 1 and parts[1] != "all":
+						references.append(Reference(ReferenceKind.Use, parts[0], parts[1]))
+		elif kind == "contexts":
+			references.extend(_SelectedName(ReferenceKind.Context, name.strip()) for name in value.split(","))
+		elif kind == "context":
+			designUnits.append(DesignUnit(DesignUnitKind.Context, value, None))
+		elif kind == "entity":
+			designUnits.append(DesignUnit(DesignUnitKind.Entity, value, None))
+		elif kind == "architectureOf":
+			designUnits.append(DesignUnit(DesignUnitKind.Architecture, match["architecture"], value))
+		elif kind == "packageBody":
+			designUnits.append(DesignUnit(DesignUnitKind.PackageBody, value, value))
+		elif kind == "package" or kind == "instantiated":
+			designUnits.append(DesignUnit(DesignUnitKind.Package, match["package"], None))
+			if kind == "instantiated":
+				references.append(_SelectedName(ReferenceKind.Use, value))
+		elif kind == "configurationOf":
+			designUnits.append(DesignUnit(DesignUnitKind.Configuration, match["configuration"], value))
+		elif kind == "entityInstance":
+			references.append(_SelectedName(ReferenceKind.Entity, value))
+		elif kind == "configurationInstance":
+			references.append(_SelectedName(ReferenceKind.Configuration, value))
+		else:  # componentInstance, instance
+			references.append(Reference(ReferenceKind.Component, None, value))
+
+	return ScanResult(tuple(libraries), tuple(designUnits), tuple(references))
+
+
+def _ScanVHDL(path: str, content: bytes) -> ScanResult:
+	try:
+		return ScanVHDL(content)
+	except Exception as ex:
+		raise Exception(f"Couldn't scan VHDL source file '{path}'.") from ex
+
+
+#: Kinds of design units, which can be referenced from other design units.
+_PRIMARY_UNITS = {
+	DesignUnitKind.Entity:        ReferenceKind.Entity,
+	DesignUnitKind.Package:       ReferenceKind.Use,
+	DesignUnitKind.Configuration: ReferenceKind.Configuration,
+	DesignUnitKind.Context:       ReferenceKind.Context,
+}
+
+#: Kinds of primary units a secondary unit belongs to.
+_SECONDARY_UNITS = {
+	DesignUnitKind.Architecture:  ReferenceKind.Entity,
+	DesignUnitKind.PackageBody:   ReferenceKind.Use,
+	DesignUnitKind.Configuration: ReferenceKind.Entity,
+}
+
+
+@export
+class VHDLDependencyScanner(metaclass=ExtendedType, slots=True):
+	"""
+	Finds dependencies between the VHDL source files of a design and adds them to the design's file dependency graph.
+
+	Files are scanned by :func:`ScanVHDL` concurrently in a process pool. Results are memoized per content hash, so
+	unchanged files aren't scanned again by later calls. If a cache file is given, the results are persisted there, so
+	they are reused by later runs, too.
+
+	:arg cacheFile: Optional file persisting scan results between runs.
+	"""
+
+	_cacheFile: Nullable[Path]
+	_results:   Dict[str, ScanResult]
+	_modified:  bool
+
+	def __init__(self, cacheFile: Nullable[Path] = None):
+		self._cacheFile = cacheFile
+		self._results = {}
+		self._modified = False
+
+		if cacheFile is not None:
+			try:
+				with cacheFile.open("rb") as file:
+					version, results = pickle_load(file)
+				if version == __version__:
+					self._results = results
+			except Exception:
+				# missing, corrupted or incompatible cache file; it will be replaced by the next store
+				pass
+
+	@property
+	def CacheFile(self) -> Nullable[Path]:
+		"""Read-only property returning the file persisting scan results."""
+		return self._cacheFile
+
+	def Scan(self, design: Design, maxWorkers: Nullable[int] = None) -> Dict[VHDLSourceFile, ScanResult]:
+		"""
+		Scan all VHDL source files of a design and add the found dependencies to the design.
+
+		A file depends on the files declaring the packages and contexts it uses, the entities and configurations it
+		instantiates and the primary unit of its secondary units (e.g. the entity of an architecture). A component is bound
+		to the entity of the same name, preferably from the file's own VHDL library. References to design units not
+		declared in the design (e.g. ``ieee``) are ignored. Use :meth:`Design.CompileOrder` to get the files in compile
+		order.
+
+		:arg design:     The design to scan.
+		:arg maxWorkers: Maximum number of worker processes. If 1, all files are scanned in this process.
+		:returns:        Scan results by file.
+		"""
+		files = list(design.Files(VHDLSourceFile))
+		keys = []
+		pending: Dict[str, Tuple[str, bytes]] = {}
+		for file in files:
+			path = file.ResolvedPath
+			try:
+				content = path.read_bytes()
+			except OSError as ex:
+				raise Exception(f"VHDL source file '{path}' not found.") from ex
+
+			key = sha256(content).hexdigest()
+			keys.append(key)
+			if key not in self._results and key not in pending:
+				pending[key] = (str(path), content)
+
+		if len(pending) > 0:
+			pendingKeys = list(pending.keys())
+			paths, contents = zip(*pending.values())
+			if maxWorkers == 1 or len(pending) == 1:
+				results = map(_ScanVHDL, paths, contents)
+			else:
+				with ProcessPoolExecutor(max_workers=maxWorkers) as executor:
+					results = list(executor.map(_ScanVHDL, paths, contents, chunksize=64))
+
+			self._results.update(zip(pendingKeys, results))
+			self._modified = True
+			self._Store()
+
+		scanResults = {file: self._results[key] for file, key in zip(files, keys)}
+		self._AddDependencies(design, scanResults)
+		return scanResults
+
+	def _Store(self) -> None:
+		if self._cacheFile is None or not self._modified:
+			return
+
+		self._cacheFile.parent.mkdir(parents=True, exist_ok=True)
+		temporaryPath = self._cacheFile.with_name(f"{self._cacheFile.name}.{getpid()}.tmp")
+		try:
+			with temporaryPath.open("wb") as file:
+				pickle_dump((__version__, self._results), file, protocol=HIGHEST_PROTOCOL)
+			os_replace(temporaryPath, self._cacheFile)
+		finally:
+			temporaryPath.unlink(missing_ok=True)
+		self._modified = False
+
+	@staticmethod
+	def _LibraryName(file: VHDLSourceFile) -> str:
+		try:
+			return file.VHDLLibrary.Name.lower()
+		except Exception:
+			return "work"
+
+	@classmethod
+	def _AddDependencies(cls, design: Design, scanResults: Dict[VHDLSourceFile, ScanResult]) -> None:
+		libraryNames = {file: cls._LibraryName(file) for file in scanResults}
+
+		# index primary units by (reference kind, library, name); the first declaration wins
+		declarations: Dict[Tuple[ReferenceKind, str, str], VHDLSourceFile] = {}
+		entities: Dict[str, List[VHDLSourceFile]] = {}
+		for file, scanResult in scanResults.items():
+			for designUnit in scanResult.DesignUnits:
+				referenceKind = _PRIMARY_UNITS.get(designUnit.Kind)
+				if referenceKind is not None:
+					declarations.setdefault((referenceKind, libraryNames[file], designUnit.Name), file)
+				if designUnit.Kind is DesignUnitKind.Entity:
+					entities.setdefault(designUnit.Name, []).append(file)
+
+		for file, scanResult in scanResults.items():
+			libraryName = libraryNames[file]
+			for designUnit in scanResult.DesignUnits:
+				referenceKind = _SECONDARY_UNITS.get(designUnit.Kind)
+				if referenceKind is not None:
+					dependency = declarations.get((referenceKind, libraryName, designUnit.Of))
+					if dependency is not None:
+						design.AddFileDependency(file, dependency)
+
+			for reference in scanResult.References:
+				if reference.Kind is ReferenceKind.Component:
+					candidates = entities.get(reference.Name)
+					if candidates is None:
+						continue
+					dependency = next((candidate for candidate in candidates if libraryNames[candidate] == libraryName), candidates[0])
+				else:
+					library = libraryName if reference.Library == "work" else reference.Library
+					dependency = declarations.get((reference.Kind, library, reference.Name))
+					if dependency is None:
+						continue
+
+				design.AddFileDependency(file, dependency)
@@ -29,16 +29,256 @@
 # ==================================================================================================================== #
 #
 """Specific file types and attributes for Xilinx ISE."""
-from pyTooling.Decorators import export
+from pathlib           import Path
+from typing            import Dict, Iterable, List, Optional as Nullable, Type
+from xml.parsers       import expat
 
-from pyEDAA.ProjectModel import ConstraintFile, ProjectFile, HumanReadableContent
+from pyTooling.Decorators  import export
+from pyTooling.MetaClasses import ExtendedType
+from pyVHDLModel           import VHDLVersion
+
+from pyEDAA.ProjectModel       import Attribute, ConstraintFile, ProjectFile, XMLContent, HumanReadableContent, File, FileSet
+from pyEDAA.ProjectModel       import Design, Project, VHDLSourceFile, VerilogSourceFile, FileTypeRegistry
+from pyEDAA.ProjectModel.Cache import ParseCache
 
 
 @export
-class ISEProjectFile(ProjectFile):
-	pass
+class AssociationAttribute(Attribute):
+	"""The flows a file of an ISE project is associated with (e.g. ``Implementation`` or ``BehavioralSimulation``)."""
+
+	KEY = "Association"
+	VALUE_TYPE = Iterable[str]
 
 
 @export
 class UCFConstraintFile(ConstraintFile, HumanReadableContent):
-	pass
+	"""An ISE constraint file (User Constraints File; ``*.ucf``)."""
+
+
+#: File types of files in ISE projects by suffix. ISE-specific suffixes are only registered here, not in
+#: :attr:`FileType.FileSuffixes`.
+ISEFileTypes = FileTypeRegistry()
+ISEFileTypes.Register(UCFConstraintFile, (".ucf", ))
+
+
+@export
+class ISEProject(Project):
+	"""
+	An ISE project including its properties.
+
+	:arg name:          The project's name.
+	:arg rootDirectory: Base-path to the project.
+	"""
+
+	_properties: Dict[str, str]
+
+	def __init__(self, name: str, rootDirectory: Path = Path(".")):
+		super().__init__(name, rootDirectory=rootDirectory)
+		self._properties = {}
+
+	@property
+	def Properties(self) -> Dict[str, str]:
+		"""Read-only property returning the project's properties (``<property>``) by name."""
+		return self._properties
+
+	@property
+	def Device(self) -> Nullable[str]:
+		"""Read-only property returning the project's FPGA device."""
+		return self._properties.get("Device")
+
+	@property
+	def Family(self) -> Nullable[str]:
+		"""Read-only property returning the project's device family."""
+		return self._properties.get("Device Family")
+
+
+#: VHDL versions by value of property ``VHDL Source Analysis Standard``.
+_VHDL_VERSIONS = {
+	"VHDL-93":   VHDLVersion.VHDL93,
+	"VHDL-200X": VHDLVersion.VHDL2008,
+}
+
+
+class _XISEReader(metaclass=ExtendedType, slots=True):
+	"""
+	Builds the project model from a stream of element events of an ISE project file (``*.xise``).
+
+	A file is added to a fileset named after its association. Files associated with ``Implementation`` (and maybe also a
+	simulation) are added to fileset ``Implementation``, files only associated with a simulation to a fileset named after
+	that simulation (e.g. ``BehavioralSimulation``) and files without association to the design's default fileset. All
+	associations of a file are kept in :class:`AssociationAttribute`.
+	"""
+
+	_project:     ISEProject
+	_fileTypes:   Dict[str, Type[File]]
+	_fileSets:    Dict[str, FileSet]
+	_stack:       List[str]
+	_path:        Nullable[Path]
+	_fileType:    Nullable[Type[File]]
+	_association: List[str]
+	_library:     Nullable[str]
+
+	def __init__(self, project: ISEProject, fileTypes: Dict[str, Type[File]]):
+		self._project = project
+		self._fileTypes = fileTypes
+		self._fileSets = {}
+		self._stack = []
+		self._path = None
+		self._fileType = None
+		self._association = []
+		self._library = None
+
+	def StartElement(self, name: str, attributes: Dict[str, str]) -> None:
+		stack = self._stack
+		handler = self._START_HANDLERS.get((stack[-1] if len(stack) > 0 else None, name))
+		stack.append(name)
+		if handler is not None:
+			handler(self, attributes)
+
+	def EndElement(self, name: str) -> None:
+		stack = self._stack
+		stack.pop()
+		if name == "file" and stack[-1] == "files":
+			self._EndFile()
+
+	def EndDocument(self) -> None:
+		properties = self._project._properties
+
+		if (vhdlVersion := _VHDL_VERSIONS.get(properties.get("VHDL Source Analysis Standard"))) is not None:
+			self._project.VHDLVersion = vhdlVersion
+
+		# e.g. 'Architecture|toplevel|rtl' or 'Module|toplevel'
+		if (topLevel := properties.get("Implementation Top")) is not None:
+			self._project.DefaultDesign.TopLevel = topLevel.split("|")[1] if "|" in topLevel else topLevel
+
+	def _StartFile(self, attributes: Dict[str, str]) -> None:
+		self._path = Path(attributes.get("xil_pn:name", ""))
+		self._fileType = self._fileTypes.get(attributes.get("xil_pn:type"), File)
+		self._association = []
+		self._library = None
+
+	def _StartAssociation(self, attributes: Dict[str, str]) -> None:
+		self._association.append(attributes.get("xil_pn:name"))
+
+	def _StartFileLibrary(self, attributes: Dict[str, str]) -> None:
+		self._library = attributes.get("xil_pn:name")
+
+	def _EndFile(self) -> None:
+		association = self._association
+		if "Implementation" in association:
+			fileSetName = "Implementation"
+		elif len(association) > 0:
+			fileSetName = association[0]
+		else:
+			fileSetName = None
+
+		fileSet = self._GetFileSet(fileSetName)
+		file = self._fileType(self._path)
+		fileSet.AddFile(file)
+		file[AssociationAttribute] = association
+
+		if self._library is not None and isinstance(file, VHDLSourceFile):
+			file.VHDLLibrary = fileSet.GetOrCreateVHDLLibrary(self._library)
+
+		self._path = None
+		self._fileType = None
+
+	def _GetFileSet(self, name: Nullable[str]) -> FileSet:
+		design = self._project.DefaultDesign
+		if name is None:
+			return design.DefaultFileSet
+
+		try:
+			return self._fileSets[name]
+		except KeyError:
+			fileSet = self._fileSets[name] = FileSet(name, design=design)
+			return fileSet
+
+	def _StartLibrary(self, attributes: Dict[str, str]) -> None:
+		self._project.DefaultDesign.DefaultFileSet.GetOrCreateVHDLLibrary(attributes.get("xil_pn:name"))
+
+	def _StartProperty(self, attributes: Dict[str, str]) -> None:
+		self._project._properties[attributes.get("xil_pn:name")] = attributes.get("xil_pn:value")
+
+	_START_HANDLERS = {
+		("files",      "file"):        _StartFile,
+		("file",       "association"): _StartAssociation,
+		("file",       "library"):     _StartFileLibrary,
+		("libraries",  "library"):     _StartLibrary,
+		("properties", "property"):    _StartProperty,
+	}
+
+
+@export
+class ISEProjectFile(ProjectFile, XMLContent):
+	"""An ISE project file (``*.xise``)."""
+
+	#: File classes by file type (``xil_pn:type`` attribute of ``<file>``). Other file types are read as :class:`File`.
+	FILE_TYPES = {
+		"FILE_VHDL":    VHDLSourceFile,
+		"FILE_VERILOG": VerilogSourceFile,
+		"FILE_UCF":     UCFConstraintFile,
+	}
+
+	_xiseProject: Nullable[ISEProject]
+
+	def __init__(
+		self,
+		path: Path,
+		project: Project = None,
+		design: Design = None,
+		fileSet: FileSet = None
+	):
+		super().__init__(path, project, design, fileSet)
+
+		self._xiseProject = None
+
+	@property
+	def ProjectModel(self) -> ISEProject:
+		return self._xiseProject
+
+	def Parse(self, cache: Nullable[ParseCache] = None):
+		"""
+		Parse the ISE project file and create a project model.
+
+		The file is read with :mod:`xml.parsers.expat`. No document tree is built, so memory consumption doesn't grow with the
+		file's size.
+
+		:arg cache: Optional parse cache. If it holds a valid entry for this file, the model is loaded from cache.
+		"""
+		if not self._path.exists():
+			raise Exception(f"ISE project file '{self._path!s}' not found.") from FileNotFoundError(f"File '{self._path!s}' not found.")
+
+		if cache is not None and (project := cache.Load(self)) is not None:
+			self._xiseProject = project
+			return
+
+		# A cache entry is keyed by the content, which was parsed. So read it once instead of streaming the file.
+		content = None
+		if cache is not None:
+			try:
+				content = self._path.read_bytes()
+			except OSError as ex:
+				raise Exception(f"Couldn't open '{self._path!s}'.") from ex
+
+		project = ISEProject(self._path.stem, rootDirectory=self._path.parent)
+		reader = _XISEReader(project, self.FILE_TYPES)
+
+		parser = expat.ParserCreate()
+		parser.StartElementHandler = reader.StartElement
+		parser.EndElementHandler = reader.EndElement
+
+		try:
+			if content is not None:
+				parser.Parse(content, True)
+			else:
+				with self._path.open("rb") as file:
+					parser.ParseFile(file)
+		except (OSError, expat.ExpatError) as ex:
+			raise Exception(f"Couldn't open '{self._path!s}'.") from ex
+
+		reader.EndDocument()
+		self._xiseProject = project
+
+		if cache is not None:
+			cache.Store(self, project, content=content)
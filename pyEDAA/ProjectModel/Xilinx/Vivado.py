@@ -29,20 +29,32 @@
 # ==================================================================================================================== #
 #
 """Specific file types and attributes for Xilinx Vivado."""
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from json import loads as json_loads
+from os import getpid, replace as os_replace
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Dict, List, Optional as Nullable, Generator, Tuple, Any as typing_Any
 
 from xml.dom import minidom, Node
+from xml.etree import ElementTree
+from xml.parsers import expat
+from xml.sax.saxutils import escape
 
 from pyTooling.MetaClasses import ExtendedType
 from pyVHDLModel import VHDLVersion
 from pyTooling.Decorators import export
 
-from pyEDAA.ProjectModel import ProjectFile, XMLFile, XMLContent, SDCContent, Project, FileSet, Attribute, Design
+from pyEDAA.ProjectModel import ProjectFile, XMLFile, XMLContent, JSONContent, SDCContent, HumanReadableContent, Project, FileSet, Attribute, Design
+from pyEDAA.ProjectModel import FileTypeRegistry
+from pyEDAA.ProjectModel.Cache import ParseCache
 from pyEDAA.ProjectModel import File as Model_File
 from pyEDAA.ProjectModel import ConstraintFile as Model_ConstraintFile
 from pyEDAA.ProjectModel import VerilogSourceFile as Model_VerilogSourceFile
 from pyEDAA.ProjectModel import VHDLSourceFile as Model_VHDLSourceFile
+from pyEDAA.ProjectModel import SystemVerilogSourceFile as Model_SystemVerilogSourceFile
+from pyEDAA.ProjectModel import TCLSourceFile as Model_TCLSourceFile
+from pyEDAA.ProjectModel import WaveformConfigFile as Model_WaveformConfigFile
 
 
 @export
@@ -51,16 +63,18 @@ class UsedInAttribute(Attribute):
 	VALUE_TYPE = Iterable[str]
 
 
-@export
-class File(Model_File):
-	pass
-
-
 class VivadoFileMixIn(metaclass=ExtendedType, mixin=True):
 	def _registerAttributes(self):
 		self._attributes[UsedInAttribute] = []
 
 
+@export
+class File(Model_File, VivadoFileMixIn):
+	def _registerAttributes(self):
+		super()._registerAttributes()
+		VivadoFileMixIn._registerAttributes(self)
+
+
 @export
 class ConstraintFile(Model_ConstraintFile, VivadoFileMixIn):
 	def _registerAttributes(self):
@@ -69,24 +83,788 @@ class ConstraintFile(Model_ConstraintFile, VivadoFileMixIn):
 
 
 @export
-class VerilogSourceFile(Model_VerilogSourceFile):
+class VerilogSourceFile(Model_VerilogSourceFile, VivadoFileMixIn):
+	def _registerAttributes(self):
+		super()._registerAttributes()
+		VivadoFileMixIn._registerAttributes(self)
+
+
+@export
+class VHDLSourceFile(Model_VHDLSourceFile, VivadoFileMixIn):
+	def _registerAttributes(self):
+		super()._registerAttributes()
+		VivadoFileMixIn._registerAttributes(self)
+
+
+@export
+class SystemVerilogSourceFile(Model_SystemVerilogSourceFile, VivadoFileMixIn):
 	def _registerAttributes(self):
 		super()._registerAttributes()
 		VivadoFileMixIn._registerAttributes(self)
 
 
 @export
-class VHDLSourceFile(Model_VHDLSourceFile):
+class TCLSourceFile(Model_TCLSourceFile, VivadoFileMixIn):
 	def _registerAttributes(self):
 		super()._registerAttributes()
 		VivadoFileMixIn._registerAttributes(self)
 
 
+#: VHDL versions by source file type (``SFType`` attribute of ``<FileInfo>``). Files without ``SFType`` are VHDL-93.
+_VHDL_VERSIONS = {
+	"VHDL2008": VHDLVersion.VHDL2008,
+	"VHDL2019": VHDLVersion.VHDL2019,
+}
+
+
+#: Options of a Vivado ``<Config>``, ``<Configuration>`` or ``<Simulator>`` section. Option names may repeat, thus all
+#: values are kept in document order.
+Options = Dict[str, List[str]]
+
+
+def _FirstOption(options: Options, name: str) -> Nullable[str]:
+	values = options.get(name)
+	return values[0] if values else None
+
+
+@export
+class VivadoFileSet(FileSet):
+	"""
+	A Vivado fileset including the options of its ``<Config>`` section.
+
+	:arg name:        The fileset's name.
+	:arg design:      Design the fileset is associated with.
+	:arg fileSetType: Vivado's fileset type (``Type`` attribute of ``<FileSet>``). Default: the class' ``FILESET_TYPE``.
+	"""
+
+	FILESET_TYPE = "DesignSrcs"  #: Default fileset type used when writing a project file.
+
+	_options:     Options
+	_fileSetType: str
+
+	def __init__(self, name: str, design: Design = None, fileSetType: Nullable[str] = None):
+		super().__init__(name, design=design)
+		self._options = {}
+		self._fileSetType = self.FILESET_TYPE if fileSetType is None else fileSetType
+
+	@property
+	def Options(self) -> Options:
+		"""Read-only property returning the fileset's options (``<Config>``) by name."""
+		return self._options
+
+	@property
+	def FileSetType(self) -> str:
+		"""Read-only property returning Vivado's fileset type, e.g. ``DesignSrcs``."""
+		return self._fileSetType
+
+
+@export
+class DesignSourceSet(VivadoFileSet):
+	"""A Vivado fileset of design sources (``DesignSrcs`` or ``BlockSrcs``)."""
+
+
+@export
+class ConstraintSet(VivadoFileSet):
+	"""A Vivado fileset of constraint files (``Constrs``)."""
+
+	FILESET_TYPE = "Constrs"
+
+	@property
+	def ConstraintsType(self) -> Nullable[str]:
+		"""Read-only property returning the constraint type, e.g. ``XDC``."""
+		return _FirstOption(self._options, "ConstrsType")
+
+
+@export
+class SimulationSet(VivadoFileSet):
+	"""A Vivado fileset of simulation sources (``SimulationSrcs``)."""
+
+	FILESET_TYPE = "SimulationSrcs"
+
+	@property
+	def SourceSet(self) -> Nullable[FileSet]:
+		"""Read-only property returning the design source set simulated by this simulation set."""
+		name = _FirstOption(self._options, "SrcSet")
+		return self.Design.FileSets.get(name) if name is not None else None
+
+	@property
+	def TopLibrary(self) -> Nullable[str]:
+		"""Read-only property returning the VHDL library of the simulation's toplevel."""
+		return _FirstOption(self._options, "TopLib")
+
+
+@export
+class UtilitySet(VivadoFileSet):
+	"""A Vivado fileset of utility files (``Utils``)."""
+
+	FILESET_TYPE = "Utils"
+
+
+@export
+class Run(metaclass=ExtendedType, slots=True):
+	"""
+	A Vivado run (``<Run>``) and its strategy.
+
+	:arg project:    The project this run belongs to.
+	:arg attributes: The run's XML attributes, like ``Id``, ``Type``, ``Part``, ``SrcSet`` or ``ConstrsSet``.
+	"""
+
+	_project:         'VivadoProject'
+	_attributes:      Dict[str, str]
+	_strategy:        Nullable[str]
+	_flow:            Nullable[str]
+	_reportStrategy:  Nullable[str]
+	_steps:           Dict[str, Dict[str, str]]
+
+	def __init__(self, project: 'VivadoProject', attributes: Dict[str, str]):
+		self._project = project
+		self._attributes = attributes
+		self._strategy = None
+		self._flow = None
+		self._reportStrategy = None
+		self._steps = {}
+
+	@property
+	def Name(self) -> str:
+		"""Read-only property returning the run's name (``Id``)."""
+		return self._attributes.get("Id", "")
+
+	@property
+	def Type(self) -> str:
+		"""Read-only property returning Vivado's run type, e.g. ``Ft3:Synth``."""
+		return self._attributes.get("Type", "")
+
+	@property
+	def Attributes(self) -> Dict[str, str]:
+		"""Read-only property returning all XML attributes of this run."""
+		return self._attributes
+
+	@property
+	def Part(self) -> Nullable[str]:
+		return self._attributes.get("Part")
+
+	@property
+	def Description(self) -> Nullable[str]:
+		return self._attributes.get("Description")
+
+	@property
+	def IsCurrent(self) -> bool:
+		"""Read-only property returning true, if this is the project's current run of its kind."""
+		return self._attributes.get("State") == "current"
+
+	@property
+	def Strategy(self) -> Nullable[str]:
+		"""Read-only property returning the name of the run's strategy, e.g. ``Vivado Synthesis Defaults``."""
+		return self._strategy
+
+	@property
+	def Flow(self) -> Nullable[str]:
+		"""Read-only property returning the flow of the run's strategy, e.g. ``Vivado Synthesis 2018``."""
+		return self._flow
+
+	@property
+	def ReportStrategy(self) -> Nullable[str]:
+		return self._reportStrategy
+
+	@property
+	def Steps(self) -> Dict[str, Dict[str, str]]:
+		"""Read-only property returning the strategy's steps by id, each with its non-default options."""
+		return self._steps
+
+	@property
+	def SourceSet(self) -> Nullable[FileSet]:
+		"""Read-only property returning the design source set (``SrcSet``) of this run."""
+		return self._GetFileSet("SrcSet")
+
+	@property
+	def ConstraintSet(self) -> Nullable[FileSet]:
+		"""Read-only property returning the constraint set (``ConstrsSet``) of this run."""
+		return self._GetFileSet("ConstrsSet")
+
+	def _GetFileSet(self, key: str) -> Nullable[FileSet]:
+		name = self._attributes.get(key)
+		return self._project.DefaultDesign.FileSets.get(name) if name is not None else None
+
+
+@export
+class SynthesisRun(Run):
+	"""A Vivado synthesis run (``Ft3:Synth``)."""
+
+
+@export
+class ImplementationRun(Run):
+	"""A Vivado implementation run (``Ft2:EntireDesign``)."""
+
+	@property
+	def SynthesisRun(self) -> Nullable[SynthesisRun]:
+		"""Read-only property returning the synthesis run (``SynthRun``) this implementation run is based on."""
+		name = self._attributes.get("SynthRun")
+		return self._project.Runs.get(name) if name is not None else None
+
+	@property
+	def SourceSet(self) -> Nullable[FileSet]:
+		"""Read-only property returning the design source set of this run or of its synthesis run."""
+		sourceSet = self._GetFileSet("SrcSet")
+		if sourceSet is None and (synthesisRun := self.SynthesisRun) is not None:
+			sourceSet = synthesisRun.SourceSet
+		return sourceSet
+
+
+@export
+class VivadoProject(Project):
+	"""
+	A Vivado project including its configuration, simulators and runs.
+
+	:arg name:          The project's name.
+	:arg rootDirectory: Base-path to the project.
+	"""
+
+	_configuration: Options
+	_simulators:    Dict[str, Options]
+	_runs:          Dict[str, Run]
+
+	def __init__(self, name: str, rootDirectory: Path = Path(".")):
+		super().__init__(name, rootDirectory=rootDirectory)
+		self._configuration = {}
+		self._simulators = {}
+		self._runs = {}
+
+	@property
+	def Configuration(self) -> Options:
+		"""Read-only property returning the project's options (``<Configuration>``) by name."""
+		return self._configuration
+
+	@property
+	def Simulators(self) -> Dict[str, Options]:
+		"""Read-only property returning the options of each simulator by simulator name."""
+		return self._simulators
+
+	@property
+	def Runs(self) -> Dict[str, Run]:
+		"""Read-only property returning all runs by name."""
+		return self._runs
+
+	@property
+	def Part(self) -> Nullable[str]:
+		"""Read-only property returning the project's FPGA part."""
+		return _FirstOption(self._configuration, "Part")
+
+	@property
+	def ActiveSimulationSet(self) -> Nullable[FileSet]:
+		"""Read-only property returning the active simulation set (``ActiveSimSet``)."""
+		name = _FirstOption(self._configuration, "ActiveSimSet")
+		return self.DefaultDesign.FileSets.get(name) if name is not None else None
+
+	def SynthesisRuns(self) -> Generator[SynthesisRun, None, None]:
+		"""Method returning all synthesis runs."""
+		return (run for run in self._runs.values() if isinstance(run, SynthesisRun))
+
+	def ImplementationRuns(self) -> Generator[ImplementationRun, None, None]:
+		"""Method returning all implementation runs."""
+		return (run for run in self._runs.values() if isinstance(run, ImplementationRun))
+
+
+class _XPRReader(metaclass=ExtendedType, slots=True):
+	"""
+	Builds the project model from a stream of element events of a Vivado project file (``*.xpr``).
+
+	The reader keeps only a stack of open element names and the currently open fileset, file, simulator and run. It's fed
+	either by an :mod:`xml.parsers.expat` parser (streaming) or by walking a :mod:`xml.dom.minidom` document.
+
+	If fed by an expat parser, the reader also records the byte positions of each ``<FileSet>`` together with the properties
+	of its files as written by :class:`_XPRWriter`. These locations are laid out like the ones of :class:`_XPRLocator`,
+	except that they hold the files' properties instead of children and the fileset's end is the byte index of its end
+	tag. An incremental write uses them instead of scanning the file again.
+	"""
+
+	#: Fileset classes by fileset type (``Type`` attribute of ``<FileSet>``).
+	FILESET_TYPES = {
+		"DesignSrcs":     DesignSourceSet,
+		"BlockSrcs":      DesignSourceSet,
+		"Constrs":        ConstraintSet,
+		"SimulationSrcs": SimulationSet,
+		"Utils":          UtilitySet,
+	}
+
+	#: Run classes by run type (``Type`` attribute of ``<Run>``).
+	RUN_TYPES = {
+		"Ft3:Synth":        SynthesisRun,
+		"Ft2:EntireDesign": ImplementationRun,
+	}
+
+	_project:    VivadoProject
+	_stack:      List[str]
+	_fileSet:    Nullable[VivadoFileSet]
+	_file:       Nullable[Model_File]
+	_usedIn:     Nullable[List[str]]
+	_simulator:  Nullable[Options]
+	_run:        Nullable[Run]
+	_step:       Nullable[Dict[str, str]]
+	_optionId:   Nullable[str]
+	_text:       List[str]
+	_parser:     typing_Any
+	_location:   Nullable[List]
+	_fileInfo:   Nullable[List]
+
+	Locations:   List[List]     #: Per fileset: name, type, start, end tag, ``None``, file properties and config options.
+	FileSetsEnd: Nullable[int]  #: Byte index of the ``</FileSets>`` end tag.
+
+	def __init__(self, project: VivadoProject, parser: typing_Any = None):
+		self._project = project
+		self._stack = []
+		self._fileSet = None
+		self._file = None
+		self._usedIn = None
+		self._simulator = None
+		self._run = None
+		self._step = None
+		self._optionId = None
+		self._text = []
+		self._parser = parser
+		self._location = None
+		self._fileInfo = None
+		self.Locations = []
+		self.FileSetsEnd = None
+
+	def StartElement(self, name: str, attributes: Dict[str, str]) -> None:
+		stack = self._stack
+		handler = self._START_HANDLERS.get((stack[-1] if len(stack) > 0 else None, name))
+		stack.append(name)
+		if handler is not None:
+			handler(self, attributes)
+
+	def EndElement(self, name: str) -> None:
+		self._stack.pop()
+		handler = self._END_HANDLERS.get(name)
+		if handler is not None:
+			handler(self)
+
+	def CharacterData(self, data: str) -> None:
+		if self._optionId is not None:
+			self._text.append(data)
+
+	def _StartFileSet(self, attributes: Dict[str, str]) -> None:
+		fileSetType = attributes.get("Type")
+		fileSetClass = self.FILESET_TYPES.get(fileSetType, VivadoFileSet)
+		self._fileSet = fileSetClass(attributes.get("Name", ""), design=self._project.DefaultDesign, fileSetType=fileSetType)
+		if self._parser is not None:
+			self._location = [self._fileSet.Name, fileSetType, self._parser.CurrentByteIndex, None, None, [], []]
+			self.Locations.append(self._location)
+
+	def _EndFileSet(self) -> None:
+		self._fileSet = None
+		if self._location is not None:
+			self._location[3] = self._parser.CurrentByteIndex
+			self._location = None
+
+	def _EndFileSets(self) -> None:
+		if self._parser is not None:
+			self.FileSetsEnd = self._parser.CurrentByteIndex
+
+	def _StartFile(self, attributes: Dict[str, str]) -> None:
+		if self._fileSet is None:
+			return
+
+		croppedPath = attributes.get("Path", "").replace("$PPRDIR/", "")
+		filePath = Path(croppedPath)
+		file = VivadoFileTypes.GetFileType(filePath)(filePath)
+		self._fileSet.AddFile(file)
+
+		self._file = file
+		if isinstance(file, VivadoFileMixIn):
+			self._usedIn = file[UsedInAttribute]
+		if self._location is not None:
+			# path, source file type and library as written
+			self._fileInfo = [attributes.get("Path", ""), None, None]
+
+	def _EndFile(self) -> None:
+		if self._fileInfo is not None:
+			path, sfType, library = self._fileInfo
+			if not isinstance(self._file, VHDLSourceFile):
+				sfType = library = None
+			elif sfType is not None and sfType not in _VHDL_VERSIONS:
+				sfType = ""
+			usedIn = tuple(self._usedIn) if self._usedIn is not None else ()
+			self._location[5].append((path, sfType, library, usedIn))
+			self._fileInfo = None
+		self._file = None
+		self._usedIn = None
+
+	def _StartFileInfo(self, attributes: Dict[str, str]) -> None:
+		if isinstance(self._file, VHDLSourceFile):
+			self._file.VHDLVersion = _VHDL_VERSIONS.get(attributes.get("SFType"), VHDLVersion.VHDL93)
+		if self._fileInfo is not None:
+			self._fileInfo[1] = attributes.get("SFType", "")
+
+	def _StartFileAttribute(self, attributes: Dict[str, str]) -> None:
+		name = attributes.get("Name")
+		if name == "Library":
+			if isinstance(self._file, VHDLSourceFile):
+				self._file.VHDLLibrary = self._fileSet.GetOrCreateVHDLLibrary(attributes.get("Val"))
+			if self._fileInfo is not None:
+				self._fileInfo[2] = attributes.get("Val")
+		elif name == "UsedIn":
+			if self._usedIn is not None:
+				self._usedIn.append(attributes.get("Val"))
+
+	def _StartFileSetOption(self, attributes: Dict[str, str]) -> None:
+		if self._fileSet is None:
+			return
+
+		name = attributes.get("Name")
+		value = attributes.get("Val")
+		self._fileSet._options.setdefault(name, []).append(value)
+		if name == "TopModule":
+			self._fileSet.TopLevel = value
+		if self._location is not None:
+			self._location[6].append((name, value))
+
+	def _StartConfigurationOption(self, attributes: Dict[str, str]) -> None:
+		self._project._configuration.setdefault(attributes.get("Name"), []).append(attributes.get("Val"))
+
+	def _StartSimulator(self, attributes: Dict[str, str]) -> None:
+		self._simulator = self._project._simulators.setdefault(attributes.get("Name", ""), {})
+
+	def _EndSimulator(self) -> None:
+		self._simulator = None
+
+	def _StartSimulatorOption(self, attributes: Dict[str, str]) -> None:
+		if self._simulator is not None:
+			self._simulator.setdefault(attributes.get("Name"), []).append(attributes.get("Val"))
+
+	def _StartRun(self, attributes: Dict[str, str]) -> None:
+		runClass = self.RUN_TYPES.get(attributes.get("Type"), Run)
+		self._run = runClass(self._project, attributes)
+		self._project._runs[self._run.Name] = self._run
+
+	def _EndRun(self) -> None:
+		self._run = None
+
+	def _StartStrategyHandle(self, attributes: Dict[str, str]) -> None:
+		if self._run is not None:
+			self._run._strategy = attributes.get("Name")
+			self._run._flow = attributes.get("Flow")
+
+	def _StartReportStrategy(self, attributes: Dict[str, str]) -> None:
+		if self._run is not None:
+			self._run._reportStrategy = attributes.get("Name")
+
+	def _StartStep(self, attributes: Dict[str, str]) -> None:
+		if self._run is not None:
+			self._step = self._run._steps.setdefault(attributes.get("Id", ""), {})
+
+	def _EndStep(self) -> None:
+		self._step = None
+
+	def _StartStepOption(self, attributes: Dict[str, str]) -> None:
+		if self._step is not None:
+			self._optionId = attributes.get("Id", "")
+
+	def _EndOption(self) -> None:
+		if self._optionId is not None:
+			self._step[self._optionId] = "".join(self._text).strip()
+			self._optionId = None
+			self._text.clear()
+
+	#: Handlers for opening elements, dispatched by the pair of (parent element name, element name).
+	_START_HANDLERS = {
+		("FileSets",      "FileSet"):        _StartFileSet,
+		("FileSet",       "File"):           _StartFile,
+		("File",          "FileInfo"):       _StartFileInfo,
+		("FileInfo",      "Attr"):           _StartFileAttribute,
+		("Config",        "Option"):         _StartFileSetOption,
+		("Configuration", "Option"):         _StartConfigurationOption,
+		("Simulators",    "Simulator"):      _StartSimulator,
+		("Simulator",     "Option"):         _StartSimulatorOption,
+		("Runs",          "Run"):            _StartRun,
+		("Strategy",      "StratHandle"):    _StartStrategyHandle,
+		("Run",           "ReportStrategy"): _StartReportStrategy,
+		("Strategy",      "Step"):           _StartStep,
+		("Step",          "Option"):         _StartStepOption,
+	}
+
+	#: Handlers for closing elements, dispatched by element name.
+	_END_HANDLERS = {
+		"FileSets":  _EndFileSets,
+		"FileSet":   _EndFileSet,
+		"File":      _EndFile,
+		"Simulator": _EndSimulator,
+		"Run":       _EndRun,
+		"Step":      _EndStep,
+		"Option":    _EndOption,
+	}
+
+
+#: Filter types of ``<Filter>`` by fileset type.
+_FILTER_TYPES = {
+	"DesignSrcs":     "Srcs",
+	"BlockSrcs":      "Srcs",
+	"SimulationSrcs": "Srcs",
+	"Constrs":        "Constrs",
+	"Utils":          "Utils",
+}
+
+
+def _Attribute(value: str) -> str:
+	return escape(value, {'"': "&quot;"})
+
+
+class _XPRWriter(metaclass=ExtendedType, slots=True):
+	"""
+	Renders the project model as Vivado project file (``*.xpr``) fragments.
+
+	Fragments are rendered with Vivado's indentation (2 spaces per level), so they can be streamed into a new file or
+	spliced into an existing file.
+	"""
+
+	@staticmethod
+	def FileInfo(file: Model_File) -> Tuple[str, Nullable[str], Nullable[str], Tuple[str, ...]]:
+		"""
+		Return the written properties of a file: path, source file type, VHDL library and usages.
+
+		The source file type of a VHDL file is ``""``, if its VHDL version has no ``SFType``. A ``<FileInfo>`` without
+		``SFType`` is read as VHDL-93. It's ``None``, if the file's VHDL version isn't set.
+		"""
+		path = file.Path.as_posix()
+		if not file.Path.is_absolute():
+			path = f"$PPRDIR/{path}"
+
+		sfType = None
+		library = None
+		if isinstance(file, Model_VHDLSourceFile):
+			try:
+				vhdlVersion = file.VHDLVersion
+				if vhdlVersion is not None:
+					sfType = next((key for key, version in _VHDL_VERSIONS.items() if version is vhdlVersion), "")
+			except Exception:
+				pass
+			try:
+				library = file.VHDLLibrary.Name
+			except Exception:
+				pass
+
+		usedIn = tuple(file[UsedInAttribute]) if isinstance(file, VivadoFileMixIn) else ()
+		return path, sfType, library, usedIn
+
+	@staticmethod
+	def ConfigOptions(fileSet: FileSet) -> List[Tuple[str, str]]:
+		"""Return the ``<Config>`` options of a fileset as pairs of name and value. ``TopModule`` reflects ``TopLevel``."""
+		options = dict(fileSet._options) if isinstance(fileSet, VivadoFileSet) else {}
+		if fileSet.TopLevel is not None:
+			options["TopModule"] = [fileSet.TopLevel]
+		return [(name, value) for name, values in options.items() for value in values]
+
+	def RenderFile(self, fileInfo: Tuple[str, Nullable[str], Nullable[str], Tuple[str, ...]], indent: str) -> str:
+		path, sfType, library, usedIn = fileInfo
+		attributes = []
+		if library is not None:
+			attributes.append(f'{indent}    <Attr Name="Library" Val="{_Attribute(library)}"/>\n')
+		attributes.extend(f'{indent}    <Attr Name="UsedIn" Val="{_Attribute(value)}"/>\n' for value in usedIn)
+
+		if sfType is None and len(attributes) == 0:
+			return f'{indent}<File Path="{_Attribute(path)}"/>'
+
+		fileInfo = f'{indent}  <FileInfo SFType="{sfType}">' if sfType else f"{indent}  <FileInfo>"
+		return f'{indent}<File Path="{_Attribute(path)}">\n{fileInfo}\n{"".join(attributes)}{indent}  </FileInfo>\n{indent}</File>'
+
+	def RenderConfig(self, options: List[Tuple[str, str]], indent: str) -> str:
+		lines = [f"{indent}<Config>"]
+		lines.extend(f'{indent}  <Option Name="{_Attribute(name)}" Val="{_Attribute(value)}"/>' for name, value in options)
+		lines.append(f"{indent}</Config>")
+		return "\n".join(lines)
+
+	def RenderFileSet(self, fileSet: FileSet, indent: str) -> Generator[str, None, None]:
+		fileSetType = fileSet.FileSetType if isinstance(fileSet, VivadoFileSet) else VivadoFileSet.FILESET_TYPE
+		name = _Attribute(fileSet.Name)
+		yield f'{indent}<FileSet Name="{name}" Type="{fileSetType}" RelSrcDir="$PSRCDIR/{name}" RelGenDir="$PGENDIR/{name}">\n'
+		yield f'{indent}  <Filter Type="{_FILTER_TYPES.get(fileSetType, "Srcs")}"/>\n'
+		for file in fileSet.Files():
+			yield self.RenderFile(self.FileInfo(file), indent + "  ") + "\n"
+		options = self.ConfigOptions(fileSet)
+		if len(options) > 0:
+			yield self.RenderConfig(options, indent + "  ") + "\n"
+		yield f"{indent}</FileSet>"
+
+	@staticmethod
+	def WrittenFileSets(project: Project) -> Generator[FileSet, None, None]:
+		"""Return the filesets of a project to write. An empty default fileset isn't written."""
+		design = project.DefaultDesign
+		for fileSet in design.FileSets.values():
+			if fileSet is not design.DefaultFileSet or len(fileSet) > 0:
+				yield fileSet
+
+	def RenderOptions(self, tag: str, options: Options, indent: str) -> Generator[str, None, None]:
+		for name, values in options.items():
+			for value in values:
+				yield f'{indent}<{tag} Name="{_Attribute(name)}" Val="{_Attribute(value)}"/>\n'
+
+	def RenderRun(self, run: Run, indent: str) -> Generator[str, None, None]:
+		attributes = " ".join(f'{key}="{_Attribute(value)}"' for key, value in run.Attributes.items())
+		yield f"{indent}<Run {attributes}>\n"
+		yield f'{indent}  <Strategy Version="1" Minor="2">\n'
+		if run.Strategy is not None:
+			yield f'{indent}    <StratHandle Name="{_Attribute(run.Strategy)}" Flow="{_Attribute(run.Flow or "")}"/>\n'
+		for stepId, options in run.Steps.items():
+			if len(options) == 0:
+				yield f'{indent}    <Step Id="{_Attribute(stepId)}"/>\n'
+			else:
+				yield f'{indent}    <Step Id="{_Attribute(stepId)}">\n'
+				for optionId, value in options.items():
+					yield f'{indent}      <Option Id="{_Attribute(optionId)}">{escape(value)}</Option>\n'
+				yield f"{indent}    </Step>\n"
+		yield f"{indent}  </Strategy>\n"
+		if run.ReportStrategy is not None:
+			yield f'{indent}  <ReportStrategy Name="{_Attribute(run.ReportStrategy)}"/>\n'
+		yield f"{indent}</Run>\n"
+
+	def RenderProject(self, project: Project, path: Path) -> Generator[str, None, None]:
+		yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+		yield f'<Project Version="7" Minor="55" Path="{_Attribute(path.as_posix())}">\n'
+		if isinstance(project, VivadoProject) and len(project.Configuration) > 0:
+			yield "  <Configuration>\n"
+			yield from self.RenderOptions("Option", project.Configuration, "    ")
+			yield "  </Configuration>\n"
+
+		yield '  <FileSets Version="1" Minor="31">\n'
+		for fileSet in self.WrittenFileSets(project):
+			yield from self.RenderFileSet(fileSet, "    ")
+			yield "\n"
+		yield "  </FileSets>\n"
+
+		if isinstance(project, VivadoProject):
+			if len(project.Simulators) > 0:
+				yield "  <Simulators>\n"
+				for name, options in project.Simulators.items():
+					yield f'    <Simulator Name="{_Attribute(name)}">\n'
+					yield from self.RenderOptions("Option", options, "      ")
+					yield "    </Simulator>\n"
+				yield "  </Simulators>\n"
+			if len(project.Runs) > 0:
+				yield '  <Runs Version="1" Minor="15">\n'
+				for run in project.Runs.values():
+					yield from self.RenderRun(run, "    ")
+				yield "  </Runs>\n"
+		yield "</Project>\n"
+
+
+class _XPRLocator(metaclass=ExtendedType, slots=True):
+	"""
+	Records the byte ranges of each ``<FileSet>`` and its children as well as the position of the ``</FileSets>`` end tag
+	in an existing project file. For each ``<File>``, the properties written by :class:`_XPRWriter` are collected, too. No
+	project model is created.
+
+	The end of an element is the byte index of the next parser event, thus ranges exactly cover an element's markup.
+	"""
+
+	_parser:     typing_Any
+	_depth:      int
+	_pending:    List[Tuple[List, int]]
+	_fileSet:    Nullable[List]
+	_child:      Nullable[List]
+
+	FileSetsEnd: Nullable[int]  #: Byte index of the ``</FileSets>`` end tag.
+	FileSets:    List[List]     #: Per fileset: name, type, start, end, header end, children and config options.
+
+	def __init__(self, parser):
+		self._parser = parser
+		self._depth = 0
+		self._pending = []
+		self._fileSet = None
+		self._child = None
+		self.FileSetsEnd = None
+		self.FileSets = []
+
+		parser.StartElementHandler = self.StartElement
+		parser.EndElementHandler = self.EndElement
+
+	def _Wait(self, record: List, position: int) -> None:
+		# character data and comments are only of interest while an end position is pending
+		if len(self._pending) == 0:
+			self._parser.CharacterDataHandler = self.Other
+			self._parser.CommentHandler = self.Other
+		self._pending.append((record, position))
+
+	def _Resolve(self, index: int) -> None:
+		for record, position in self._pending:
+			record[position] = index
+		self._pending.clear()
+		self._parser.CharacterDataHandler = None
+		self._parser.CommentHandler = None
+
+	def StartElement(self, name: str, attributes: Dict[str, str]) -> None:
+		index = self._parser.CurrentByteIndex
+		if len(self._pending) > 0:
+			self._Resolve(index)
+
+		depth = self._depth
+		self._depth = depth + 1
+		if depth == 2:
+			if name == "FileSet":
+				self._fileSet = [attributes.get("Name", ""), attributes.get("Type"), index, None, None, [], []]
+				self.FileSets.append(self._fileSet)
+				self._Wait(self._fileSet, 4)
+		elif self._fileSet is None:
+			return
+		elif depth == 3:
+			# tag, start, end, path, source file type, library, usages
+			self._child = [name, index, None, attributes.get("Path", ""), None, None, []]
+			self._fileSet[5].append(self._child)
+		elif depth == 4:
+			if name == "FileInfo":
+				self._child[4] = attributes.get("SFType", "")
+			elif name == "Option" and self._child[0] == "Config":
+				self._fileSet[6].append((attributes.get("Name"), attributes.get("Val")))
+		elif depth == 5 and name == "Attr":
+			attributeName = attributes.get("Name")
+			if attributeName == "Library":
+				self._child[5] = attributes.get("Val")
+			elif attributeName == "UsedIn":
+				self._child[6].append(attributes.get("Val"))
+
+	def EndElement(self, name: str) -> None:
+		index = self._parser.CurrentByteIndex
+		if len(self._pending) > 0:
+			self._Resolve(index)
+
+		self._depth = depth = self._depth - 1
+		if depth == 1 and name == "FileSets":
+			self.FileSetsEnd = index
+		elif depth == 2 and self._fileSet is not None:
+			if self._fileSet[4] == self._fileSet[2]:
+				self._fileSet[4] = None  # empty-element tag has no separate header
+			self._Wait(self._fileSet, 3)
+			self._fileSet = None
+		elif depth == 3 and self._child is not None:
+			self._Wait(self._child, 2)
+			self._child = None
+
+	def Other(self, _: str) -> None:
+		self._Resolve(self._parser.CurrentByteIndex)
+
+	@staticmethod
+	def FileInfo(child: List) -> Tuple[str, Nullable[str], Nullable[str], Tuple[str, ...]]:
+		"""Return the properties of a ``<File>`` element as far as they're reflected by the project model."""
+		path = child[3]
+		index = path.rfind(".")
+		fileType = VivadoFileTypes.get(path[index:].lower(), VivadoFileTypes.Default) if index >= 0 else VivadoFileTypes.Default
+		if issubclass(fileType, Model_VHDLSourceFile):
+			sfType = child[4] if child[4] is None or child[4] in _VHDL_VERSIONS else ""
+			library = child[5]
+		else:
+			sfType = library = None
+		usedIn = tuple(child[6]) if issubclass(fileType, VivadoFileMixIn) else ()
+		return path, sfType, library, usedIn
+
+
 @export
 class VivadoProjectFile(ProjectFile, XMLContent):
 	"""A Vivado project file (``*.xpr``)."""
 
-	_xprProject: Project
+	#: Number of bytes fed to the streaming parser at once.
+	_CHUNK_SIZE = 2**16
+
+	_xprProject: VivadoProject
+	_snapshot:   Nullable[Tuple[bytes, Nullable[int], List[List]]]
 
 	def __init__(
 		self,
@@ -98,96 +876,321 @@ class VivadoProjectFile(ProjectFile, XMLContent):
 		super().__init__(path, project, design, fileSet)
 
 		self._xprProject = None
+		self._snapshot = None
 
 	@property
-	def ProjectModel(self) -> Project:
+	def ProjectModel(self) -> VivadoProject:
 		return self._xprProject
 
-	def Parse(self):
+	def Parse(self, streaming: bool = True, cache: Nullable[ParseCache] = None):
+		"""
+		Parse the Vivado project file and create a project model.
+
+		Filesets, the project's configuration, simulators and runs are extracted in a single pass. By default, the file is
+		read with :mod:`xml.parsers.expat`. No document tree is built, so memory consumption doesn't grow with the file's
+		size. The :mod:`xml.dom.minidom` based reader is kept for comparison and produces the same model.
+
+		:arg streaming: If true, use the streaming expat parser, otherwise build a DOM first.
+		:arg cache:     Optional parse cache. If it holds a valid entry for this file, the model is loaded from cache.
+		"""
 		if not self._path.exists():
 			raise Exception(f"Vivado project file '{self._path!s}' not found.") from FileNotFoundError(f"File '{self._path!s}' not found.")
 
+		self._snapshot = None
+		if cache is not None and (project := cache.Load(self)) is not None:
+			self._xprProject = project
+			return
+
+		# A cache entry is keyed by the content, which was parsed. So read it once instead of streaming the file.
+		content = None
+		if cache is not None:
+			try:
+				content = self._path.read_bytes()
+			except OSError as ex:
+				raise Exception(f"Couldn't open '{self._path!s}'.") from ex
+
+		project = VivadoProject(self._path.stem, rootDirectory=self._path.parent)
+
+		if streaming:
+			parser = expat.ParserCreate()
+			reader = _XPRReader(project, parser)
+			parser.StartElementHandler = reader.StartElement
+			parser.EndElementHandler = reader.EndElement
+			parser.CharacterDataHandler = reader.CharacterData
+
+			# the digest identifies the parsed content, so an incremental write can reuse the recorded fileset locations
+			try:
+				if content is not None:
+					digest = sha256(content)
+					parser.Parse(content, True)
+				else:
+					digest = sha256()
+					with self._path.open("rb") as file:
+						while (chunk := file.read(self._CHUNK_SIZE)) != b"":
+							digest.update(chunk)
+							parser.Parse(chunk, False)
+					parser.Parse(b"", True)
+			except (OSError, expat.ExpatError) as ex:
+				raise Exception(f"Couldn't open '{self._path!s}'.") from ex
+
+			self._snapshot = (digest.digest(), reader.FileSetsEnd, reader.Locations)
+		else:
+			reader = _XPRReader(project)
+			try:
+				if content is not None:
+					root = minidom.parseString(content).documentElement
+				else:
+					root = minidom.parse(str(self._path)).documentElement
+			except Exception as ex:
+				raise Exception(f"Couldn't open '{self._path!s}'.") from ex
+
+			self._ParseElement(root, reader)
+
+		self._xprProject = project
+		if cache is not None:
+			cache.Store(self, project, content=content)
+
+	def Write(self, project: Nullable[Project] = None, incremental: bool = False) -> bool:
+		"""
+		Write a project model as Vivado project file.
+
+		By default, the whole file is rendered and streamed to a temporary file, which then replaces the project file
+		atomically.
+
+		In incremental mode, an existing file is updated in place. Only changed ``<FileSet>`` and ``<File>`` elements are
+		rendered and the file is rewritten from the first changed byte on. All other contents, like unchanged files,
+		``<Runs>`` or elements not covered by the project model, are kept verbatim. If nothing changed, the file isn't
+		written at all. If the file wasn't modified since it was read by :meth:`Parse`, the fileset locations recorded while
+		parsing are used. Otherwise, the file is scanned first.
+
+		:arg project:     The project model to write. Default: the model created by :meth:`Parse`.
+		:arg incremental: If true, update an existing file in place.
+		:returns:         True, if the file was written.
+		"""
+		if project is None:
+			project = self._xprProject
+		if project is None:
+			raise Exception(f"No project model to write to '{self._path!s}'.")
+
+		writer = _XPRWriter()
+		if incremental and self._path.exists():
+			content = self._path.read_bytes()
+			edits = self._Patch(content, project, writer)
+			if len(edits) == 0:
+				return False
+
+			self._snapshot = None
+			position = edits[0][0]
+			with self._path.open("r+b") as file:
+				file.seek(position)
+				for start, end, replacement in edits:
+					file.write(content[position:start])
+					file.write(replacement)
+					position = end
+				file.write(content[position:])
+				file.truncate()
+
+			return True
+
+		self._snapshot = None
+		temporaryPath = self._path.with_name(f"{self._path.name}.{getpid()}.tmp")
 		try:
-			root = minidom.parse(str(self._path)).documentElement
-		except Exception as ex:
-			raise Exception(f"Couldn't open '{self._path!s}'.") from ex
-
-		self._xprProject = Project(self._path.stem, rootDirectory=self._path.parent)
-		self._ParseRootElement(root)
-
-	def _ParseRootElement(self, root):
-		for rootNode in root.childNodes:
-			if rootNode.nodeName == "FileSets":
-				self._ParseFileSets(rootNode)
-				break
-
-	def _ParseFileSets(self, filesetsNode):
-		for fileSetsNode in filesetsNode.childNodes:
-			if fileSetsNode.nodeType == Node.ELEMENT_NODE and fileSetsNode.tagName == "FileSet":
-				self._ParseFileSet(fileSetsNode)
-
-	def _ParseFileSet(self, filesetNode):
-		filesetName = filesetNode.getAttribute("Name")
-		fileset = FileSet(filesetName, design=self._xprProject.DefaultDesign)
-
-		for fileNode in filesetNode.childNodes:
-			if fileNode.nodeType == Node.ELEMENT_NODE:
-				if fileNode.tagName == "File":
-					self._ParseFile(fileNode, fileset)
-				elif fileNode.nodeType == Node.ELEMENT_NODE and fileNode.tagName == "Config":
-					self._ParseFileSetConfig(fileNode, fileset)
-
-	def _ParseFile(self, fileNode, fileset):
-		croppedPath = fileNode.getAttribute("Path").replace("$PPRDIR/", "")
-		filePath = Path(croppedPath)
-		if filePath.suffix in (".vhd", ".vhdl"):
-			self._ParseVHDLFile(fileNode, filePath, fileset)
-		elif filePath.suffix == ".xdc":
-			self._ParseXDCFile(fileNode, filePath, fileset)
-		elif filePath.suffix == ".v":
-			self._ParseVerilogFile(fileNode, filePath, fileset)
-		elif filePath.suffix == ".xci":
-			self._ParseXCIFile(fileNode, filePath, fileset)
+			with temporaryPath.open("wb") as file:
+				for chunk in writer.RenderProject(project, self._path.resolve()):
+					file.write(chunk.encode("utf-8"))
+			os_replace(temporaryPath, self._path)
+		finally:
+			temporaryPath.unlink(missing_ok=True)
+
+		return True
+
+	def _Patch(self, content: bytes, project: Project, writer: _XPRWriter) -> List[Tuple[int, int, bytes]]:
+		"""
+		Compute the edits, which update the ``<FileSets>`` element of an existing project file to a project model.
+
+		Filesets, which are at the same position in the file and in the model, are replaced one by one, if they changed.
+		From the first added, removed or reordered fileset on, all remaining filesets are replaced at once.
+
+		:arg content: Content of the existing project file.
+		:arg project: The project model to write.
+		:arg writer:  Renderer of changed filesets and files.
+		:returns:     Edits as byte range and replacement, ordered by position.
+		"""
+		snapshot = self._snapshot
+		if snapshot is not None and snapshot[0] == sha256(content).digest() and all(location[3] > location[2] for location in snapshot[2]):
+			fileSetsEnd = snapshot[1]
+			# convert the position of each end tag to the end of the element
+			locations = [location[:3] + [content.index(b">", location[3]) + 1] + location[4:] for location in snapshot[2]]
+			recorded = True
 		else:
-			self._ParseDefaultFile(fileNode, filePath, fileset)
+			parser = expat.ParserCreate()
+			locator = _XPRLocator(parser)
+			try:
+				parser.Parse(content, True)
+			except expat.ExpatError as ex:
+				raise Exception(f"Couldn't parse '{self._path!s}'.") from ex
 
-	def _ParseVHDLFile(self, fileNode, path, fileset):
-		vhdlFile = VHDLSourceFile(path)
-		fileset.AddFile(vhdlFile)
-		usedInAttr = vhdlFile[UsedInAttribute]
+			fileSetsEnd = locator.FileSetsEnd
+			locations = locator.FileSets
+			recorded = False
 
-		for childNode in fileNode.childNodes:
-			if childNode.nodeType == Node.ELEMENT_NODE and childNode.tagName == "FileInfo":
-				if childNode.getAttribute("SFType") == "VHDL2008":
-					vhdlFile.VHDLVersion = VHDLVersion.VHDL2008
-				else:
-					vhdlFile.VHDLVersion = VHDLVersion.VHDL93
+		if fileSetsEnd is None:
+			raise Exception(f"Vivado project file '{self._path!s}' has no FileSets element.")
+
+		def render(fileSet: FileSet) -> Nullable[bytes]:
+			"""Return the markup of a fileset or ``None``, if its location in the file is unchanged."""
+			location = locationsByName.get(fileSet.Name)
+			if location is None:
+				return "".join(writer.RenderFileSet(fileSet, "    "))[4:].encode("utf-8")
+
+			newInfos = [writer.FileInfo(file) for file in fileSet.Files()]
+			newOptions = writer.ConfigOptions(fileSet)
+			oldInfos = location[5] if recorded else [_XPRLocator.FileInfo(child) for child in location[5] if child[0] == "File"]
+			sameType = not isinstance(fileSet, VivadoFileSet) or fileSet.FileSetType == location[1]
+			if sameType and oldInfos == newInfos and location[6] == newOptions:
+				return None
+			elif recorded:
+				# recorded locations don't cover the children, so scan the fileset's markup
+				fileSetContent = b"<Project><FileSets>" + content[location[2]:location[3]] + b"</FileSets></Project>"
+				parser = expat.ParserCreate()
+				locator = _XPRLocator(parser)
+				parser.Parse(fileSetContent, True)
+				return self._PatchFileSet(fileSetContent, locator.FileSets[0], fileSet, writer, newInfos, newOptions)
+			else:
+				return self._PatchFileSet(content, location, fileSet, writer, newInfos, newOptions)
+
+		def whitespaceStart(index: int) -> int:
+			while index > 0 and content[index - 1] in b" \t\r\n":
+				index -= 1
+			return index
+
+		locationsByName = {location[0]: location for location in locations}
+		fileSets = list(writer.WrittenFileSets(project))
+
+		edits = []
+		index = 0
+		while index < len(locations) and index < len(fileSets) and locations[index][0] == fileSets[index].Name:
+			if (markup := render(fileSets[index])) is not None:
+				edits.append((whitespaceStart(locations[index][2]), locations[index][3], b"\n    " + markup))
+			index += 1
+
+		if index < len(locations) or index < len(fileSets):
+			markups = []
+			for fileSet in fileSets[index:]:
+				markup = render(fileSet)
+				if markup is None:
+					location = locationsByName[fileSet.Name]
+					markup = content[location[2]:location[3]]
+				markups.append(b"\n    " + markup)
+
+			if index < len(locations):
+				edits.append((whitespaceStart(locations[index][2]), locations[-1][3], b"".join(markups)))
+			else:
+				edits.append((whitespaceStart(fileSetsEnd), fileSetsEnd, b"".join(markups) + b"\n  "))
+
+		return edits
+
+	@staticmethod
+	def _PatchFileSet(
+		content: bytes,
+		location: List,
+		fileSet: FileSet,
+		writer: _XPRWriter,
+		newInfos: List[Tuple[str, Nullable[str], Nullable[str], Tuple[str, ...]]],
+		newOptions: List[Tuple[str, str]]
+	) -> bytes:
+		_, fileSetType, start, end, headerEnd, children, oldOptions = location
+
+		sameType = not isinstance(fileSet, VivadoFileSet) or fileSet.FileSetType == fileSetType
+		if headerEnd is None or not sameType:
+			return "".join(writer.RenderFileSet(fileSet, "    "))[4:].encode("utf-8")
+
+		# reuse the markup of unchanged files
+		unchangedFiles: Dict[Tuple, List[List]] = {}
+		for child in children:
+			if child[0] == "File":
+				unchangedFiles.setdefault(_XPRLocator.FileInfo(child), []).append(child)
+
+		lines = [content[start:headerEnd]]
+		lines.extend(b"      " + content[child[1]:child[2]] for child in children if child[0] == "Filter")
+		for info in newInfos:
+			candidates = unchangedFiles.get(info)
+			if candidates:
+				child = candidates.pop(0)
+				lines.append(b"      " + content[child[1]:child[2]])
+			else:
+				lines.append(writer.RenderFile(info, "      ").encode("utf-8"))
+
+		if oldOptions == newOptions:
+			lines.extend(b"      " + content[child[1]:child[2]] for child in children if child[0] == "Config")
+		elif len(newOptions) > 0:
+			lines.append(writer.RenderConfig(newOptions, "      ").encode("utf-8"))
+
+		lines.extend(b"      " + content[child[1]:child[2]] for child in children if child[0] not in ("Filter", "File", "Config"))
+		lines.append(b"    </FileSet>")
+		return b"\n".join(lines)
+
+	def ParseIPCores(self, maxWorkers: Nullable[int] = None) -> None:
+		"""
+		Parse all IP core instantiation files (``*.xci``) of the project model and set their :class:`IPCoreAttribute`.
+
+		Files are parsed concurrently by a process pool. Results are memoized per content hash, so identical or already
+		parsed files (e.g. in repeated calls) aren't parsed again.
+
+		:arg maxWorkers: Maximum number of worker processes. If 1, all files are parsed in this process.
+		"""
+		if self._xprProject is None:
+			raise Exception(f"Vivado project file '{self._path!s}' isn't parsed yet.")
 
-				for fileAttribute in childNode.childNodes:
-					if fileAttribute.nodeType == Node.ELEMENT_NODE and fileAttribute.tagName == "Attr":
-						if fileAttribute.getAttribute("Name") == "Library":
-							libraryName = fileAttribute.getAttribute("Val")
-							vhdlFile.VHDLLibrary = fileset.GetOrCreateVHDLLibrary(libraryName)
-						elif fileAttribute.getAttribute("Val") == "UsedIn":
-							usedInAttr.append(fileAttribute.getAttribute("Val"))
+		pendingFiles: Dict[str, List[IPCoreInstantiationFile]] = {}
+		pendingContents: List[Tuple[str, str, bytes]] = []
+		for file in self._xprProject.DefaultDesign.Files(IPCoreInstantiationFile):
+			path = file.ResolvedPath
+			try:
+				content = path.read_bytes()
+			except OSError as ex:
+				raise Exception(f"IP core instantiation file '{path}' not found.") from ex
 
-	def _ParseDefaultFile(self, _, path, fileset):
-		File(path, fileSet=fileset)
+			key = sha256(content).hexdigest()
+			instance = _IP_CORES.get(key)
+			if instance is not None:
+				file[IPCoreAttribute] = instance
+			elif key in pendingFiles:
+				pendingFiles[key].append(file)
+			else:
+				pendingFiles[key] = [file]
+				pendingContents.append((key, str(path), content))
 
-	def _ParseXDCFile(self, _, path, fileset):
-		XDCConstraintFile(path, fileSet=fileset)
+		if len(pendingContents) == 0:
+			return
 
-	def _ParseVerilogFile(self, _, path, fileset):
-		VerilogSourceFile(path, fileSet=fileset)
+		keys, paths, contents = zip(*pendingContents)
+		if maxWorkers == 1 or len(pendingContents) == 1:
+			instances = map(_ParseIPCore, paths, contents)
+		else:
+			with ProcessPoolExecutor(max_workers=maxWorkers) as executor:
+				instances = list(executor.map(_ParseIPCore, paths, contents, chunksize=8))
+
+		for key, instance in zip(keys, instances):
+			_IP_CORES[key] = instance
+			for file in pendingFiles[key]:
+				file[IPCoreAttribute] = instance
 
-	def _ParseXCIFile(self, _, path, fileset):
-		IPCoreInstantiationFile(path, fileSet=fileset)
+	def _ParseElement(self, root, reader: _XPRReader):
+		# walk the DOM iteratively and emit the same events as the expat parser
+		stack = [(root, False)]
+		while len(stack) > 0:
+			node, visited = stack.pop()
+			if node.nodeType == Node.TEXT_NODE:
+				reader.CharacterData(node.data)
+				continue
+			elif visited:
+				reader.EndElement(node.tagName)
+				continue
 
-	def _ParseFileSetConfig(self, fileNode, fileset):
-		for option in fileNode.childNodes:
-			if option.nodeType == Node.ELEMENT_NODE and option.tagName == "Option":
-				if option.getAttribute("Name") == "TopModule":
-					fileset.TopLevel = option.getAttribute("Val")
+			reader.StartElement(node.tagName, dict(node.attributes.items()))
+			stack.append((node, True))
+			stack.extend((child, False) for child in reversed(node.childNodes) if child.nodeType in (Node.ELEMENT_NODE, Node.TEXT_NODE))
 
 
 @export
@@ -201,5 +1204,230 @@ class IPCoreDescriptionFile(XMLFile):
 
 
 @export
-class IPCoreInstantiationFile(XMLFile):
+class IPCoreInstance(metaclass=ExtendedType, slots=True):
+	"""
+	Metadata of an IP core instance read from an IP core instantiation file (``*.xci``).
+
+	:arg name:              The instance name.
+	:arg vlnv:              The IP core's VLNV (``vendor:library:name:version``).
+	:arg parameters:        User-visible component parameters (``PARAM_VALUE`` or ``component_parameters``).
+	:arg modelParameters:   Model parameters (``MODELPARAM_VALUE`` or ``model_parameters``).
+	:arg projectParameters: Project parameters like part or architecture.
+	:arg runtimeParameters: Runtime parameters like the output directory of generated files.
+	"""
+
+	_name:              str
+	_vlnv:              str
+	_parameters:        Dict[str, str]
+	_modelParameters:   Dict[str, str]
+	_projectParameters: Dict[str, str]
+	_runtimeParameters: Dict[str, str]
+
+	def __init__(
+		self,
+		name: str,
+		vlnv: str,
+		parameters: Dict[str, str] = None,
+		modelParameters: Dict[str, str] = None,
+		projectParameters: Dict[str, str] = None,
+		runtimeParameters: Dict[str, str] = None
+	):
+		self._name = name
+		self._vlnv = vlnv
+		self._parameters = {} if parameters is None else parameters
+		self._modelParameters = {} if modelParameters is None else modelParameters
+		self._projectParameters = {} if projectParameters is None else projectParameters
+		self._runtimeParameters = {} if runtimeParameters is None else runtimeParameters
+
+	@property
+	def Name(self) -> str:
+		return self._name
+
+	@property
+	def VLNV(self) -> str:
+		"""Read-only property returning the IP core's VLNV, e.g. ``xilinx.com:ip:clk_wiz:6.0``."""
+		return self._vlnv
+
+	@property
+	def Vendor(self) -> str:
+		return self._vlnv.split(":")[0]
+
+	@property
+	def Library(self) -> str:
+		return self._vlnv.split(":")[1]
+
+	@property
+	def CoreName(self) -> str:
+		return self._vlnv.split(":")[2]
+
+	@property
+	def Version(self) -> str:
+		return self._vlnv.split(":")[3]
+
+	@property
+	def Parameters(self) -> Dict[str, str]:
+		return self._parameters
+
+	@property
+	def ModelParameters(self) -> Dict[str, str]:
+		return self._modelParameters
+
+	@property
+	def ProjectParameters(self) -> Dict[str, str]:
+		return self._projectParameters
+
+	@property
+	def RuntimeParameters(self) -> Dict[str, str]:
+		return self._runtimeParameters
+
+	@property
+	def OutputDirectory(self) -> Nullable[str]:
+		"""Read-only property returning the directory of generated output products, relative to the ``*.xci`` file."""
+		return self._runtimeParameters.get("OUTPUTDIR")
+
+	@classmethod
+	def Parse(cls, content: bytes) -> 'IPCoreInstance':
+		"""
+		Parse the contents of an IP core instantiation file. Both formats, IP-XACT based XML and JSON (since Vivado 2022.1),
+		are supported.
+
+		:arg content: Contents of a ``*.xci`` file.
+		:returns:     The IP core instance.
+		"""
+		if content.lstrip()[:1] == b"{":
+			return cls._ParseJSON(content)
+		else:
+			return cls._ParseXML(content)
+
+	@classmethod
+	def _ParseJSON(cls, content: bytes) -> 'IPCoreInstance':
+		instance = json_loads(content)["ip_inst"]
+		parameters = instance.get("parameters", {})
+
+		def values(group: str) -> Dict[str, str]:
+			return {name: entries[0].get("value", "") if len(entries) > 0 else "" for name, entries in parameters.get(group, {}).items()}
+
+		runtimeParameters = values("runtime_parameters")
+		if "OUTPUTDIR" not in runtimeParameters and "gen_directory" in instance:
+			runtimeParameters["OUTPUTDIR"] = instance["gen_directory"]
+
+		return cls(
+			instance.get("xci_name", ""),
+			instance.get("component_reference", ""),
+			values("component_parameters"),
+			values("model_parameters"),
+			values("project_parameters"),
+			runtimeParameters
+		)
+
+	@classmethod
+	def _ParseXML(cls, content: bytes) -> 'IPCoreInstance':
+		def attribute(element, name: str) -> str:
+			# IP-XACT attributes are namespace qualified, but the namespace depends on the schema version
+			for key, value in element.attrib.items():
+				if key == name or key.endswith(f"}}{name}"):
+					return value
+			return ""
+
+		componentInstance = ElementTree.fromstring(content).find(".//{*}componentInstance")
+		if componentInstance is None:
+			raise Exception("No component instance in IP core instantiation file.")
+
+		name = componentInstance.findtext("{*}instanceName", "")
+		reference = componentInstance.find("{*}componentRef")
+		vlnv = ":".join(attribute(reference, key) for key in ("vendor", "library", "name", "version")) if reference is not None else ""
+
+		groups = {
+			"PARAM_VALUE":      {},
+			"MODELPARAM_VALUE": {},
+			"PROJECT_PARAM":    {},
+			"RUNTIME_PARAM":    {},
+		}
+		for element in componentInstance.iterfind("{*}configurableElementValues/{*}configurableElementValue"):
+			group, _, parameter = attribute(element, "referenceId").partition(".")
+			if group in groups:
+				groups[group][parameter] = element.text or ""
+
+		return cls(name, vlnv, groups["PARAM_VALUE"], groups["MODELPARAM_VALUE"], groups["PROJECT_PARAM"], groups["RUNTIME_PARAM"])
+
+
+@export
+class IPCoreAttribute(Attribute):
+	KEY = "IPCore"
+	VALUE_TYPE = Nullable[IPCoreInstance]
+
+
+@export
+class IPCoreInstantiationFile(XMLFile, VivadoFileMixIn):
 	"""A Vivado IP core instantiation file (Xilinx IPCore Instance; ``*.xci``)."""
+
+	def _registerAttributes(self):
+		super()._registerAttributes()
+		VivadoFileMixIn._registerAttributes(self)
+		self._attributes[IPCoreAttribute] = None
+
+	@property
+	def IPCore(self) -> Nullable[IPCoreInstance]:
+		"""Read-only property returning the IP core instance, after the file was parsed."""
+		return self._attributes[IPCoreAttribute]
+
+	def Parse(self) -> IPCoreInstance:
+		"""
+		Parse this IP core instantiation file and set the :class:`IPCoreAttribute`.
+
+		:returns: The IP core instance.
+		"""
+		path = self.ResolvedPath
+		try:
+			content = path.read_bytes()
+		except OSError as ex:
+			raise Exception(f"IP core instantiation file '{path}' not found.") from ex
+
+		self._attributes[IPCoreAttribute] = instance = _ParseIPCore(str(path), content)
+		return instance
+
+
+#: Parsed IP core instances by SHA-256 hash of the ``*.xci`` file's content.
+_IP_CORES: Dict[str, IPCoreInstance] = {}
+
+
+def _ParseIPCore(path: str, content: bytes) -> IPCoreInstance:
+	try:
+		return IPCoreInstance.Parse(content)
+	except Exception as ex:
+		raise Exception(f"Couldn't parse IP core instantiation file '{path}'.") from ex
+
+
+@export
+class BlockDesignFile(File, JSONContent):
+	"""A Vivado block design file (``*.bd``)."""
+
+
+@export
+class WaveformConfigFile(Model_WaveformConfigFile, XMLContent, VivadoFileMixIn):
+	"""A Vivado simulator waveform configuration file (``*.wcfg``)."""
+
+	def _registerAttributes(self):
+		super()._registerAttributes()
+		VivadoFileMixIn._registerAttributes(self)
+
+
+@export
+class MemoryInitializationFile(File, HumanReadableContent):
+	"""A memory initialization file (``*.mem``)."""
+
+
+@export
+class CoefficientFile(File, HumanReadableContent):
+	"""A coefficient file for IP cores (``*.coe``)."""
+
+
+#: File types of files in Vivado projects by suffix. Unknown suffixes fall back to the global registry, then to
+#: Vivado's :class:`File`. Vivado-specific suffixes are only registered here, not in :attr:`FileType.FileSuffixes`.
+VivadoFileTypes = FileTypeRegistry((VHDLSourceFile, VerilogSourceFile, SystemVerilogSourceFile, TCLSourceFile), default=File)
+VivadoFileTypes.Register(XDCConstraintFile,        (".xdc", ))
+VivadoFileTypes.Register(IPCoreInstantiationFile,  (".xci", ))
+VivadoFileTypes.Register(BlockDesignFile,          (".bd", ))
+VivadoFileTypes.Register(WaveformConfigFile,       (".wcfg", ))
+VivadoFileTypes.Register(MemoryInitializationFile, (".mem", ))
+VivadoFileTypes.Register(CoefficientFile,          (".coe", ))
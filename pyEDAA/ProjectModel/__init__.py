@@ -37,17 +37,28 @@ __license__ =   "Apache License, Version 2.0"
 __version__ =   "0.4.3"
 __keywords__ =  ["eda project", "model", "abstract", "xilinx", "vivado", "osvvm", "file set", "file group", "test bench", "test harness"]
 
-from os.path import relpath as path_relpath
+from collections         import deque
+from concurrent.futures  import ThreadPoolExecutor
+from enum    import Enum
+from fnmatch import translate as fnmatch_translate
+from heapq   import merge as heapq_merge
+from os      import scandir
+from os.path import relpath as path_relpath, normpath as path_normpath
+from re      import compile as re_compile
+from stat    import S_ISREG
 from pathlib import Path as pathlib_Path
-from typing  import Dict, Union, Optional as Nullable, List, Iterable, Generator, Tuple, Any as typing_Any, Type
+from typing  import Callable, Dict, Union, Optional as Nullable, List, Iterable, Generator, Tuple, Any as typing_Any, Type, Mapping
 
 from pyTooling.Decorators  import export
 from pyTooling.MetaClasses import ExtendedType
-from pyTooling.Graph       import Graph, Vertex
+from pyTooling.Graph       import Graph, Vertex, Component
 from pySVModel             import VerilogVersion, SystemVerilogVersion
 from pyVHDLModel           import VHDLVersion
 
 
+#: Effective settings of a fileset, design or project: VHDL library, VHDL version, Verilog version, SystemVerilog version.
+Settings = Tuple[Nullable['VHDLLibrary'], Nullable[VHDLVersion], Nullable[VerilogVersion], Nullable[SystemVerilogVersion]]
+
 @export
 class Attribute:
 	KEY: str
@@ -55,14 +66,57 @@ class Attribute:
 
 	@staticmethod
 	def resolve(obj: typing_Any, key: Type['Attribute']):
-		if isinstance(obj, File):
-			return obj._fileSet[key]
-		elif isinstance(obj, FileSet):
-			return obj._design[key]
-		elif isinstance(obj, Design):
-			return obj._project[key]
-		else:
-			raise Exception("Resolution error")
+		"""
+		Resolve an attribute, which isn't set on ``obj`` itself, from the parent objects of ``obj``.
+
+		The lookup uses the cached effective attributes of the parent object, which combine the attributes of all parent
+		levels (fileset(s), design, project).
+		"""
+		attributes = obj._InheritedAttributes()
+		if attributes is not None and key in attributes:
+			return attributes[key]
+
+		raise Exception(f"Resolution error: attribute '{key.__name__}' is neither set on '{obj}' nor on a parent object.")
+
+
+def _ResolveEffectiveAttributes(obj: typing_Any) -> Nullable[Dict[Type[Attribute], typing_Any]]:
+	"""
+	Returns the effective attributes of a fileset, design or project (or ``None`` for ``obj=None``).
+
+	A cache is valid only if its parent's effective attributes are unchanged, so all parent levels are checked. They are
+	collected in one walk up to the project, then the caches are checked and rebuilt if needed from the top down.
+	"""
+	chain = []
+	while obj is not None:
+		chain.append(obj)
+		obj = obj._AttributeParent()
+
+	effective = None
+	for obj in reversed(chain):
+		effective = obj._UpdateEffectiveAttributes(effective)
+
+	return effective
+
+
+@export
+class ValidationException(Exception):
+	"""
+	Raised by :meth:`Project.Validate` in concurrent mode, if one or more entities failed validation.
+
+	:arg message: Exception message.
+	:arg errors:  List of pairs of failed entity and the raised validation exception.
+	"""
+
+	_errors: List[Tuple[typing_Any, Exception]]
+
+	def __init__(self, message: str, errors: List[Tuple[typing_Any, Exception]]):
+		super().__init__(message)
+		self._errors = errors
+
+	@property
+	def Errors(self) -> List[Tuple[typing_Any, Exception]]:
+		"""Read-only property returning the list of failed entities (project, design, fileset, file) and their exception."""
+		return self._errors
 
 
 @export
@@ -72,9 +126,17 @@ class FileType(ExtendedType):
 
 	Modifications done by this meta-class:
 	* Register all classes of type :class:`FileType` or derived variants in a class field :attr:`FileType.FileTypes` in this meta-class.
+	* Register all file suffixes declared by a class in a class field ``SUFFIXES`` in a class field
+	  :attr:`FileType.FileSuffixes` in this meta-class.
+
+	A name or suffix is registered only once. A later class of the same name, e.g. a tool-specific variant like
+	:class:`pyEDAA.ProjectModel.Xilinx.Vivado.VHDLSourceFile`, doesn't replace the registered class. Tool-specific
+	suffixes are registered in a :class:`FileTypeRegistry` of the tool, so the global lookup doesn't depend on the imported
+	modules.
 	"""
 
 	FileTypes: Dict[str, 'FileType'] = {}     #: Dictionary of all classes of type :class:`FileType` or derived variants
+	FileSuffixes: Dict[str, 'FileType'] = {}  #: Dictionary of file suffixes (lower case, incl. dot) mapping to file types
 	Any: 'FileType'
 
 	def __init__(cls, name: str, bases: Tuple[type, ...], dictionary: Dict[str, typing_Any], **kwargs):
@@ -83,7 +145,9 @@ class FileType(ExtendedType):
 
 	def __new__(cls, className, baseClasses, classMembers: Dict, *args, **kwargs):
 		fileType = super().__new__(cls, className, baseClasses, classMembers, *args, **kwargs)
-		cls.FileTypes[className] = fileType
+		cls.FileTypes.setdefault(className, fileType)
+		for suffix in classMembers.get("SUFFIXES", ()):
+			cls.FileSuffixes.setdefault(suffix, fileType)
 		return fileType
 
 	def __getattr__(cls, item) -> 'FileType':
@@ -112,6 +176,8 @@ class File(metaclass=FileType, slots=True):
 	:arg fileSet: Fileset the file is associated with.
 	"""
 
+	SUFFIXES = ()  #: File suffixes (lower case, incl. dot) identifying this file type.
+
 	_path:       pathlib_Path
 	_fileType:   'FileType'
 	_project:    Nullable['Project']
@@ -119,6 +185,9 @@ class File(metaclass=FileType, slots=True):
 	_fileSet:    Nullable['FileSet']
 	_attributes: Dict[Type[Attribute], typing_Any]
 
+	_resolvedPath: Nullable[pathlib_Path]
+	_resolvedBase: Nullable[pathlib_Path]
+
 	def __init__(
 		self,
 		path: pathlib_Path,
@@ -126,8 +195,7 @@ class File(metaclass=FileType, slots=True):
 		design: 'Design' = None,
 		fileSet: 'FileSet' = None
 	):
-		self._fileType =  getattr(FileTypes, self.__class__.__name__)
-		self._path =      path
+		self._Initialize(path, self.__class__)
 		if project is not None:
 			self._project = project
 			self._design =  design
@@ -141,14 +209,35 @@ class File(metaclass=FileType, slots=True):
 			design = fileSet._design
 			if design is not None:
 				self._project = design._project
-			else:
-				self._project = None
 			self._design =    design
 			self.FileSet =    fileSet
-		else:
-			self._project = None
-			self._design =  None
-			self._fileSet = None
+
+	def _Initialize(
+		self,
+		path: pathlib_Path,
+		fileType: 'FileType',
+		project: Nullable['Project'] = None,
+		design: Nullable['Design'] = None,
+		fileSet: Nullable['FileSet'] = None
+	) -> None:
+		"""
+		Initialize the fields of a file. The file isn't added to the given fileset.
+
+		This is shared by :meth:`__init__` and :meth:`FileSet.AddPaths`, which adds many files at once.
+
+		:arg path:     Relative or absolute path to the file.
+		:arg fileType: File type registered for the file's class.
+		:arg project:  Project the file is associated with.
+		:arg design:   Design the file is associated with.
+		:arg fileSet:  Fileset the file is associated with.
+		"""
+		self._fileType =  fileType
+		self._path =      path
+		self._resolvedPath = None
+		self._resolvedBase = None
+		self._project = project
+		self._design =  design
+		self._fileSet = fileSet
 
 		self._attributes = {}
 		self._registerAttributes()
@@ -170,21 +259,35 @@ class File(metaclass=FileType, slots=True):
 
 	@property
 	def ResolvedPath(self) -> pathlib_Path:
-		"""Read-only property returning the resolved path of this file."""
+		"""
+		Read-only property returning the resolved path of this file.
+
+		The resolved path is cached. The cache is dropped if the fileset's resolved path changes.
+		"""
 		if self._path.is_absolute():
-			return self._path.resolve()
+			base = None
 		elif self._fileSet is not None:
-			path = (self._fileSet.ResolvedPath / self._path).resolve()
-
-			if path.is_absolute():
-				return path
-			else:
-				# WORKAROUND: https://stackoverflow.com/questions/67452690/pathlib-path-relative-to-vs-os-path-relpath
-				return pathlib_Path(path_relpath(path, pathlib_Path.cwd()))
+			base = self._fileSet.ResolvedPath
 		else:
 			# TODO: message and exception type
 			raise Exception("")
 
+		if self._resolvedPath is not None and self._resolvedBase is base:
+			return self._resolvedPath
+
+		if base is None:
+			path = self._path.resolve()
+		else:
+			path = (base / self._path).resolve()
+
+			if not path.is_absolute():
+				# WORKAROUND: https://stackoverflow.com/questions/67452690/pathlib-path-relative-to-vs-os-path-relpath
+				path = pathlib_Path(path_relpath(path, pathlib_Path.cwd()))
+
+		self._resolvedPath = path
+		self._resolvedBase = base
+		return path
+
 	@property
 	def Project(self) -> Nullable['Project']:
 		"""Property setting or returning the project this file is used in."""
@@ -221,8 +324,7 @@ class File(metaclass=FileType, slots=True):
 
 	@FileSet.setter
 	def FileSet(self, value: 'FileSet') -> None:
-		self._fileSet = value
-		value._files.append(self)
+		value.AddFile(self)
 
 	def Validate(self):
 		"""Validate this file."""
@@ -232,9 +334,11 @@ class File(metaclass=FileType, slots=True):
 			path = self.ResolvedPath
 		except Exception as ex:
 			raise Exception(f"Validation: File '{self._path}' could not compute resolved path.") from ex
-		if not path.exists():
-			raise Exception(f"Validation: File '{self._path}' (={path}) does not exist.")
-		if not path.is_file():
+		try:
+			mode = path.stat().st_mode
+		except OSError as ex:
+			raise Exception(f"Validation: File '{self._path}' (={path}) does not exist.") from ex
+		if not S_ISREG(mode):
 			raise Exception(f"Validation: File '{self._path}' (={path}) is not a file.")
 
 		if self._fileSet is None:
@@ -244,14 +348,18 @@ class File(metaclass=FileType, slots=True):
 		if self._project is None:
 			raise Exception(f"Validation: File '{self._path}' has no project.")
 
+	def _InheritedAttributes(self) -> Nullable[Dict[Type[Attribute], typing_Any]]:
+		"""Returns the effective attributes of the parent fileset."""
+		return _ResolveEffectiveAttributes(self._fileSet)
+
 	def __getitem__(self, key: Type[Attribute]):
 		"""Index access for returning attributes on this file."""
 		if not issubclass(key, Attribute):
 			raise TypeError("Parameter 'key' is not an 'Attribute'.")
 
-		try:
+		if key in self._attributes:
 			return self._attributes[key]
-		except KeyError:
+		else:
 			return key.resolve(self, key)
 
 	def __setitem__(self, key: Type[Attribute], value: typing_Any):
@@ -314,16 +422,22 @@ class PythonContent(HumanReadableContent):
 class TextFile(File, HumanReadableContent):
 	"""A text file (``*.txt``)."""
 
+	SUFFIXES = (".txt", )
+
 
 @export
 class LogFile(File, HumanReadableContent):
 	"""A log file (``*.log``)."""
 
+	SUFFIXES = (".log", )
+
 
 @export
 class XMLFile(File, XMLContent):
 	"""An XML file (``*.xml``)."""
 
+	SUFFIXES = (".xml", )
+
 
 @export
 class SourceFile(File):
@@ -344,11 +458,15 @@ class NetlistFile(SourceFile):
 class EDIFNetlistFile(NetlistFile):
 	"""Netlist file in EDIF (Electronic Design Interchange Format)."""
 
+	SUFFIXES = (".edf", ".edif", ".edn")
+
 
 @export
 class TCLSourceFile(SourceFile, TCLContent):
 	"""A TCL source file."""
 
+	SUFFIXES = (".tcl", )
+
 
 @export
 class VHDLSourceFile(HDLSourceFile, HumanReadableContent):
@@ -366,6 +484,8 @@ class VHDLSourceFile(HDLSourceFile, HumanReadableContent):
 	_vhdlLibrary: 'VHDLLibrary'
 	_vhdlVersion: VHDLVersion
 
+	SUFFIXES = (".vhd", ".vhdl")
+
 	def __init__(self, path: pathlib_Path, vhdlLibrary: Union[str, 'VHDLLibrary'] = None, vhdlVersion: VHDLVersion = None, project: 'Project' = None, design: 'Design' = None, fileSet: 'FileSet' = None):
 		super().__init__(path, project, design, fileSet)
 
@@ -382,14 +502,37 @@ class VHDLSourceFile(HDLSourceFile, HumanReadableContent):
 					raise Exception(f"VHDL library '{vhdlLibrary}' not found in default design '{project.DefaultDesign.Name}'.") from ex
 			else:
 				raise Exception(f"Can't lookup VHDL library because neither 'project' nor 'design' is given as a parameter.")
-		elif isinstance(vhdlLibrary, VHDLLibrary):
+		elif vhdlLibrary is not None and not isinstance(vhdlLibrary, VHDLLibrary):
+			raise TypeError(f"Parameter 'vhdlLibrary' is neither a 'str' nor 'VHDLLibrary'.")
+
+		if vhdlLibrary is not None:
 			self._vhdlLibrary = vhdlLibrary
 			vhdlLibrary.AddFile(self)
-		elif vhdlLibrary is None:
-			self._vhdlLibrary = None
-		else:
-			raise TypeError(f"Parameter 'vhdlLibrary' is neither a 'str' nor 'VHDLibrary'.")
+		self._vhdlVersion = vhdlVersion
 
+	def _Initialize(
+		self,
+		path: pathlib_Path,
+		fileType: 'FileType',
+		project: Nullable['Project'] = None,
+		design: Nullable['Design'] = None,
+		fileSet: Nullable['FileSet'] = None,
+		vhdlLibrary: Nullable['VHDLLibrary'] = None,
+		vhdlVersion: Nullable[VHDLVersion] = None
+	) -> None:
+		"""
+		Initialize the fields of a VHDL source file. The file isn't added to the given fileset and VHDL library.
+
+		:arg path:        Relative or absolute path to the file.
+		:arg fileType:    File type registered for the file's class.
+		:arg project:     Project the file is associated with.
+		:arg design:      Design the file is associated with.
+		:arg fileSet:     Fileset the file is associated with.
+		:arg vhdlLibrary: VHDL library the file is associated with.
+		:arg vhdlVersion: VHDL version of the file.
+		"""
+		File._Initialize(self, path, fileType, project, design, fileSet)
+		self._vhdlLibrary = vhdlLibrary
 		self._vhdlVersion = vhdlVersion
 
 	def Validate(self):
@@ -411,9 +554,11 @@ class VHDLSourceFile(HDLSourceFile, HumanReadableContent):
 		if self._vhdlLibrary is not None:
 			return self._vhdlLibrary
 		elif self._fileSet is not None:
-			return self._fileSet.VHDLLibrary
-		else:
-			raise Exception("VHDLLibrary was neither set locally nor globally.")
+			vhdlLibrary = self._fileSet._EffectiveSettings()[0]
+			if vhdlLibrary is not None:
+				return vhdlLibrary
+
+		raise Exception("VHDLLibrary was neither set locally nor globally.")
 
 	@VHDLLibrary.setter
 	def VHDLLibrary(self, value: 'VHDLLibrary') -> None:
@@ -426,9 +571,11 @@ class VHDLSourceFile(HDLSourceFile, HumanReadableContent):
 		if self._vhdlVersion is not None:
 			return self._vhdlVersion
 		elif self._fileSet is not None:
-			return self._fileSet.VHDLVersion
-		else:
-			raise Exception("VHDLVersion was neither set locally nor globally.")
+			vhdlVersion = self._fileSet._EffectiveSettings()[1]
+			if vhdlVersion is not None:
+				return vhdlVersion
+
+		raise Exception("VHDLVersion was neither set locally nor globally.")
 
 	@VHDLVersion.setter
 	def VHDLVersion(self, value: VHDLVersion) -> None:
@@ -444,6 +591,8 @@ class VerilogSourceFile(HDLSourceFile, HumanReadableContent):
 
 	_verilogVersion: VerilogVersion
 
+	SUFFIXES = (".v", ".vh")
+
 	def __init__(self, path: pathlib_Path, verilogVersion: VerilogVersion = None, project: 'Project' = None, design: 'Design' = None, fileSet: 'FileSet' = None):
 		super().__init__(path, project, design, fileSet)
 
@@ -455,9 +604,11 @@ class VerilogSourceFile(HDLSourceFile, HumanReadableContent):
 		if self._verilogVersion is not None:
 			return self._verilogVersion
 		elif self._fileSet is not None:
-			return self._fileSet.VerilogVersion
-		else:
-			raise Exception("VerilogVersion was neither set locally nor globally.")
+			verilogVersion = self._fileSet._EffectiveSettings()[2]
+			if verilogVersion is not None:
+				return verilogVersion
+
+		raise Exception("VerilogVersion was neither set locally nor globally.")
 
 	@VerilogVersion.setter
 	def VerilogVersion(self, value: VerilogVersion) -> None:
@@ -470,6 +621,8 @@ class SystemVerilogSourceFile(HDLSourceFile, HumanReadableContent):
 
 	_svVersion: SystemVerilogVersion
 
+	SUFFIXES = (".sv", ".svh")
+
 	def __init__(self, path: pathlib_Path, svVersion: SystemVerilogVersion = None, project: 'Project' = None, design: 'Design' = None, fileSet: 'FileSet' = None):
 		super().__init__(path, project, design, fileSet)
 
@@ -481,9 +634,11 @@ class SystemVerilogSourceFile(HDLSourceFile, HumanReadableContent):
 		if self._svVersion is not None:
 			return self._svVersion
 		elif self._fileSet is not None:
-			return self._fileSet.SVVersion
-		else:
-			raise Exception("SVVersion was neither set locally nor globally.")
+			svVersion = self._fileSet._EffectiveSettings()[3]
+			if svVersion is not None:
+				return svVersion
+
+		raise Exception("SVVersion was neither set locally nor globally.")
 
 	@SVVersion.setter
 	def SVVersion(self, value: SystemVerilogVersion) -> None:
@@ -494,6 +649,8 @@ class SystemVerilogSourceFile(HDLSourceFile, HumanReadableContent):
 class PythonSourceFile(SourceFile, PythonContent):
 	"""A Python source file."""
 
+	SUFFIXES = (".py", )
+
 
 # TODO: move to a Cocotb module
 @export
@@ -515,11 +672,15 @@ class ProjectFile(File):
 class CSourceFile(SourceFile):
 	"""Base-class of all ANSI-C source files."""
 
+	SUFFIXES = (".c", ".h")
+
 
 @export
 class CppSourceFile(SourceFile):
 	"""Base-class of all ANSI-C++ source files."""
 
+	SUFFIXES = (".cpp", ".cc", ".cxx", ".hpp", ".hh")
+
 
 @export
 class SettingFile(File):
@@ -561,6 +722,86 @@ class WaveformExchangeFile(File):
 	"""Base-class of all tool-independent waveform exchange files."""
 
 
+@export
+class FileTypeRegistry(metaclass=ExtendedType, slots=True):
+	"""
+	A registry to classify files by suffix, e.g. files listed in a tool's project file.
+
+	Suffixes not registered in a registry are looked up in its parent registry. The last fallback is the global registry
+	:attr:`FileType.FileSuffixes`, which is filled from the ``SUFFIXES`` class fields of all file types. A registry can be
+	passed as ``fileTypes`` to :meth:`FileSet.Import`.
+
+	:arg fileTypes: File types to register by their ``SUFFIXES`` class field.
+	:arg parent:    Optional parent registry.
+	:arg default:   File type of files with unknown suffix. Default: the parent's default or :class:`File`.
+	"""
+
+	_suffixes: Dict[str, FileType]
+	_parent:   Nullable['FileTypeRegistry']
+	_default:  FileType
+
+	def __init__(self, fileTypes: Iterable[FileType] = (), parent: Nullable['FileTypeRegistry'] = None, default: Nullable[FileType] = None):
+		self._suffixes = {}
+		self._parent = parent
+		if default is None:
+			default = File if parent is None else parent._default
+		self._default = default
+
+		for fileType in fileTypes:
+			self.Register(fileType)
+
+	@property
+	def Default(self) -> FileType:
+		"""Read-only property returning the file type of files with unknown suffix."""
+		return self._default
+
+	def Register(self, fileType: FileType, suffixes: Iterable[str] = None) -> None:
+		"""
+		Register a file type for suffixes.
+
+		:arg fileType: File type to register.
+		:arg suffixes: Suffixes (incl. dot) to register. Default: the file type's ``SUFFIXES`` class field.
+		"""
+		if suffixes is None:
+			suffixes = fileType.SUFFIXES
+		for suffix in suffixes:
+			self._suffixes[suffix.lower()] = fileType
+
+	def get(self, suffix: str, default: Nullable[FileType] = None) -> Nullable[FileType]:
+		"""
+		Look up a file type by suffix like :meth:`dict.get`.
+
+		:arg suffix:  Suffix (lower case, incl. dot).
+		:arg default: Value returned for unknown suffixes.
+		:returns:     The registered file type, otherwise ``default``.
+		"""
+		registry = self
+		while registry is not None:
+			fileType = registry._suffixes.get(suffix)
+			if fileType is not None:
+				return fileType
+			registry = registry._parent
+
+		return FileType.FileSuffixes.get(suffix, default)
+
+	def GetFileType(self, path: pathlib_Path) -> FileType:
+		"""
+		Classify a file by its suffix.
+
+		:arg path: Path of the file.
+		:returns:  The registered file type, otherwise the registry's default file type.
+		"""
+		return self.get(path.suffix.lower(), self._default)
+
+
+@export
+class TraversalOrder(Enum):
+	"""Order in which nested filesets are visited."""
+	PreOrder =     0   #: A fileset is visited before its sub-filesets.
+	PostOrder =    1   #: A fileset is visited after its sub-filesets.
+	BreadthFirst = 2   #: Filesets are visited level by level.
+
+
 @export
 class FileSet(metaclass=ExtendedType, slots=True):
 	"""
@@ -591,12 +832,22 @@ class FileSet(metaclass=ExtendedType, slots=True):
 	_parent:          Nullable['FileSet']
 	_fileSets:        Dict[str, 'FileSet']
 	_files:           List[File]
+	_fileTypeIndex:   Dict[FileType, List[int]]
+	_fileCount:       int
+	_fileTypeCounts:  Dict[FileType, int]
 	_attributes:      Dict[Type[Attribute], typing_Any]
+	_effectiveAttributes: Nullable[Dict[Type[Attribute], typing_Any]]
+	_effectiveBase:   Nullable[Dict[Type[Attribute], typing_Any]]
 	_vhdlLibraries:   Dict[str, 'VHDLLibrary']
 	_vhdlLibrary:     'VHDLLibrary'
 	_vhdlVersion:     VHDLVersion
 	_verilogVersion:  VerilogVersion
 	_svVersion:       SystemVerilogVersion
+	_settings:        Nullable[Settings]
+	_settingsBase:    Nullable[Settings]
+
+	_resolvedPath:    Nullable[pathlib_Path]
+	_resolvedBase:    Nullable[pathlib_Path]
 
 	def __init__(
 		self,
@@ -624,14 +875,23 @@ class FileSet(metaclass=ExtendedType, slots=True):
 			self._project = None
 			self._design =  None
 		self._directory = directory
-		self._parent =    parent
+		self._parent =    None
 		self._fileSets =  {}
 		self._files =     []
+		self._fileTypeIndex = {}
+		self._fileCount =     0
+		self._fileTypeCounts = {}
+		self._resolvedPath = None
+		self._resolvedBase = None
 
 		if design is not None:
 			design._fileSets[name] = self
+		if parent is not None:
+			self.Parent = parent
 
 		self._attributes =      {}
+		self._effectiveAttributes = None
+		self._effectiveBase =   None
 		self._vhdlLibraries =   {}
 
 		# TODO: handle if vhdlLibrary is a string
@@ -639,6 +899,8 @@ class FileSet(metaclass=ExtendedType, slots=True):
 		self._vhdlVersion =     vhdlVersion
 		self._verilogVersion =  verilogVersion
 		self._svVersion =       svVersion
+		self._settings =        None
+		self._settingsBase =    None
 
 	@property
 	def Name(self) -> str:
@@ -670,18 +932,22 @@ class FileSet(metaclass=ExtendedType, slots=True):
 	@property
 	def Design(self) -> Nullable['Design']:
 		"""Property setting or returning the design this fileset is used in."""
-		if self._design is not None:
-			return self._design
-		elif self._parent is not None:
-			return self._parent.Design
-		else:
-			return None
-			# TODO: raise exception instead
-			# QUESTION: how to handle if design and parent is set?
+		fileSet = self
+		while fileSet._design is None:
+			fileSet = fileSet._parent
+			if fileSet is None:
+				return None
+				# TODO: raise exception instead
+				# QUESTION: how to handle if design and parent is set?
+
+		return fileSet._design
 
 	@Design.setter
 	def Design(self, value: 'Design') -> None:
+		if self._design is not None:
+			self._design._fileIndex = None
 		self._design = value
+		value._fileIndex = None
 		if self._project is None:
 			self._project = value._project
 		elif self._project is not value._project:
@@ -695,29 +961,46 @@ class FileSet(metaclass=ExtendedType, slots=True):
 	@Directory.setter
 	def Directory(self, value: pathlib_Path) -> None:
 		self._directory = value
+		self._resolvedPath = None
+
+		design = self.Design
+		if design is not None:
+			design._fileIndex = None
 
 	@property
 	def ResolvedPath(self) -> pathlib_Path:
-		"""Read-only property returning the resolved path of this fileset."""
+		"""
+		Read-only property returning the resolved path of this fileset.
+
+		The resolved path is cached. The cache is dropped if the directory changes or if the resolved path of the parent
+		fileset, design or project changes.
+		"""
 		if self._directory.is_absolute():
-			return self._directory.resolve()
+			base = None
+		elif self._parent is not None:
+			base = self._parent.ResolvedPath
+		elif self._design is not None:
+			base = self._design.ResolvedPath
+		elif self._project is not None:
+			base = self._project.ResolvedPath
 		else:
-			if self._parent is not None:
-				directory = self._parent.ResolvedPath
-			elif self._design is not None:
-				directory = self._design.ResolvedPath
-			elif self._project is not None:
-				directory = self._project.ResolvedPath
-			else:
-				# TODO: message and exception type
-				raise Exception("")
+			# TODO: message and exception type
+			raise Exception("")
 
-			directory = (directory / self._directory).resolve()
-			if directory.is_absolute():
-				return directory
-			else:
+		if self._resolvedPath is not None and self._resolvedBase is base:
+			return self._resolvedPath
+
+		if base is None:
+			directory = self._directory.resolve()
+		else:
+			directory = (base / self._directory).resolve()
+			if not directory.is_absolute():
 				# WORKAROUND: https://stackoverflow.com/questions/67452690/pathlib-path-relative-to-vs-os-path-relpath
-				return pathlib_Path(path_relpath(directory, pathlib_Path.cwd()))
+				directory = pathlib_Path(path_relpath(directory, pathlib_Path.cwd()))
+
+		self._resolvedPath = directory
+		self._resolvedBase = base
+		return directory
 
 	@property
 	def Parent(self) -> Nullable['FileSet']:
@@ -726,8 +1009,22 @@ class FileSet(metaclass=ExtendedType, slots=True):
 
 	@Parent.setter
 	def Parent(self, value: 'FileSet') -> None:
+		oldParent = self._parent
+		if oldParent is not None and oldParent._fileSets.get(self._name) is self:
+			del oldParent._fileSets[self._name]
+			oldParent._UpdateFileCounts(self._fileTypeCounts, -1)
+
+		replacedFileSet = value._fileSets.get(self._name)
+		if replacedFileSet is not None and replacedFileSet is not self:
+			value._UpdateFileCounts(replacedFileSet._fileTypeCounts, -1)
+
 		self._parent = value
 		value._fileSets[self._name] = self
+		value._UpdateFileCounts(self._fileTypeCounts, 1)
+
+		design = self.Design
+		if design is not None:
+			design._fileIndex = None
 		# TODO: check it it already exists
 		# QUESTION: make an Add fileset method?
 
@@ -736,23 +1033,68 @@ class FileSet(metaclass=ExtendedType, slots=True):
 		"""Read-only property returning the dictionary of sub-filesets."""
 		return self._fileSets
 
-	def Files(self, fileType: FileType = FileTypes.Any, fileSet: Union[bool, str, 'FileSet'] = None) -> Generator[File, None, None]:
+	@staticmethod
+	def _Traverse(fileSets: Iterable['FileSet'], order: TraversalOrder) -> Generator['FileSet', None, None]:
+		"""
+		Iterate the given filesets and all their nested sub-filesets.
+
+		The hierarchy is traversed with an explicit stack (or queue), so the traversal is independent of the nesting depth
+		and doesn't hit Python's recursion limit.
+
+		:arg fileSets: Filesets to start from.
+		:arg order:    Order in which filesets are visited.
+		"""
+		if order is TraversalOrder.PostOrder:
+			for root in fileSets:
+				stack = [(root, iter(root._fileSets.values()))]
+				while stack:
+					fileSet, subFileSets = stack[-1]
+					subFileSet = next(subFileSets, None)
+					if subFileSet is None:
+						stack.pop()
+						yield fileSet
+					else:
+						stack.append((subFileSet, iter(subFileSet._fileSets.values())))
+		elif order is TraversalOrder.PreOrder:
+			stack = list(fileSets)
+			stack.reverse()
+			while stack:
+				fileSet = stack.pop()
+				yield fileSet
+				subFileSets = list(fileSet._fileSets.values())
+				subFileSets.reverse()
+				stack.extend(subFileSets)
+		elif order is TraversalOrder.BreadthFirst:
+			queue = deque(fileSets)
+			while queue:
+				fileSet = queue.popleft()
+				yield fileSet
+				queue.extend(fileSet._fileSets.values())
+		else:
+			raise TypeError("Parameter 'order' is not of type 'TraversalOrder'.")
+
+	def IterateFileSets(self, order: TraversalOrder = TraversalOrder.PostOrder) -> Generator['FileSet', None, None]:
+		"""
+		Method returning this fileset and all nested sub-filesets.
+
+		:arg order: Order in which filesets are visited. Default: ``PostOrder`` (same order as used by :meth:`Files`).
+		"""
+		return self._Traverse((self, ), order)
+
+	def Files(self, fileType: FileType = FileTypes.Any, fileSet: Union[bool, str, 'FileSet'] = None, order: TraversalOrder = TraversalOrder.PostOrder) -> Generator[File, None, None]:
 		"""
 		Method returning the files of this fileset.
 
 		:arg fileType: A filter for file types. Default: ``Any``.
 		:arg fileSet:  Specifies how to handle sub-filesets.
+		:arg order:    Order in which nested sub-filesets are visited. Default: ``PostOrder``.
 		"""
 		if fileSet is False:
-			for file in self._files:
-				if (file.FileType in fileType):
-					yield file
+			for file in self._FilesOfType(fileType):
+				yield file
 		elif fileSet is None:
-			for fileSet in self._fileSets.values():
-				for file in fileSet.Files(fileType):
-					yield file
-			for file in self._files:
-				if (file.FileType in fileType):
+			for fileSet in self._Traverse((self, ), order):
+				for file in fileSet._FilesOfType(fileType):
 					yield file
 		else:
 			if isinstance(fileSet, str):
@@ -764,18 +1106,58 @@ class FileSet(metaclass=ExtendedType, slots=True):
 			elif not isinstance(fileSet, FileSet):
 				raise TypeError("Parameter 'fileSet' is not of type 'str' or 'FileSet' nor value 'None'.")
 
-			for file in fileSet.Files(fileType):
+			for file in fileSet.Files(fileType, order=order):
 				yield file
 
+	def _FilesOfType(self, fileType: FileType) -> Iterable[File]:
+		"""
+		Returns the files of this fileset (without sub-filesets) matching a file type in order of insertion.
+
+		The file type index is used, so only the (few) distinct file types in this fileset are checked against the filter
+		and only matching files are visited.
+
+		:arg fileType: A filter for file types.
+		"""
+		if fileType is FileTypes.Any:
+			return self._files
+
+		indexLists = [indices for key, indices in self._fileTypeIndex.items() if key in fileType]
+		if len(indexLists) == 0:
+			return ()
+		elif len(indexLists) == 1:
+			return (self._files[index] for index in indexLists[0])
+		else:
+			return (self._files[index] for index in heapq_merge(*indexLists))
+
 	def AddFile(self, file: File) -> None:
 		"""
 		Method to add a single file to this fileset.
 
 		:arg file: A file to add to this fileset.
 		"""
+		indices = self._fileTypeIndex.get(file._fileType)
+		if indices is None:
+			self._fileTypeIndex[file._fileType] = [len(self._files)]
+		else:
+			indices.append(len(self._files))
 		self._files.append(file)
 		file._fileSet = self
 
+		fileType = file._fileType
+		fileSet = self
+		while fileSet is not None:
+			fileSet._fileCount += 1
+			fileSet._fileTypeCounts[fileType] = fileSet._fileTypeCounts.get(fileType, 0) + 1
+			fileSet = fileSet._parent
+
+		design = self.Design
+		if design is not None:
+			if file._design is None:
+				file._design = design
+				file._project = design._project
+			if design._fileIndex is not None:
+				design._AddToFileIndex(file)
+
 	def AddFiles(self, files: Iterable[File]) -> None:
 		"""
 		Method to add a multiple files to this fileset.
@@ -783,11 +1165,155 @@ class FileSet(metaclass=ExtendedType, slots=True):
 		:arg files: An iterable of files to add to the fileset.
 		"""
 		for file in files:
-			self._files.append(file)
-			file._fileSet = self
+			self.AddFile(file)
 
-	def Validate(self):
-		"""Validate this fileset."""
+	def AddPaths(
+		self,
+		paths: Iterable[Union[str, pathlib_Path]],
+		fileType: FileType = File,
+		vhdlLibrary: Union[str, 'VHDLLibrary'] = None,
+		vhdlVersion: VHDLVersion = None
+	) -> List[File]:
+		"""
+		Method to create and add many files of the same file type to this fileset.
+
+		Parameters are checked once for all files. Then files are created unlinked and are linked to this fileset (and VHDL
+		library) in one pass: type index, file counts and VHDL library are updated once per call instead of per file.
+
+		:arg paths:       An iterable of file paths.
+		:arg fileType:    File type (class) used to create the files. Default: ``File``.
+		:arg vhdlLibrary: VHDL library for all files (VHDL source files only).
+		:arg vhdlVersion: VHDL version for all files (VHDL source files only).
+		:returns:         List of created files.
+		"""
+		isVHDL = issubclass(fileType, VHDLSourceFile)
+		if not isVHDL and (vhdlLibrary is not None or vhdlVersion is not None):
+			raise TypeError(f"Parameters 'vhdlLibrary' and 'vhdlVersion' require a 'VHDLSourceFile' as 'fileType'.")
+
+		if isinstance(vhdlLibrary, str):
+			design = self.Design
+			if design is None:
+				raise Exception(f"Can't lookup VHDL library because fileset '{self._name}' has no design.")
+			try:
+				vhdlLibrary = design._vhdlLibraries[vhdlLibrary]
+			except KeyError as ex:
+				raise Exception(f"VHDL library '{vhdlLibrary}' not found in design '{design.Name}'.") from ex
+		elif vhdlLibrary is not None and not isinstance(vhdlLibrary, VHDLLibrary):
+			raise TypeError(f"Parameter 'vhdlLibrary' is neither a 'str' nor 'VHDLLibrary'.")
+
+		design = self.Design
+		project = self._project if design is None else design._project
+		files = []
+		if fileType.__init__ is File.__init__ or fileType.__init__ is VHDLSourceFile.__init__:
+			# Fast path: initialize the fields by the same helper as __init__, but without adding each file to this fileset
+			# and VHDL library. All files are added at once below.
+			newFile = fileType.__new__
+			for path in paths:
+				file = newFile(fileType)
+				path = path if isinstance(path, pathlib_Path) else pathlib_Path(path)
+				if isVHDL:
+					file._Initialize(path, fileType, project, design, self, vhdlLibrary, vhdlVersion)
+				else:
+					file._Initialize(path, fileType, project, design, self)
+				files.append(file)
+
+			if vhdlLibrary is not None:
+				vhdlLibrary.AddFiles(files)
+		else:
+			# Slow path: derived classes with their own __init__ are created as usual, so they register at the VHDL library.
+			for path in paths:
+				path = path if isinstance(path, pathlib_Path) else pathlib_Path(path)
+				file = fileType(path, vhdlLibrary=vhdlLibrary, vhdlVersion=vhdlVersion) if isVHDL else fileType(path)
+				file._project = project
+				file._design = design
+				file._fileSet = self
+				files.append(file)
+
+		if len(files) == 0:
+			return files
+
+		start = len(self._files)
+		self._files.extend(files)
+		fileTypeKey = files[0]._fileType
+		indices = self._fileTypeIndex.get(fileTypeKey)
+		if indices is None:
+			self._fileTypeIndex[fileTypeKey] = list(range(start, start + len(files)))
+		else:
+			indices.extend(range(start, start + len(files)))
+		self._UpdateFileCounts({fileTypeKey: len(files)}, 1)
+
+		if design is not None and design._fileIndex is not None:
+			for file in files:
+				design._AddToFileIndex(file)
+
+		return files
+
+	def Import(
+		self,
+		directory: pathlib_Path,
+		patterns: Iterable[str] = ("*", ),
+		recursive: bool = True,
+		fileTypes: Union[Mapping[str, FileType], FileTypeRegistry] = None
+	) -> int:
+		"""
+		Method to import all files from a directory (tree) into this fileset.
+
+		The directory is scanned with :func:`os.scandir`. Each file matching one of the patterns is created and added to
+		this fileset while scanning. The file type is looked up by the file's suffix in :attr:`FileType.FileSuffixes`.
+		Files with unknown suffixes are imported as :class:`File` (or as the default file type of a given registry).
+
+		A relative directory is relative to this fileset's directory. The paths of imported files are ``directory``
+		joined with the path relative to ``directory``. Entries of a directory are imported sorted by name. Symbolic
+		links to directories are not followed.
+
+		:arg directory: Directory to scan.
+		:arg patterns:  Glob patterns (see :mod:`fnmatch`) a file name must match to be imported. Default: all files.
+		:arg recursive: If true, subdirectories are scanned, too.
+		:arg fileTypes: Optional mapping or registry from suffixes (lower case, incl. dot) to file types overriding the default registry.
+		:returns:       Number of imported files.
+		"""
+		directory = pathlib_Path(directory)
+		if directory.is_absolute():
+			scanDirectory = directory
+		else:
+			scanDirectory = self.ResolvedPath / directory
+
+		if fileTypes is None:
+			fileTypes = FileType.FileSuffixes
+		defaultFileType = fileTypes.Default if isinstance(fileTypes, FileTypeRegistry) else File
+		matchName = re_compile("|".join(fnmatch_translate(pattern) for pattern in patterns)).match
+
+		fileCount = 0
+		stack = [(scanDirectory, directory)]
+		while stack:
+			scanPath, path = stack.pop()
+			with scandir(scanPath) as entries:
+				entries = sorted(entries, key=lambda e: e.name)
+
+			subDirectories = []
+			for entry in entries:
+				if entry.is_dir(follow_symlinks=False):
+					if recursive:
+						subDirectories.append((entry.path, path / entry.name))
+				elif entry.is_file() and matchName(entry.name) is not None:
+					name = entry.name
+					index = name.rfind(".")
+					fileType = fileTypes.get(name[index:].lower(), defaultFileType) if index > 0 else defaultFileType
+
+					self.AddFile(fileType(path / name))
+					fileCount += 1
+
+			subDirectories.reverse()
+			stack.extend(subDirectories)
+
+		return fileCount
+
+	def Validate(self, recursive: bool = True):
+		"""
+		Validate this fileset.
+
+		:arg recursive: If true, sub-filesets and files are validated, too.
+		"""
 		if self._name is None or self._name == "":
 			raise Exception("Validation: FileSet has no name.")
 
@@ -802,37 +1328,110 @@ class FileSet(metaclass=ExtendedType, slots=True):
 		if not path.is_dir():
 			raise Exception(f"Validation: FileSet '{self._name}'s directory '{path}' is not a directory.")
 
-		if self._design is None:
-			raise Exception(f"Validation: FileSet '{self._path}' has no design.")
-		if self._project is None:
-			raise Exception(f"Validation: FileSet '{self._path}' has no project.")
+		if self.Design is None:
+			raise Exception(f"Validation: FileSet '{self._name}' has no design.")
+		if self._project is None and self.Design._project is None:
+			raise Exception(f"Validation: FileSet '{self._name}' has no project.")
 
-		for fileSet in self._fileSets.values():
-			fileSet.Validate()
-		for file in self._files:
-			file.Validate()
+		if recursive:
+			for fileSet in self._fileSets.values():
+				fileSet.Validate()
+			for file in self._files:
+				file.Validate()
+
+	def _UpdateFileCounts(self, fileTypeCounts: Dict[FileType, int], sign: int) -> None:
+		"""Add (``sign=1``) or subtract (``sign=-1``) the file counts of a sub-fileset to/from this fileset and all parents."""
+		if len(fileTypeCounts) == 0:
+			return
+
+		fileSet = self
+		while fileSet is not None:
+			counts = fileSet._fileTypeCounts
+			for fileType, count in fileTypeCounts.items():
+				fileSet._fileCount += sign * count
+				newCount = counts.get(fileType, 0) + sign * count
+				if newCount == 0:
+					del counts[fileType]
+				else:
+					counts[fileType] = newCount
+
+			fileSet = fileSet._parent
+
+	def FileCount(self, fileType: FileType = FileTypes.Any) -> int:
+		"""
+		Method returning the number of files incl. the files in the sub-filesets.
+
+		The counts are maintained while files and sub-filesets are added, so only the (few) distinct file types are
+		checked against the filter.
+
+		:arg fileType: A filter for file types. Default: ``Any``.
+		"""
+		if fileType is FileTypes.Any:
+			return self._fileCount
+
+		fileCount = 0
+		for key, count in self._fileTypeCounts.items():
+			if key in fileType:
+				fileCount += count
+
+		return fileCount
 
 	def __len__(self):
 		"""Returns number of files incl. the files in the sub-filesets."""
-		fileCount = self._files.__len__()
-		for fileSet in self._fileSets:
-			fileCount += fileSet.__len__()
+		return self._fileCount
 
-		return fileCount
+	def _AttributeParent(self) -> Union['FileSet', 'Design', 'Project', None]:
+		"""Returns the parent fileset, or the design if this fileset isn't nested, to inherit attributes from."""
+		if self._parent is not None:
+			return self._parent
+		elif self._design is not None:
+			return self._design
+		else:
+			return self._project
+
+	def _InheritedAttributes(self) -> Nullable[Dict[Type[Attribute], typing_Any]]:
+		"""Returns the effective attributes of the parent fileset, or of the design if this fileset isn't nested."""
+		return _ResolveEffectiveAttributes(self._AttributeParent())
+
+	def _EffectiveAttributes(self) -> Dict[Type[Attribute], typing_Any]:
+		"""
+		Returns the attributes of this fileset merged with the attributes inherited from parent objects.
+
+		The result is cached and rebuilt if an attribute is set on this fileset or if the parent's effective attributes
+		changed. It must not be modified.
+		"""
+		return _ResolveEffectiveAttributes(self)
+
+	def _UpdateEffectiveAttributes(self, base: Nullable[Dict[Type[Attribute], typing_Any]]) -> Dict[Type[Attribute], typing_Any]:
+		"""Returns the cached effective attributes, which are rebuilt if ``base`` (the parent's ones) changed."""
+		if self._effectiveAttributes is None or self._effectiveBase is not base:
+			if base is None:
+				effective = dict(self._attributes)
+			elif len(self._attributes) == 0:
+				effective = base
+			else:
+				effective = dict(base)
+				effective.update(self._attributes)
+
+			self._effectiveAttributes = effective
+			self._effectiveBase = base
+
+		return self._effectiveAttributes
 
 	def __getitem__(self, key: Type[Attribute]):
 		"""Index access for returning attributes on this file."""
 		if not issubclass(key, Attribute):
 			raise TypeError("Parameter 'key' is not an 'Attribute'.")
 
-		try:
+		if key in self._attributes:
 			return self._attributes[key]
-		except KeyError:
+		else:
 			return key.resolve(self, key)
 
 	def __setitem__(self, key: Type[Attribute], value: typing_Any):
 		"""Index access for setting attributes on this file."""
 		self._attributes[key] = value
+		self._effectiveAttributes = None
 
 	def GetOrCreateVHDLLibrary(self, name):
 		if name in self._vhdlLibraries:
@@ -846,75 +1445,181 @@ class FileSet(metaclass=ExtendedType, slots=True):
 			self._vhdlLibraries[name] = library
 			return library
 
+	def _EffectiveSettings(self) -> Settings:
+		"""
+		Returns the effective VHDL library and language versions of this fileset.
+
+		Settings not set on this fileset are inherited from the parent fileset or the design. The result is cached and
+		recomputed if a setting of this fileset is changed or if the parent's effective settings changed. A fileset without
+		own settings shares the parent's snapshot, so files read it without walking up the hierarchy.
+		"""
+		if self._parent is not None:
+			base = self._parent._EffectiveSettings()
+		elif self._design is not None:
+			base = self._design._EffectiveSettings()
+		else:
+			base = None
+
+		if self._settings is None or self._settingsBase is not base:
+			settings = (self._vhdlLibrary, self._vhdlVersion, self._verilogVersion, self._svVersion)
+			if base is not None:
+				if all(setting is None for setting in settings):
+					settings = base
+				else:
+					settings = tuple(own if own is not None else inherited for own, inherited in zip(settings, base))
+
+			self._settings = settings
+			self._settingsBase = base
+
+		return self._settings
+
 	@property
 	def VHDLLibrary(self) -> 'VHDLLibrary':
 		"""Property setting or returning the VHDL library of this fileset."""
-		if self._vhdlLibrary is not None:
-			return self._vhdlLibrary
-		elif self._parent is not None:
-			return self._parent.VHDLLibrary
-		elif self._design is not None:
-			return self._design.VHDLLibrary
-		else:
+		vhdlLibrary = self._EffectiveSettings()[0]
+		if vhdlLibrary is None:
 			raise Exception("VHDLLibrary was neither set locally nor globally.")
 
+		return vhdlLibrary
+
 	@VHDLLibrary.setter
 	def VHDLLibrary(self, value: 'VHDLLibrary') -> None:
 		self._vhdlLibrary = value
+		self._settings = None
 
 	@property
 	def VHDLVersion(self) -> VHDLVersion:
 		"""Property setting or returning the VHDL version of this fileset."""
-		if self._vhdlVersion is not None:
-			return self._vhdlVersion
-		elif self._parent is not None:
-			return self._parent.VHDLVersion
-		elif self._design is not None:
-			return self._design.VHDLVersion
-		else:
+		vhdlVersion = self._EffectiveSettings()[1]
+		if vhdlVersion is None:
 			raise Exception("VHDLVersion was neither set locally nor globally.")
 
+		return vhdlVersion
+
 	@VHDLVersion.setter
 	def VHDLVersion(self, value: VHDLVersion) -> None:
 		self._vhdlVersion = value
+		self._settings = None
 
 	@property
 	def VerilogVersion(self) -> VerilogVersion:
 		"""Property setting or returning the Verilog version of this fileset."""
-		if self._verilogVersion is not None:
-			return self._verilogVersion
-		elif self._parent is not None:
-			return self._parent.VerilogVersion
-		elif self._design is not None:
-			return self._design.VerilogVersion
-		else:
+		verilogVersion = self._EffectiveSettings()[2]
+		if verilogVersion is None:
 			raise Exception("VerilogVersion was neither set locally nor globally.")
 
+		return verilogVersion
+
 	@VerilogVersion.setter
 	def VerilogVersion(self, value: VerilogVersion) -> None:
 		self._verilogVersion = value
+		self._settings = None
 
 	@property
 	def SVVersion(self) -> SystemVerilogVersion:
 		"""Property setting or returning the SystemVerilog version of this fileset."""
-		if self._svVersion is not None:
-			return self._svVersion
-		elif self._parent is not None:
-			return self._parent.SVVersion
-		elif self._design is not None:
-			return self._design.SVVersion
-		else:
+		svVersion = self._EffectiveSettings()[3]
+		if svVersion is None:
 			raise Exception("SVVersion was neither set locally nor globally.")
 
+		return svVersion
+
 	@SVVersion.setter
 	def SVVersion(self, value: SystemVerilogVersion) -> None:
 		self._svVersion = value
+		self._settings = None
 
 	def __str__(self):
 		"""Returns the fileset's name."""
 		return self._name
 
 
+def _SupportsComponentMerge() -> bool:
+	"""
+	Check if pyTooling keeps graph components in the fields used by :func:`_MergeComponents`.
+
+	These fields aren't public API (checked with pyTooling 5.x). If they change, edges are added without merging
+	components beforehand, which is correct, but slower.
+	"""
+	graph = Graph()
+	vertex = Vertex(graph=graph)
+	component = getattr(vertex, "_component", None)
+	return (
+		isinstance(component, Component) and
+		isinstance(getattr(component, "_vertices", None), set) and
+		isinstance(getattr(graph, "_components", None), set)
+	)
+
+
+_COMPONENT_MERGE = _SupportsComponentMerge()
+
+
+def _MergeComponents(source: Vertex, destination: Vertex) -> None:
+	"""
+	Merge the component of ``source`` into the component of ``destination``, if it's smaller.
+
+	pyTooling moves all vertices of the destination's component into the source's component, when an edge is added.
+	Adding edges from new vertices to a large component (e.g. each new file depends on an already known package) would be
+	quadratic. Merging the smaller component into the larger one beforehand (union by size) keeps filling a graph at
+	:math:`O(E \\log V)`.
+	"""
+	sourceComponent = source._component
+	destinationComponent = destination._component
+	if sourceComponent is not destinationComponent and len(sourceComponent._vertices) < len(destinationComponent._vertices):
+		for vertex in sourceComponent._vertices:
+			vertex._component = destinationComponent
+		destinationComponent._vertices.update(sourceComponent._vertices)
+		source._graph._components.remove(sourceComponent)
+
+
+def _AddEdge(source: Vertex, destination: Vertex) -> None:
+	"""Add an edge from ``source`` to ``destination`` in a dependency graph."""
+	if _COMPONENT_MERGE:
+		_MergeComponents(source, destination)
+
+	source.EdgeToVertex(destination)
+
+
+def _TopologicalOrder(vertices: List[Vertex], kinds: str, name: Callable[[typing_Any], str] = str) -> List[Vertex]:
+	"""
+	Sort vertices of a dependency graph, so each vertex follows all vertices it has an edge to (its dependencies).
+
+	Kahn's algorithm visits each vertex and edge once. Independent vertices keep their given order. Edges to vertices,
+	which aren't in ``vertices``, are ignored.
+
+	:arg vertices: Vertices to sort.
+	:arg kinds:    Kind of vertex values used in the error message, e.g. ``"files"``.
+	:arg name:     Function returning the name of a vertex value used in the error message.
+	:returns:      Vertices in topological order.
+	"""
+	pending = dict.fromkeys(vertices, 0)
+	for vertex in vertices:
+		pending[vertex] = sum(1 for successor in vertex.IterateSuccessorVertices() if successor in pending)
+
+	order = [vertex for vertex in vertices if pending[vertex] == 0]
+	for vertex in order:  # the list grows while it's iterated
+		for predecessor in vertex.IteratePredecessorVertices():
+			count = pending.get(predecessor)
+			if count is not None:
+				pending[predecessor] = count - 1
+				if count == 1:
+					order.append(predecessor)
+
+	if len(order) < len(vertices):
+		# Each remaining vertex has a remaining dependency, so walking along them must revisit a vertex.
+		vertex = next(vertex for vertex in vertices if pending[vertex] > 0)
+		path = []
+		positions = {}
+		while vertex not in positions:
+			positions[vertex] = len(path)
+			path.append(vertex)
+			vertex = next(successor for successor in vertex.IterateSuccessorVertices() if pending.get(successor, 0) > 0)
+		cycle = path[positions[vertex]:] + [vertex]
+		raise Exception(f"Dependency cycle between {kinds}: {' -> '.join(name(v.Value) for v in cycle)}")
+
+	return order
+
+
 @export
 class VHDLLibrary(metaclass=ExtendedType, slots=True):
 	"""
@@ -1041,8 +1746,24 @@ class VHDLLibrary(metaclass=ExtendedType, slots=True):
 	def VHDLVersion(self, value: VHDLVersion) -> None:
 		self._vhdlVersion = value
 
-	def AddDependency(self, library: 'VHDLLibrary'):
-		library.parent = self
+	@property
+	def Dependencies(self) -> List['VHDLLibrary']:
+		"""Read-only property returning the VHDL libraries this VHDL library depends on."""
+		if self._dependencyNode is None:
+			return []
+		return [vertex.Value for vertex in self._dependencyNode.IterateSuccessorVertices()]
+
+	def AddDependency(self, library: 'VHDLLibrary') -> None:
+		"""
+		Add a dependency on another VHDL library of the same design.
+
+		:arg library: VHDL library, which needs to be compiled before this VHDL library.
+		"""
+		if self._dependencyNode is None or self._design is not library._design:
+			raise Exception(f"VHDL libraries '{self._name}' and '{library._name}' are not in the same design.")
+
+		if library is not self and not self._dependencyNode.HasEdgeToDestination(library._dependencyNode):
+			_AddEdge(self._dependencyNode, library._dependencyNode)
 
 	def AddFile(self, vhdlFile: VHDLSourceFile) -> None:
 		if not isinstance(vhdlFile, VHDLSourceFile):
@@ -1087,16 +1808,28 @@ class Design(metaclass=ExtendedType, slots=True):
 	_fileSets:              Dict[str, FileSet]
 	_defaultFileSet:        Nullable[FileSet]
 	_attributes:            Dict[Type[Attribute], typing_Any]
+	_effectiveAttributes:   Nullable[Dict[Type[Attribute], typing_Any]]
+	_effectiveBase:         Nullable[Dict[Type[Attribute], typing_Any]]
 
 	_vhdlLibraries:         Dict[str, VHDLLibrary]
 	_vhdlVersion:           VHDLVersion
 	_verilogVersion:        VerilogVersion
 	_svVersion:             SystemVerilogVersion
+	_settings:              Nullable[Settings]
+	_settingsBase:          Nullable[Settings]
 	_externalVHDLLibraries: List
 
 	_vhdlLibraryDependencyGraph: Graph
 	_fileDependencyGraph:        Graph
 
+	_resolvedPath:          Nullable[pathlib_Path]
+	_resolvedBase:          Nullable[pathlib_Path]
+
+	_fileIndex:             Nullable[Dict[str, File]]
+	_fileIndexBase:         Nullable[pathlib_Path]
+	_caseSensitivePaths:    bool
+	_resolveSymlinks:       bool
+
 	def __init__(
 		self,
 		name: str,
@@ -1113,13 +1846,23 @@ class Design(metaclass=ExtendedType, slots=True):
 		if project is not None:
 			project._designs[name] = self
 		self._directory =             directory
+		self._resolvedPath =          None
+		self._resolvedBase =          None
+		self._fileIndex =             None
+		self._fileIndexBase =         None
+		self._caseSensitivePaths =    True
+		self._resolveSymlinks =       True
 		self._fileSets =              {}
 		self._defaultFileSet =        FileSet("default", project=project, design=self)
 		self._attributes =            {}
+		self._effectiveAttributes =   None
+		self._effectiveBase =         None
 		self._vhdlLibraries =         {}
 		self._vhdlVersion =           vhdlVersion
 		self._verilogVersion =        verilogVersion
 		self._svVersion =             svVersion
+		self._settings =              None
+		self._settingsBase =          None
 		self._externalVHDLLibraries = []
 
 		self._vhdlLibraryDependencyGraph = Graph()
@@ -1160,24 +1903,65 @@ class Design(metaclass=ExtendedType, slots=True):
 	@Directory.setter
 	def Directory(self, value: pathlib_Path) -> None:
 		self._directory = value
+		self._resolvedPath = None
+		self._fileIndex = None
 
 	@property
 	def ResolvedPath(self) -> pathlib_Path:
-		"""Read-only property returning the resolved path of this fileset."""
+		"""
+		Read-only property returning the resolved path of this design.
+
+		The resolved path is cached. The cache is dropped if the directory changes or if the project's resolved path
+		changes.
+		"""
 		if self._directory.is_absolute():
-			return self._directory.resolve()
+			base = None
 		elif self._project is not None:
-			path = (self._project.ResolvedPath / self._directory).resolve()
-
-			if path.is_absolute():
-				return path
-			else:
-				# WORKAROUND: https://stackoverflow.com/questions/67452690/pathlib-path-relative-to-vs-os-path-relpath
-				return pathlib_Path(path_relpath(path, pathlib_Path.cwd()))
+			base = self._project.ResolvedPath
 		else:
 			# TODO: message and exception type
 			raise Exception("")
 
+		if self._resolvedPath is not None and self._resolvedBase is base:
+			return self._resolvedPath
+
+		if base is None:
+			path = self._directory.resolve()
+		else:
+			path = (base / self._directory).resolve()
+
+			if not path.is_absolute():
+				# WORKAROUND: https://stackoverflow.com/questions/67452690/pathlib-path-relative-to-vs-os-path-relpath
+				path = pathlib_Path(path_relpath(path, pathlib_Path.cwd()))
+
+		self._resolvedPath = path
+		self._resolvedBase = base
+		return path
+
+	@property
+	def CaseSensitivePaths(self) -> bool:
+		"""Property setting or returning if path lookups via :meth:`GetFile` are case-sensitive. Default: ``True``."""
+		return self._caseSensitivePaths
+
+	@CaseSensitivePaths.setter
+	def CaseSensitivePaths(self, value: bool) -> None:
+		self._caseSensitivePaths = value
+		self._fileIndex = None
+
+	@property
+	def ResolveSymlinks(self) -> bool:
+		"""
+		Property setting or returning if paths given to :meth:`GetFile` are resolved via the filesystem. Default: ``True``.
+
+		If set to ``False``, paths are normalized lexically (no system calls). This is faster, but symbolic links in the
+		given path are not followed, so the path must be given in canonical form.
+		"""
+		return self._resolveSymlinks
+
+	@ResolveSymlinks.setter
+	def ResolveSymlinks(self, value: bool) -> None:
+		self._resolveSymlinks = value
+
 	@property
 	def DefaultFileSet(self) -> FileSet:
 		"""Property setting or returning the default fileset of this design."""
@@ -1204,16 +1988,25 @@ class Design(metaclass=ExtendedType, slots=True):
 		"""Read-only property returning the dictionary of filesets."""
 		return self._fileSets
 
-	def Files(self, fileType: FileType = FileTypes.Any, fileSet: Union[str, FileSet] = None) -> Generator[File, None, None]:
+	def IterateFileSets(self, order: TraversalOrder = TraversalOrder.PostOrder) -> Generator[FileSet, None, None]:
+		"""
+		Method returning all filesets of this design including nested sub-filesets.
+
+		:arg order: Order in which filesets are visited. Default: ``PostOrder`` (same order as used by :meth:`Files`).
+		"""
+		return FileSet._Traverse(self._fileSets.values(), order)
+
+	def Files(self, fileType: FileType = FileTypes.Any, fileSet: Union[str, FileSet] = None, order: TraversalOrder = TraversalOrder.PostOrder) -> Generator[File, None, None]:
 		"""
 		Method returning the files of this design.
 
 		:arg fileType: A filter for file types. Default: ``Any``.
 		:arg fileSet:  Specifies if all files from all filesets (``fileSet=None``) are files from a single fileset are returned.
+		:arg order:    Order in which nested sub-filesets are visited. Default: ``PostOrder``.
 		"""
 		if fileSet is None:
-			for fileSet in self._fileSets.values():
-				for file in fileSet.Files(fileType):
+			for fileSet in FileSet._Traverse(self._fileSets.values(), order):
+				for file in fileSet._FilesOfType(fileType):
 					yield file
 		else:
 			if isinstance(fileSet, str):
@@ -1224,11 +2017,77 @@ class Design(metaclass=ExtendedType, slots=True):
 			elif not isinstance(fileSet, FileSet):
 				raise TypeError("Parameter 'fileSet' is not of type 'str' or 'FileSet' nor value 'None'.")
 
-			for file in fileSet.Files(fileType):
+			for file in fileSet.Files(fileType, order=order):
 				yield file
 
-	def Validate(self):
-		"""Validate this design."""
+	def _FileIndexKey(self, path: pathlib_Path) -> str:
+		key = str(path)
+		return key if self._caseSensitivePaths else key.casefold()
+
+	def _NormalizePath(self, path: Union[str, pathlib_Path], directory: pathlib_Path) -> pathlib_Path:
+		path = pathlib_Path(path)
+		if not path.is_absolute():
+			path = directory / path
+
+		if self._resolveSymlinks:
+			return path.resolve()
+		else:
+			return pathlib_Path(path_normpath(path))
+
+	def _AddToFileIndex(self, file: File) -> None:
+		try:
+			key = self._FileIndexKey(file.ResolvedPath)
+		except Exception:
+			self._fileIndex = None
+			return
+
+		if key not in self._fileIndex:
+			self._fileIndex[key] = file
+
+	def _BuildFileIndex(self) -> None:
+		self._fileIndexBase = self.ResolvedPath
+		self._fileIndex = {}
+		for file in self.Files():
+			key = self._FileIndexKey(file.ResolvedPath)
+			if key not in self._fileIndex:
+				self._fileIndex[key] = file
+
+	def _LookupFile(self, path: pathlib_Path) -> Nullable[File]:
+		"""Lookup a normalized absolute path in the file index. The index is (re)built if it's missing or outdated."""
+		if self._fileIndex is None or self._fileIndexBase is not self.ResolvedPath:
+			self._BuildFileIndex()
+
+		key = self._FileIndexKey(path)
+		file = self._fileIndex.get(key)
+		if file is not None and self._FileIndexKey(file.ResolvedPath) != key:
+			# The file was moved since it was indexed.
+			self._BuildFileIndex()
+			file = self._fileIndex.get(key)
+
+		return file
+
+	def GetFile(self, path: Union[str, pathlib_Path]) -> File:
+		"""
+		Method returning the file object for a given path.
+
+		A relative path is interpreted relative to the design's directory. The lookup uses a path index, which is built on
+		first use and updated when files are added to the design.
+
+		:arg path: Path of the file to lookup.
+		:returns:  File object representing the path.
+		"""
+		file = self._LookupFile(self._NormalizePath(path, self.ResolvedPath))
+		if file is None:
+			raise Exception(f"File '{path!s}' is not part of design '{self._name}'.")
+
+		return file
+
+	def Validate(self, recursive: bool = True):
+		"""
+		Validate this design.
+
+		:arg recursive: If true, filesets are validated, too.
+		"""
 		if self._name is None or self._name == "":
 			raise Exception("Validation: Design has no name.")
 
@@ -1251,68 +2110,233 @@ class Design(metaclass=ExtendedType, slots=True):
 		except KeyError as ex:
 			raise Exception(f"Validation: Design '{self._name}'s default fileset is not in list of filesets.") from ex
 		if self._project is None:
-			raise Exception(f"Validation: Design '{self._path}' has no project.")
+			raise Exception(f"Validation: Design '{self._name}' has no project.")
+
+		if recursive:
+			for fileSet in self._fileSets.values():
+				fileSet.Validate()
 
+	def FileCount(self, fileType: FileType = FileTypes.Any) -> int:
+		"""
+		Method returning the number of files in this design.
+
+		:arg fileType: A filter for file types. Default: ``Any``.
+		"""
+		fileCount = 0
 		for fileSet in self._fileSets.values():
-			fileSet.Validate()
+			fileCount += fileSet.FileCount(fileType)
+
+		return fileCount
 
 	def __len__(self):
 		return self._fileSets.__len__()
 
+	def __contains__(self, path: Union[str, pathlib_Path]) -> bool:
+		"""Returns true, if a file with the given path is part of this design (see :meth:`GetFile`)."""
+		return self._LookupFile(self._NormalizePath(path, self.ResolvedPath)) is not None
+
+	def _AttributeParent(self) -> Nullable['Project']:
+		"""Returns the project to inherit attributes from."""
+		return self._project
+
+	def _InheritedAttributes(self) -> Nullable[Dict[Type[Attribute], typing_Any]]:
+		"""Returns the effective attributes of the project."""
+		return _ResolveEffectiveAttributes(self._project)
+
+	def _EffectiveAttributes(self) -> Dict[Type[Attribute], typing_Any]:
+		"""
+		Returns the attributes of this design merged with the attributes inherited from the project.
+
+		The result is cached and rebuilt if an attribute is set on this design or if the project's attributes changed. It
+		must not be modified.
+		"""
+		return _ResolveEffectiveAttributes(self)
+
+	def _UpdateEffectiveAttributes(self, base: Nullable[Dict[Type[Attribute], typing_Any]]) -> Dict[Type[Attribute], typing_Any]:
+		"""Returns the cached effective attributes, which are rebuilt if ``base`` (the project's ones) changed."""
+		if self._effectiveAttributes is None or self._effectiveBase is not base:
+			if base is None:
+				effective = dict(self._attributes)
+			elif len(self._attributes) == 0:
+				effective = base
+			else:
+				effective = dict(base)
+				effective.update(self._attributes)
+
+			self._effectiveAttributes = effective
+			self._effectiveBase = base
+
+		return self._effectiveAttributes
+
 	def __getitem__(self, key: Type[Attribute]):
 		if not issubclass(key, Attribute):
 			raise TypeError("Parameter 'key' is not an 'Attribute'.")
 
-		try:
+		if key in self._attributes:
 			return self._attributes[key]
-		except KeyError:
+		else:
 			return key.resolve(self, key)
 
 	def __setitem__(self, key: Type[Attribute], value: typing_Any):
 		self._attributes[key] = value
+		self._effectiveAttributes = None
 
 	@property
 	def VHDLLibraries(self) -> Dict[str, VHDLLibrary]:
 		return self._vhdlLibraries
 
+	def _FileVertex(self, file: File) -> Vertex:
+		"""Returns the vertex of a file in the file dependency graph. The vertex is created on first use."""
+		try:
+			return self._fileDependencyGraph.GetVertexByID(file)
+		except KeyError:
+			return Vertex(vertexID=file, value=file, graph=self._fileDependencyGraph)
+
+	def AddFileDependency(self, file: File, dependency: File) -> None:
+		"""
+		Add a dependency between two files of this design.
+
+		:arg file:       File depending on ``dependency``.
+		:arg dependency: File, which needs to be compiled before ``file``.
+		"""
+		if file is dependency:
+			return
+
+		vertex = self._FileVertex(file)
+		dependencyVertex = self._FileVertex(dependency)
+		if not vertex.HasEdgeToDestination(dependencyVertex):
+			_AddEdge(vertex, dependencyVertex)
+
+	def FileDependencies(self, file: File) -> List[File]:
+		"""
+		Method returning the files a file depends on.
+
+		:arg file: File of this design.
+		:returns:  Files, which need to be compiled before ``file``.
+		"""
+		try:
+			vertex = self._fileDependencyGraph.GetVertexByID(file)
+		except KeyError:
+			return []
+		return [successor.Value for successor in vertex.IterateSuccessorVertices()]
+
+	def _UpdateVHDLLibraryDependencies(self) -> None:
+		"""Add a VHDL library dependency for each file dependency between VHDL source files of different VHDL libraries."""
+		libraries = {}
+		for vertex in self._fileDependencyGraph.IterateVertices():
+			file = vertex.Value
+			if isinstance(file, VHDLSourceFile):
+				library = file._vhdlLibrary
+				if library is None and file._fileSet is not None:
+					library = file._fileSet._EffectiveSettings()[0]
+				if isinstance(library, VHDLLibrary) and library._design is self:
+					libraries[vertex] = library
+
+		pairs = set()
+		for vertex, library in libraries.items():
+			for successor in vertex.IterateSuccessorVertices():
+				dependency = libraries.get(successor)
+				if dependency is not None and dependency is not library and (library, dependency) not in pairs:
+					pairs.add((library, dependency))
+					library.AddDependency(dependency)
+
+	def VHDLLibraryCompileOrder(self) -> List[VHDLLibrary]:
+		"""
+		Method returning the VHDL libraries of this design in compile order.
+
+		The VHDL library dependency graph contains the dependencies added by :meth:`VHDLLibrary.AddDependency` and the
+		dependencies implied by file dependencies (see :meth:`AddFileDependency`) crossing VHDL library boundaries. The
+		latter are added to the graph by this method.
+
+		:returns: VHDL libraries, each after all VHDL libraries it depends on. Independent libraries keep their order of
+		          creation.
+		:raises Exception: If the VHDL library dependencies are cyclic.
+		"""
+		self._UpdateVHDLLibraryDependencies()
+		vertices = [library._dependencyNode for library in self._vhdlLibraries.values()]
+		return [vertex.Value for vertex in _TopologicalOrder(vertices, "VHDL libraries")]
+
+	def CompileOrder(self, fileType: FileType = FileTypes.HDLSourceFile) -> List[File]:
+		"""
+		Method returning the files of this design in compile order.
+
+		All files of the requested type are added to the file dependency graph. The order is computed in
+		:math:`O(V + E)` for :math:`V` files and :math:`E` dependencies (see :meth:`AddFileDependency`).
+
+		:arg fileType: A filter for file types. Default: ``HDLSourceFile``.
+		:returns:      Files, each after all files it depends on. Independent files keep their order in the design (see
+		               :meth:`Files`).
+		:raises Exception: If the file dependencies are cyclic.
+		"""
+		vertices = [self._FileVertex(file) for file in self.Files(fileType)]
+		return [vertex.Value for vertex in _TopologicalOrder(vertices, "files", lambda file: file.Path.as_posix())]
+
+	def _EffectiveSettings(self) -> Settings:
+		"""
+		Returns the effective language versions of this design (a design has no default VHDL library).
+
+		Versions not set on this design are inherited from the project. The result is cached and recomputed if a version of
+		this design is changed or if the project's settings changed.
+		"""
+		if self._project is not None:
+			base = self._project._EffectiveSettings()
+		else:
+			base = None
+
+		if self._settings is None or self._settingsBase is not base:
+			settings = (None, self._vhdlVersion, self._verilogVersion, self._svVersion)
+			if base is not None:
+				if all(setting is None for setting in settings):
+					settings = base
+				else:
+					settings = tuple(own if own is not None else inherited for own, inherited in zip(settings, base))
+
+			self._settings = settings
+			self._settingsBase = base
+
+		return self._settings
+
 	@property
 	def VHDLVersion(self) -> VHDLVersion:
-		if self._vhdlVersion is not None:
-			return self._vhdlVersion
-		elif self._project is not None:
-			return self._project.VHDLVersion
-		else:
+		"""Property setting or returning the VHDL version of this design."""
+		vhdlVersion = self._EffectiveSettings()[1]
+		if vhdlVersion is None:
 			raise Exception("VHDLVersion was neither set locally nor globally.")
 
+		return vhdlVersion
+
 	@VHDLVersion.setter
 	def VHDLVersion(self, value: VHDLVersion) -> None:
 		self._vhdlVersion = value
+		self._settings = None
 
 	@property
 	def VerilogVersion(self) -> VerilogVersion:
-		if self._verilogVersion is not None:
-			return self._verilogVersion
-		elif self._project is not None:
-			return self._project.VerilogVersion
-		else:
+		"""Property setting or returning the Verilog version of this design."""
+		verilogVersion = self._EffectiveSettings()[2]
+		if verilogVersion is None:
 			raise Exception("VerilogVersion was neither set locally nor globally.")
 
+		return verilogVersion
+
 	@VerilogVersion.setter
 	def VerilogVersion(self, value: VerilogVersion) -> None:
 		self._verilogVersion = value
+		self._settings = None
 
 	@property
 	def SVVersion(self) -> SystemVerilogVersion:
-		if self._svVersion is not None:
-			return self._svVersion
-		elif self._project is not None:
-			return self._project.SVVersion
-		else:
+		"""Property setting or returning the SystemVerilog version of this design."""
+		svVersion = self._EffectiveSettings()[3]
+		if svVersion is None:
 			raise Exception("SVVersion was neither set locally nor globally.")
 
+		return svVersion
+
 	@SVVersion.setter
 	def SVVersion(self, value: SystemVerilogVersion) -> None:
 		self._svVersion = value
+		self._settings = None
 
 	@property
 	def ExternalVHDLLibraries(self) -> List:
@@ -1371,10 +2395,14 @@ class Project(metaclass=ExtendedType, slots=True):
 	_designs:         Dict[str, Design]
 	_defaultDesign:   Design
 	_attributes:      Dict[Type[Attribute], typing_Any]
+	_effectiveAttributes: Nullable[Dict[Type[Attribute], typing_Any]]
 
 	_vhdlVersion:     VHDLVersion
 	_verilogVersion:  VerilogVersion
 	_svVersion:       SystemVerilogVersion
+	_settings:        Nullable[Settings]
+
+	_resolvedPath:    Nullable[pathlib_Path]
 
 	def __init__(
 		self,
@@ -1386,12 +2414,15 @@ class Project(metaclass=ExtendedType, slots=True):
 	):
 		self._name =            name
 		self._rootDirectory =   rootDirectory
+		self._resolvedPath =    None
 		self._designs =         {}
 		self._defaultDesign =   Design("default", project=self)
 		self._attributes =      {}
+		self._effectiveAttributes = None
 		self._vhdlVersion =     vhdlVersion
 		self._verilogVersion =  verilogVersion
 		self._svVersion =       svVersion
+		self._settings =        None
 
 	@property
 	def Name(self) -> str:
@@ -1406,16 +2437,25 @@ class Project(metaclass=ExtendedType, slots=True):
 	@RootDirectory.setter
 	def RootDirectory(self, value: pathlib_Path) -> None:
 		self._rootDirectory = value
+		self._resolvedPath = None
 
 	@property
 	def ResolvedPath(self) -> pathlib_Path:
-		"""Read-only property returning the resolved path of this fileset."""
+		"""
+		Read-only property returning the resolved path of this project.
+
+		The resolved path is cached. The cache is dropped if the root directory changes.
+		"""
+		if self._resolvedPath is not None:
+			return self._resolvedPath
+
 		path = self._rootDirectory.resolve()
-		if self._rootDirectory.is_absolute():
-			return path
-		else:
+		if not self._rootDirectory.is_absolute():
 			# WORKAROUND: https://stackoverflow.com/questions/67452690/pathlib-path-relative-to-vs-os-path-relpath
-			return pathlib_Path(path_relpath(path, pathlib_Path.cwd()))
+			path = pathlib_Path(path_relpath(path, pathlib_Path.cwd()))
+
+		self._resolvedPath = path
+		return path
 
 	# TODO: return generator with another method
 	@property
@@ -1426,8 +2466,19 @@ class Project(metaclass=ExtendedType, slots=True):
 	def DefaultDesign(self) -> Design:
 		return self._defaultDesign
 
-	def Validate(self):
-		"""Validate this project."""
+	def Validate(self, concurrent: bool = False, maxWorkers: Nullable[int] = None):
+		"""
+		Validate this project.
+
+		By default, validation stops at the first failing entity. In concurrent mode, the filesystem checks of all
+		designs, filesets and files are distributed to a thread pool. All failures are collected and reported by a single
+		:exc:`ValidationException`, in the same order as a sequential validation would visit the entities: a fileset is
+		followed by its sub-filesets and then by its own files.
+
+		:arg concurrent: If true, validate designs, filesets and files concurrently.
+		:arg maxWorkers: Maximum number of worker threads in concurrent mode.
+		:raises ValidationException: If one or more entities failed in concurrent mode.
+		"""
 		if self._name is None or self._name == "":
 			raise Exception("Validation: Project has no name.")
 
@@ -1450,50 +2501,152 @@ class Project(metaclass=ExtendedType, slots=True):
 		except KeyError as ex:
 			raise Exception(f"Validation: Project '{self._name}'s default design is not in list of designs.") from ex
 
+		if not concurrent:
+			for design in self._designs.values():
+				design.Validate()
+			return
+
+		entities = []
+
 		for design in self._designs.values():
-			design.Validate()
+			entities.append(design)
+
+			# Same order as FileSet.Validate: the fileset, its sub-filesets, its files. An explicit stack is used, so deeply
+			# nested filesets don't hit Python's recursion limit. A fileset is pushed a second time (expanded) to add its files
+			# after all its sub-filesets.
+			stack = [(fileSet, False) for fileSet in reversed(design._fileSets.values())]
+			while stack:
+				fileSet, expanded = stack.pop()
+				if expanded:
+					entities.extend(fileSet._files)
+					continue
+
+				# resolve directories once in this thread, so workers share the cached paths of all parent filesets
+				try:
+					_ = fileSet.ResolvedPath
+				except Exception:
+					pass
+				entities.append(fileSet)
+				stack.append((fileSet, True))
+				stack.extend((subFileSet, False) for subFileSet in reversed(fileSet._fileSets.values()))
+
+		def validate(entity) -> Nullable[Exception]:
+			try:
+				if isinstance(entity, File):
+					entity.Validate()
+				else:
+					entity.Validate(recursive=False)
+			except Exception as ex:
+				return ex
+			return None
+
+		with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+			errors = [(entity, ex) for entity, ex in zip(entities, executor.map(validate, entities)) if ex is not None]
+
+		if len(errors) > 0:
+			raise ValidationException(f"Validation: Project '{self._name}' has {len(errors)} invalid entities.", errors)
+
+	def GetFile(self, path: Union[str, pathlib_Path]) -> File:
+		"""
+		Method returning the file object for a given path by looking it up in all designs of this project.
+
+		A relative path is interpreted relative to the project's root directory. The lookup policy (case-sensitivity,
+		symlink resolution) of each design is applied (see :meth:`Design.GetFile`).
+
+		:arg path: Path of the file to lookup.
+		:returns:  File object representing the path.
+		"""
+		for design in self._designs.values():
+			file = design._LookupFile(design._NormalizePath(path, self.ResolvedPath))
+			if file is not None:
+				return file
+
+		raise Exception(f"File '{path!s}' is not part of project '{self._name}'.")
 
 	def __len__(self):
 		return self._designs.__len__()
 
+	def __contains__(self, path: Union[str, pathlib_Path]) -> bool:
+		"""Returns true, if a file with the given path is part of this project (see :meth:`GetFile`)."""
+		for design in self._designs.values():
+			if design._LookupFile(design._NormalizePath(path, self.ResolvedPath)) is not None:
+				return True
+
+		return False
+
+	def _AttributeParent(self) -> None:
+		"""A project has no parent object to inherit attributes from."""
+		return None
+
+	def _InheritedAttributes(self) -> Nullable[Dict[Type[Attribute], typing_Any]]:
+		"""A project has no parent object to inherit attributes from."""
+		return None
+
+	def _EffectiveAttributes(self) -> Dict[Type[Attribute], typing_Any]:
+		"""
+		Returns a snapshot of the attributes of this project.
+
+		The snapshot is replaced if an attribute is set on this project, so designs, filesets and files can detect the
+		change by identity. It must not be modified.
+		"""
+		return self._UpdateEffectiveAttributes(None)
+
+	def _UpdateEffectiveAttributes(self, base: None) -> Dict[Type[Attribute], typing_Any]:
+		"""Returns the cached snapshot of the attributes of this project."""
+		if self._effectiveAttributes is None:
+			self._effectiveAttributes = dict(self._attributes)
+
+		return self._effectiveAttributes
+
 	def __getitem__(self, key: Type[Attribute]):
 		if not issubclass(key, Attribute):
 			raise TypeError("Parameter 'key' is not an 'Attribute'.")
 
-		try:
+		if key in self._attributes:
 			return self._attributes[key]
-		except KeyError:
+		else:
 			return key.resolve(self, key)
 
 	def __setitem__(self, key: Type[Attribute], value: typing_Any):
 		self._attributes[key] = value
+		self._effectiveAttributes = None
+
+	def _EffectiveSettings(self) -> Settings:
+		"""Returns a snapshot of the language versions of this project. The snapshot is replaced if a version is changed."""
+		if self._settings is None:
+			self._settings = (None, self._vhdlVersion, self._verilogVersion, self._svVersion)
+
+		return self._settings
 
 	@property
 	def VHDLVersion(self) -> VHDLVersion:
 		# TODO: check for None and return exception
-		return self._vhdlVersion
+		return self._EffectiveSettings()[1]
 
 	@VHDLVersion.setter
 	def VHDLVersion(self, value: VHDLVersion) -> None:
 		self._vhdlVersion = value
+		self._settings = None
 
 	@property
 	def VerilogVersion(self) -> VerilogVersion:
 		# TODO: check for None and return exception
-		return self._verilogVersion
+		return self._EffectiveSettings()[2]
 
 	@VerilogVersion.setter
 	def VerilogVersion(self, value: VerilogVersion) -> None:
 		self._verilogVersion = value
+		self._settings = None
 
 	@property
 	def SVVersion(self) -> SystemVerilogVersion:
 		# TODO: check for None and return exception
-		return self._svVersion
+		return self._EffectiveSettings()[3]
 
 	@SVVersion.setter
 	def SVVersion(self, value: SystemVerilogVersion) -> None:
 		self._svVersion = value
+		self._settings = None
 
 	def __str__(self):
 		return self._name
@@ -0,0 +1,4 @@
+library osvvm_common
+set SourceDirectory src
+analyze $SourceDirectory/ModelParametersPkg.vhd
+analyze ${SourceDirectory}/AddressBusTransactionPkg.vhd
@@ -0,0 +1,10 @@
+# Build OSVVM and a verification component with its testbenches.
+if {$::osvvm::VhdlVersion >= 2019} {
+  set UseDeferred true
+} else {
+  set UseDeferred false
+}
+
+build  osvvm
+build  Common
+include UART
@@ -0,0 +1,5 @@
+library osvvm_uart
+analyze src/UartTbPkg.vhd
+analyze src/UartTx.vhd
+
+include testbench
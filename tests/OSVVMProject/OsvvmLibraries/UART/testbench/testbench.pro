@@ -0,0 +1,8 @@
+TestSuite Uart
+library osvvm_TbUart
+analyze TestCtrl_e.vhd
+analyze TbUart.vhd
+
+RunTest TbUart_SendGet1.vhd
+TestName TbUart_Alias
+simulate TbUart_SendGet1
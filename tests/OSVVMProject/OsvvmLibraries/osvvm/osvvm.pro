@@ -0,0 +1,16 @@
+library osvvm
+analyze NamePkg.vhd
+if {$UseDeferred} {
+  analyze ResolutionPkg_2019.vhd
+} else {
+  analyze ResolutionPkg.vhd
+}
+
+if {$::osvvm::ToolName eq "GHDL"} {
+  analyze TbUtilPkg_ghdl.vhd
+} elseif {$::osvvm::ToolName eq "NVC"} {
+  analyze TbUtilPkg_nvc.vhd
+} else {
+  analyze TbUtilPkg.vhd
+}
+analyze OsvvmContext.vhd
@@ -0,0 +1,90 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2022 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Benchmarks for computing the compile order of a design."""
+from pathlib  import Path
+from random   import Random
+from time     import perf_counter
+from unittest import TestCase
+
+from pyEDAA.ProjectModel import Design, FileSet, Project, VHDLLibrary, VHDLSourceFile
+
+from . import Report
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def CreateSyntheticDesign(fileCount: int, dependenciesPerFile: int, libraryCount: int) -> Design:
+	"""Create a design with ``fileCount`` VHDL files, each depending on up to ``dependenciesPerFile`` earlier files."""
+	design = Design("design", directory=Path("design"), project=Project("project"))
+	fileSet = FileSet("src", design=design)
+	libraries = [VHDLLibrary(f"lib_{i}", design=design) for i in range(libraryCount)]
+	files = [VHDLSourceFile(Path(f"file_{i}.vhdl"), vhdlLibrary=libraries[i * libraryCount // fileCount]) for i in range(fileCount)]
+	fileSet.AddFiles(reversed(files))
+
+	random = Random(42)
+	for i in range(1, fileCount):
+		for _ in range(dependenciesPerFile):
+			design.AddFileDependency(files[i], files[random.randrange(max(0, i - 1000), i)])
+
+	return design
+
+
+class CompileOrder(TestCase):
+	FILES = 20000
+	DEPENDENCIES_PER_FILE = 5
+	LIBRARIES = 20
+
+	def _Measure(self, fileCount: int) -> float:
+		design = CreateSyntheticDesign(fileCount, self.DEPENDENCIES_PER_FILE, self.LIBRARIES)
+		startTime = perf_counter()
+		order = design.CompileOrder()
+		libraries = design.VHDLLibraryCompileOrder()
+		duration = perf_counter() - startTime
+
+		self.assertEqual(fileCount, len(order))
+		self.assertEqual(self.LIBRARIES, len(libraries))
+		self.assertEqual([f"lib_{i}" for i in range(self.LIBRARIES)], [library.Name for library in libraries])
+		return duration
+
+	def test_LinearScaling(self):
+		small = self._Measure(self.FILES // 4)
+		large = self._Measure(self.FILES)
+
+		Report(
+			f"Compile order of {self.FILES // 4} files: {small * 1000:8.1f} ms",
+			f"Compile order of {self.FILES} files: {large * 1000:8.1f} ms",
+		)
+
+		self.assertLess(large, small * 4 * 2)
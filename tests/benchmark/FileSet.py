@@ -0,0 +1,94 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2022 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Benchmarks for creating many files in a fileset."""
+from gc       import collect, disable, enable
+from pathlib  import Path
+from time     import perf_counter
+from unittest import TestCase
+
+from pyVHDLModel import VHDLVersion
+
+from pyEDAA.ProjectModel import Design, FileSet, TextFile, VHDLLibrary, VHDLSourceFile
+
+from . import Report
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class AddPaths(TestCase):
+	FILES = 50000
+	REPETITIONS = 5
+
+	def _Measure(self, bulk: bool, fileType, **kwargs) -> float:
+		"""
+		Return the best time of all repetitions.
+
+		The garbage collector is paused while timing, because its runs dominate the variance between repetitions.
+		"""
+		durations = []
+		for _ in range(self.REPETITIONS):
+			design = Design("design")
+			fileSet = FileSet("fileset", design=design)
+			if fileType is VHDLSourceFile:
+				kwargs["vhdlLibrary"] = VHDLLibrary("library", design=design)
+			paths = [Path(f"file_{i}.vhdl") for i in range(self.FILES)]
+
+			collect()
+			disable()
+			try:
+				startTime = perf_counter()
+				if bulk:
+					fileSet.AddPaths(paths, fileType, **kwargs)
+				else:
+					for path in paths:
+						fileType(path, fileSet=fileSet, **kwargs)
+				durations.append(perf_counter() - startTime)
+			finally:
+				enable()
+
+			self.assertEqual(self.FILES, fileSet.FileCount())
+
+		return min(durations)
+
+	def test_AddPaths(self):
+		lines = [f"Creating {self.FILES} files in a fileset (best of {self.REPETITIONS}):"]
+		for fileType, kwargs in ((VHDLSourceFile, {"vhdlVersion": VHDLVersion.VHDL2008}), (TextFile, {})):
+			perFile = self._Measure(False, fileType, **kwargs)
+			bulk = self._Measure(True, fileType, **kwargs)
+			lines.append(f"  {fileType.__name__ + ':':16} {perFile * 1000:6.0f} ms per-file, {bulk * 1000:5.0f} ms bulk ({perFile / bulk:.1f}x)")
+
+			self.assertLess(bulk, perFile)
+
+		Report(*lines)
@@ -0,0 +1,111 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2022 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Benchmarks for reading ISE project files."""
+from pathlib      import Path
+from tempfile     import TemporaryDirectory
+from time         import perf_counter
+from tracemalloc  import start as tracemalloc_start, stop as tracemalloc_stop, get_traced_memory
+from unittest     import TestCase
+
+from pyEDAA.ProjectModel.Xilinx.ISE    import ISEProjectFile
+from pyEDAA.ProjectModel.Xilinx.Vivado import VivadoProjectFile
+
+from .              import Report
+from .VivadoProject import WriteSyntheticProject as WriteSyntheticVivadoProject
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def WriteSyntheticProject(path: Path, libraryCount: int, filesPerLibrary: int) -> None:
+	"""Write a synthetic ``*.xise`` file with ``libraryCount`` VHDL libraries of ``filesPerLibrary`` VHDL files each."""
+	with path.open("w", encoding="utf-8") as file:
+		file.write('<?xml version="1.0" encoding="UTF-8" standalone="no" ?>\n<project xmlns="http://www.xilinx.com/XMLSchema" xmlns:xil_pn="http://www.xilinx.com/XMLSchema">\n  <files>\n')
+		seqID = 1
+		for i in range(libraryCount):
+			for j in range(filesPerLibrary):
+				file.write(
+					f'    <file xil_pn:name="../src/{i}/file_{j}.vhdl" xil_pn:type="FILE_VHDL">\n'
+					f'      <association xil_pn:name="BehavioralSimulation" xil_pn:seqID="{seqID}"/>\n'
+					f'      <association xil_pn:name="Implementation" xil_pn:seqID="{seqID}"/>\n'
+					f'      <library xil_pn:name="lib_{i}"/>\n'
+					f'    </file>\n'
+				)
+				seqID += 1
+		file.write('  </files>\n  <properties>\n    <property xil_pn:name="VHDL Source Analysis Standard" xil_pn:value="VHDL-200X" xil_pn:valueState="non-default"/>\n  </properties>\n  <libraries>\n')
+		for i in range(libraryCount):
+			file.write(f'    <library xil_pn:name="lib_{i}"/>\n')
+		file.write('  </libraries>\n</project>\n')
+
+
+class Parsing(TestCase):
+	LIBRARIES = 10
+	FILES_PER_LIBRARY = 1000
+
+	@staticmethod
+	def _Measure(projectFile):
+		startTime = perf_counter()
+		projectFile.Parse()
+		duration = perf_counter() - startTime
+
+		tracemalloc_start()
+		try:
+			projectFile.__class__(projectFile.Path).Parse()
+			_, peak = get_traced_memory()
+		finally:
+			tracemalloc_stop()
+
+		return projectFile.ProjectModel, duration, peak
+
+	def test_ComparedToVivado(self):
+		with TemporaryDirectory() as tempDirectory:
+			xisePath = Path(tempDirectory) / "synthetic.xise"
+			xprPath = Path(tempDirectory) / "synthetic.xpr"
+			WriteSyntheticProject(xisePath, self.LIBRARIES, self.FILES_PER_LIBRARY)
+			WriteSyntheticVivadoProject(xprPath, self.LIBRARIES, self.FILES_PER_LIBRARY)
+
+			iseProject,    iseTime,    isePeak =    self._Measure(ISEProjectFile(xisePath))
+			vivadoProject, vivadoTime, vivadoPeak = self._Measure(VivadoProjectFile(xprPath))
+
+		Report(
+			f"Project with {self.LIBRARIES * self.FILES_PER_LIBRARY} files:",
+			f"  ISE (*.xise):   {iseTime * 1000:8.1f} ms   peak memory {isePeak / 2**20:7.1f} MiB",
+			f"  Vivado (*.xpr): {vivadoTime * 1000:8.1f} ms   peak memory {vivadoPeak / 2**20:7.1f} MiB",
+		)
+
+		self.assertEqual(self.LIBRARIES * self.FILES_PER_LIBRARY, iseProject.DefaultDesign.FileCount())
+		self.assertEqual(self.LIBRARIES, len(iseProject.DefaultDesign.VHDLLibraries))
+
+		# both readers are streaming expat readers building the same model, so they should perform alike
+		self.assertLess(iseTime, 2 * vivadoTime)
+		self.assertLess(isePeak, 2 * vivadoPeak)
@@ -0,0 +1,108 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2022 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Benchmarks for reading OSVVM project files."""
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from time     import perf_counter
+from unittest import TestCase
+
+from pyEDAA.ProjectModel       import VHDLSourceFile
+from pyEDAA.ProjectModel.OSVVM import OSVVMProjectFile
+
+from . import Report
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def WriteSyntheticTree(path: Path, componentCount: int, filesPerComponent: int, testsPerComponent: int) -> None:
+	"""
+	Write a synthetic OSVVM library tree: a top-level ``build.pro`` including ``componentCount`` component directories.
+
+	Each component has a ``build.pro`` with ``filesPerComponent`` analyzed files, some of them in ``if`` blocks, and a
+	testbench directory with ``testsPerComponent`` testcases.
+	"""
+	(path / "OsvvmLibraries.pro").write_text(
+		"if {$::osvvm::VhdlVersion >= 2019} {\n  set UseDeferred true\n} else {\n  set UseDeferred false\n}\n" +
+		"".join(f"build component_{i}\n" for i in range(componentCount))
+	)
+	for i in range(componentCount):
+		componentPath = path / f"component_{i}"
+		(componentPath / "testbench").mkdir(parents=True)
+
+		lines = [f"library component_{i}\n"]
+		for j in range(filesPerComponent):
+			if j % 10 == 0:
+				lines.append(f"if {{$UseDeferred}} {{\n  analyze src/file_{j}_2019.vhd\n}} else {{\n  analyze src/file_{j}.vhd\n}}\n")
+			else:
+				lines.append(f"analyze src/file_{j}.vhd\n")
+		lines.append("include testbench\n")
+		(componentPath / "build.pro").write_text("".join(lines))
+
+		lines = [f"TestSuite component_{i}\n", f"library tb_component_{i}\n", "analyze TestCtrl_e.vhd\n", "analyze TbComponent.vhd\n"]
+		lines.extend(f"RunTest TbComponent_Test{j}.vhd\n" for j in range(testsPerComponent))
+		(componentPath / "testbench" / "testbench.pro").write_text("".join(lines))
+
+
+class Interpreter(TestCase):
+	COMPONENTS = 40
+	FILES_PER_COMPONENT = 20
+	TESTS_PER_COMPONENT = 20
+
+	def test_LibraryTree(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			WriteSyntheticTree(tempPath, self.COMPONENTS, self.FILES_PER_COMPONENT, self.TESTS_PER_COMPONENT)
+
+			durations = {}
+			for concurrent in (False, True):
+				proFile = OSVVMProjectFile(tempPath / "OsvvmLibraries.pro")
+				startTime = perf_counter()
+				proFile.Parse(concurrent=concurrent)
+				durations[concurrent] = perf_counter() - startTime
+
+				project = proFile.ProjectModel
+				self.assertEqual(
+					self.COMPONENTS * (self.FILES_PER_COMPONENT + 2 + self.TESTS_PER_COMPONENT),
+					len(list(project.DefaultDesign.Files(VHDLSourceFile)))
+				)
+				self.assertEqual(self.COMPONENTS, len(project.Testsuites))
+
+		Report(
+			f"OSVVM library tree with {self.COMPONENTS * 2 + 1} project files:",
+			f"  sequential: {durations[False] * 1000:8.1f} ms",
+			f"  concurrent: {durations[True] * 1000:8.1f} ms",
+		)
+
+		self.assertLess(durations[False], 1.0)
@@ -0,0 +1,81 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2022 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Benchmarks for reading Quartus settings files."""
+from pathlib      import Path
+from tempfile     import TemporaryDirectory
+from time         import perf_counter
+from unittest     import TestCase
+
+from pyEDAA.ProjectModel.Intel.QuartusPrime import QuartusSettingsFile
+
+from . import Report
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def WriteSyntheticSettings(path: Path, fileCount: int, pinCount: int) -> None:
+	"""Write a synthetic ``*.qsf`` file with ``fileCount`` VHDL files and ``pinCount`` pins (location + I/O standard)."""
+	with path.open("w", encoding="utf-8") as file:
+		file.write('set_global_assignment -name FAMILY "Cyclone V"\nset_global_assignment -name DEVICE 5CSEMA5F31C6\n')
+		for i in range(fileCount):
+			file.write(f"set_global_assignment -name VHDL_FILE ../src/{i // 100}/file_{i}.vhdl -library lib_{i // 100}\n")
+		for i in range(pinCount):
+			file.write(f'set_location_assignment PIN_{i} -to Data[{i}]\nset_instance_assignment -name IO_STANDARD "3.3-V LVTTL" -to Data[{i}]\n')
+
+
+class Parsing(TestCase):
+	FILES = 5000
+	PINS = 10000
+
+	def _Measure(self, qsfPath: Path) -> float:
+		startTime = perf_counter()
+		qsfFile = QuartusSettingsFile(qsfPath)
+		qsfFile.Parse()
+		return perf_counter() - startTime
+
+	def test_LinearScaling(self):
+		with TemporaryDirectory() as tempDirectory:
+			durations = []
+			for factor in (1, 4):
+				qsfPath = Path(tempDirectory) / f"synthetic_{factor}.qsf"
+				WriteSyntheticSettings(qsfPath, self.FILES * factor, self.PINS * factor)
+				durations.append(self._Measure(qsfPath))
+
+			Report(
+				f"{self.FILES} files, {self.PINS} pins:     {durations[0]:.3f} s",
+				f"{4 * self.FILES} files, {4 * self.PINS} pins:    {durations[1]:.3f} s ({durations[1] / durations[0]:.1f}x)",
+			)
+
+			# 4x the input shouldn't take much more than 4x the time
+			self.assertLess(durations[1], 6 * durations[0])
@@ -0,0 +1,103 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2022 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Benchmarks for scanning dependencies between VHDL source files."""
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from time     import perf_counter
+from unittest import TestCase
+
+from pyEDAA.ProjectModel      import Design, FileSet, Project, VHDLLibrary, VHDLSourceFile
+from pyEDAA.ProjectModel.VHDL import VHDLDependencyScanner
+
+from . import Report
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def WriteSyntheticDesign(directory: Path, fileCount: int) -> Design:
+	"""Write ``fileCount`` VHDL files: a package and an entity instantiating up to 4 earlier entities per file."""
+	design = Design("design", directory=directory, project=Project("project"))
+	library = VHDLLibrary("lib", design=design)
+	fileSet = FileSet("src", design=design)
+
+	body = "".join(f"  -- statement {j}: s{j} <= not s{j} when rising_edge(clk);\n  s{j} <= '1';\n" for j in range(40))
+	for i in range(fileCount):
+		instances = "".join(f"  u{j} : entity work.unit_{j} port map (clk => clk);\n" for j in range(max(0, i - 4), i))
+		(directory / f"unit_{i}.vhdl").write_text(
+			f"library ieee;\nuse ieee.std_logic_1164.all;\nuse work.pkg_{i // 2}.all;\n\n"
+			f"package pkg_{i} is\n  constant C : string := \"unit {i}\";\nend package;\n\n"
+			f"entity unit_{i} is\n  port (clk : in std_logic);\nend entity;\n\n"
+			f"architecture rtl of unit_{i} is\nbegin\n{instances}{body}end architecture;\n"
+		)
+		fileSet.AddFile(VHDLSourceFile(Path(f"unit_{i}.vhdl"), vhdlLibrary=library))
+
+	return design
+
+
+class Scanner(TestCase):
+	FILES = 4000
+
+	def test_Scan(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			design = WriteSyntheticDesign(tempPath, self.FILES)
+
+			durations = {}
+			for maxWorkers in (1, None):
+				startTime = perf_counter()
+				VHDLDependencyScanner().Scan(design, maxWorkers=maxWorkers)
+				durations[maxWorkers] = perf_counter() - startTime
+
+			scanner = VHDLDependencyScanner(tempPath / "scan.pickle")
+			scanner.Scan(design)
+			startTime = perf_counter()
+			VHDLDependencyScanner(tempPath / "scan.pickle").Scan(design)
+			cachedTime = perf_counter() - startTime
+
+			startTime = perf_counter()
+			order = design.CompileOrder()
+			orderTime = perf_counter() - startTime
+
+		Report(
+			f"Scanning {self.FILES} VHDL files:",
+			f"  one process:   {durations[1] * 1000:8.1f} ms",
+			f"  process pool:  {durations[None] * 1000:8.1f} ms",
+			f"  cached:        {cachedTime * 1000:8.1f} ms",
+			f"  compile order: {orderTime * 1000:8.1f} ms",
+		)
+
+		self.assertEqual(self.FILES, len(order))
+		self.assertEqual("unit_0.vhdl", order[0].Path.name)
+		self.assertLess(cachedTime, durations[1])
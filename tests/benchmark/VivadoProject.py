@@ -0,0 +1,142 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2022 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Benchmarks for reading Vivado project files."""
+from pathlib      import Path
+from tempfile     import TemporaryDirectory
+from time         import perf_counter
+from tracemalloc  import start as tracemalloc_start, stop as tracemalloc_stop, get_traced_memory
+from unittest     import TestCase
+
+from pyEDAA.ProjectModel.Xilinx.Vivado import VivadoProjectFile
+
+from . import Report
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def WriteSyntheticProject(path: Path, fileSetCount: int, filesPerFileSet: int) -> None:
+	"""Write a synthetic ``*.xpr`` file with ``fileSetCount`` filesets of ``filesPerFileSet`` VHDL files each."""
+	with path.open("w", encoding="utf-8") as file:
+		file.write('<?xml version="1.0" encoding="UTF-8"?>\n<Project Version="7" Minor="55">\n  <FileSets Version="1" Minor="31">\n')
+		for i in range(fileSetCount):
+			file.write(f'    <FileSet Name="src_{i}" Type="DesignSrcs" RelSrcDir="$PSRCDIR/src_{i}">\n      <Filter Type="Srcs"/>\n')
+			for j in range(filesPerFileSet):
+				file.write(
+					f'      <File Path="$PPRDIR/../src/{i}/file_{j}.vhdl">\n'
+					f'        <FileInfo SFType="VHDL2008">\n'
+					f'          <Attr Name="Library" Val="lib_{i}"/>\n'
+					f'          <Attr Name="UsedIn" Val="synthesis"/>\n'
+					f'          <Attr Name="UsedIn" Val="simulation"/>\n'
+					f'        </FileInfo>\n'
+					f'      </File>\n'
+				)
+			file.write(f'      <Config>\n        <Option Name="TopModule" Val="top_{i}"/>\n      </Config>\n    </FileSet>\n')
+		file.write('  </FileSets>\n</Project>\n')
+
+
+class Parsing(TestCase):
+	FILESETS = 20
+	FILES_PER_FILESET = 1000
+
+	def _Measure(self, xprPath: Path, streaming: bool):
+		xprFile = VivadoProjectFile(xprPath)
+		startTime = perf_counter()
+		xprFile.Parse(streaming=streaming)
+		duration = perf_counter() - startTime
+
+		tracemalloc_start()
+		try:
+			VivadoProjectFile(xprPath).Parse(streaming=streaming)
+			_, peak = get_traced_memory()
+		finally:
+			tracemalloc_stop()
+
+		return xprFile.ProjectModel, duration, peak
+
+	def test_StreamingVsDOM(self):
+		with TemporaryDirectory() as tempDirectory:
+			xprPath = Path(tempDirectory) / "synthetic.xpr"
+			WriteSyntheticProject(xprPath, self.FILESETS, self.FILES_PER_FILESET)
+
+			domProject,       domTime,       domPeak =       self._Measure(xprPath, streaming=False)
+			streamingProject, streamingTime, streamingPeak = self._Measure(xprPath, streaming=True)
+
+		Report(
+			f"Vivado project with {self.FILESETS * self.FILES_PER_FILESET} files ({xprPath.name}):",
+			f"  minidom:   {domTime * 1000:8.1f} ms   peak memory {domPeak / 2**20:7.1f} MiB",
+			f"  streaming: {streamingTime * 1000:8.1f} ms   peak memory {streamingPeak / 2**20:7.1f} MiB",
+		)
+
+		for project in (domProject, streamingProject):
+			self.assertEqual(self.FILESETS * self.FILES_PER_FILESET, project.DefaultDesign.FileCount())
+		self.assertLess(streamingPeak, domPeak)
+
+
+class Writing(TestCase):
+	FILESETS = 20
+	FILES_PER_FILESET = 1000
+	REPETITIONS = 3
+
+	def test_FullVsIncremental(self):
+		with TemporaryDirectory() as tempDirectory:
+			xprPath = Path(tempDirectory) / "synthetic.xpr"
+			WriteSyntheticProject(xprPath, self.FILESETS, self.FILES_PER_FILESET)
+			xprFile = VivadoProjectFile(xprPath)
+			xprFile.Parse()
+
+			fullTimes = []
+			for _ in range(self.REPETITIONS):
+				startTime = perf_counter()
+				VivadoProjectFile(Path(tempDirectory) / "full.xpr").Write(xprFile.ProjectModel)
+				fullTimes.append(perf_counter() - startTime)
+
+			incrementalTimes = []
+			for i in range(self.REPETITIONS):
+				xprFile.Parse()
+				xprFile.ProjectModel.DefaultDesign.FileSets["src_7"].TopLevel = f"changed_{i}"
+				startTime = perf_counter()
+				self.assertTrue(xprFile.Write(incremental=True))
+				incrementalTimes.append(perf_counter() - startTime)
+
+			xprFile.Parse()
+			self.assertEqual(f"changed_{self.REPETITIONS - 1}", xprFile.ProjectModel.DefaultDesign.FileSets["src_7"].TopLevel)
+
+		fullTime = min(fullTimes)
+		incrementalTime = min(incrementalTimes)
+		Report(
+			f"Writing a Vivado project with {self.FILESETS * self.FILES_PER_FILESET} files (best of {self.REPETITIONS}):",
+			f"  full:        {fullTime * 1000:8.1f} ms",
+			f"  incremental: {incrementalTime * 1000:8.1f} ms (one changed fileset)",
+		)
+		self.assertLess(incrementalTime, fullTime)
@@ -0,0 +1,165 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2022 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the parse cache."""
+from os       import chdir, utime
+from pathlib  import Path
+from shutil   import copyfile, copytree
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pyEDAA.ProjectModel.Cache         import ParseCache
+from pyEDAA.ProjectModel.OSVVM         import OSVVMProjectFile
+from pyEDAA.ProjectModel.Xilinx.Vivado import VivadoProjectFile
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Vivado(TestCase):
+	def test_StoreAndLoad(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			xprPath = tempPath / "StopWatch.xpr"
+			copyfile(Path.cwd() / "VivadoProject/StopWatch/project/StopWatch.xpr", xprPath)
+			cache = ParseCache(tempPath / "cache")
+
+			xprFile = VivadoProjectFile(xprPath)
+			self.assertIsNone(cache.Load(xprFile))
+			xprFile.Parse(cache=cache)
+			self.assertEqual(1, len(list(cache.Directory.glob("*.pickle"))))
+
+			cachedProject = cache.Load(xprFile)
+			self.assertIsNotNone(cachedProject)
+			self.assertEqual(xprFile.ProjectModel.Name, cachedProject.Name)
+			self.assertListEqual(list(xprFile.ProjectModel.DefaultDesign.FileSets.keys()), list(cachedProject.DefaultDesign.FileSets.keys()))
+			self.assertIs(cachedProject.Runs["synth_Display"], cachedProject.Runs["impl_Display"].SynthesisRun)
+
+			xprFile2 = VivadoProjectFile(xprPath)
+			xprFile2.Parse(cache=cache)
+			self.assertEqual(29, xprFile2.ProjectModel.DefaultDesign.FileCount())
+
+			# a changed project file has a different content hash
+			xprPath.write_text(xprPath.read_text().replace("toplevel_tb", "other_tb"))
+			self.assertIsNone(cache.Load(xprFile))
+			xprFile.Parse(cache=cache)
+			self.assertEqual("other_tb", xprFile.ProjectModel.DefaultDesign.FileSets["sim_StopWatch"].TopLevel)
+
+			cache.Clear()
+			self.assertIsNone(cache.Load(xprFile))
+
+	def test_LoadFromOtherWorkingDirectory(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory).resolve()
+			copytree(Path.cwd() / "VivadoProject/StopWatch", tempPath / "VivadoProject/StopWatch")
+			cache = ParseCache(tempPath / "cache")
+
+			workingDirectory = Path.cwd()
+			try:
+				chdir(tempPath)
+				xprFile = VivadoProjectFile(Path("VivadoProject/StopWatch/project/StopWatch.xpr"))
+				xprFile.Parse(cache=cache)
+				# store a model with populated caches of resolved paths
+				for file in xprFile.ProjectModel.DefaultDesign.Files():
+					self.assertTrue(file.ResolvedPath.exists())
+				cache.Store(xprFile, xprFile.ProjectModel)
+
+				chdir(tempPath / "VivadoProject")
+				xprFile2 = VivadoProjectFile(Path("StopWatch/project/StopWatch.xpr"))
+				self.assertIsNotNone(cache.Load(xprFile2))
+				xprFile2.Parse(cache=cache)
+
+				project = xprFile2.ProjectModel
+				self.assertEqual(Path("StopWatch/project"), project.RootDirectory)
+				self.assertEqual(29, project.DefaultDesign.FileCount())
+				for file in project.DefaultDesign.Files():
+					self.assertTrue(file.ResolvedPath.exists(), f"{file.ResolvedPath} doesn't exist.")
+			finally:
+				chdir(workingDirectory)
+
+	def test_StoreParsedContent(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			xprPath = tempPath / "StopWatch.xpr"
+			copyfile(Path.cwd() / "VivadoProject/StopWatch/project/StopWatch.xpr", xprPath)
+			cache = ParseCache(tempPath / "cache")
+
+			xprFile = VivadoProjectFile(xprPath)
+			xprFile.Parse()
+			content = xprPath.read_bytes()
+
+			# the file changed after it was parsed, so the entry must not be used for the new content
+			xprPath.write_bytes(content.replace(b"toplevel_tb", b"other_tb"))
+			cache.Store(xprFile, xprFile.ProjectModel, content=content)
+			self.assertIsNone(cache.Load(xprFile))
+
+			xprPath.write_bytes(content)
+			self.assertIsNotNone(cache.Load(xprFile))
+
+	def test_CorruptedEntry(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			cache = ParseCache(tempPath / "cache")
+
+			xprFile = VivadoProjectFile(Path.cwd() / "VivadoProject/StopWatch/project/StopWatch.xpr")
+			xprFile.Parse(cache=cache)
+			for entryPath in cache.Directory.glob("*.pickle"):
+				entryPath.write_bytes(b"garbage")
+
+			self.assertIsNone(cache.Load(xprFile))
+			xprFile.Parse(cache=cache)
+			self.assertIsNotNone(cache.Load(xprFile))
+
+
+class OSVVM(TestCase):
+	def test_IncludedFileChanged(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			(tempPath / "sub").mkdir()
+			(tempPath / "top.pro").write_text("analyze a.vhdl\ninclude sub/sub.pro\n")
+			includePath = tempPath / "sub" / "sub.pro"
+			includePath.write_text("analyze b.vhdl\n")
+			cache = ParseCache(tempPath / "cache")
+
+			proFile = OSVVMProjectFile(tempPath / "top.pro")
+			proFile.Parse(cache=cache)
+			self.assertListEqual([Path("b.vhdl"), Path("a.vhdl")], [file.Path for file in proFile.ProjectModel.DefaultDesign.Files()])
+			self.assertIsNotNone(cache.Load(proFile))
+
+			includePath.write_text("analyze b.vhdl\nanalyze c.vhdl\n")
+			stat = includePath.stat()
+			utime(includePath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+			self.assertIsNone(cache.Load(proFile))
+
+			proFile.Parse(cache=cache)
+			self.assertListEqual([Path("b.vhdl"), Path("c.vhdl"), Path("a.vhdl")], [file.Path for file in proFile.ProjectModel.DefaultDesign.Files()])
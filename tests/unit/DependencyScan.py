@@ -30,12 +30,14 @@
 #
 """Instantiation tests for the project model."""
 from pathlib     import Path
+from tempfile    import TemporaryDirectory
 from unittest    import TestCase
 
 from pytest      import mark
 from pyVHDLModel import VHDLVersion
 
 from pyEDAA.ProjectModel      import Design, VHDLLibrary, Project, VHDLSourceFile, VerilogSourceFile, FileSet
+from pyEDAA.ProjectModel.VHDL import ScanVHDL, VHDLDependencyScanner, DesignUnit, DesignUnitKind, Reference, ReferenceKind
 
 try:
 	from pyGHDL.libghdl         import LibGHDLException
@@ -102,3 +104,118 @@ class VHDL(TestCase):
 		print(f"Toplevel: {design.TopLevel}")
 		hierarchy = design.TopLevel.HierarchyVertex.ConvertToTree()
 		print(hierarchy.Render())
+
+
+class Scanner(TestCase):
+	def test_ScanVHDL(self):
+		result = ScanVHDL(b"""
+			-- library commented; use commented.pkg.all;
+			library ieee, osvvm;
+			use ieee.std_logic_1164.all, work.Utilities.all;
+			context osvvm.OsvvmContext;
+
+			entity Top is
+			end entity;
+
+			architecture rtl of Top is
+				constant c : string := "use quoted.pkg.all;";
+				signal s : std_logic := '0';
+			begin
+				u1 : entity work.Child(rtl) port map (a => s'event);
+				u2 : Counter generic map (8) port map (s);
+				u3 : configuration lib2.Cfg;
+			end architecture;
+
+			package Fifo is new lib3.GenericFifo generic map (8);
+			package body Utilities is
+			end package body;
+		""")
+
+		self.assertEqual(("ieee", "osvvm"), result.Libraries)
+		self.assertEqual(
+			(
+				DesignUnit(DesignUnitKind.Entity, "top", None),
+				DesignUnit(DesignUnitKind.Architecture, "rtl", "top"),
+				DesignUnit(DesignUnitKind.Package, "fifo", None),
+				DesignUnit(DesignUnitKind.PackageBody, "utilities", "utilities"),
+			),
+			result.DesignUnits
+		)
+		self.assertEqual(
+			(
+				Reference(ReferenceKind.Use, "ieee", "std_logic_1164"),
+				Reference(ReferenceKind.Use, "work", "utilities"),
+				Reference(ReferenceKind.Context, "osvvm", "osvvmcontext"),
+				Reference(ReferenceKind.Entity, "work", "child"),
+				Reference(ReferenceKind.Component, None, "counter"),
+				Reference(ReferenceKind.Configuration, "lib2", "cfg"),
+				Reference(ReferenceKind.Use, "lib3", "genericfifo"),
+			),
+			result.References
+		)
+
+	def _WriteDesign(self, directory: Path) -> Design:
+		sources = {
+			"top.vhdl":      "library common; use common.Types.all;\nentity top is end;\narchitecture rtl of top is begin\n  c : counter port map (x);\n  f : entity work.filter;\nend;\n",
+			"filter.vhdl":   "use work.FilterPkg.all;\nentity Filter is end;\n",
+			"filter_a.vhdl": "architecture rtl of filter is begin end;\n",
+			"filterpkg.vhdl": "package FilterPkg is end;\n",
+			"counter.vhdl":  "library common; context common.CommonContext;\nentity counter is end;\n",
+			"types.vhdl":    "package types is end package;\npackage body types is end package body;\n",
+			"context.vhdl":  "context CommonContext is library common; use common.types.all; end context;\n",
+		}
+		for name, source in sources.items():
+			(directory / name).write_text(source)
+
+		design = Design("design", directory=directory, project=Project("project"))
+		common = VHDLLibrary("common", design=design)
+		lib = VHDLLibrary("lib", design=design)
+		fileSet = FileSet("src", design=design)
+		for name in ("top.vhdl", "filter_a.vhdl", "filter.vhdl", "filterpkg.vhdl", "counter.vhdl"):
+			fileSet.AddFile(VHDLSourceFile(Path(name), vhdlLibrary=lib))
+		for name in ("context.vhdl", "types.vhdl"):
+			fileSet.AddFile(VHDLSourceFile(Path(name), vhdlLibrary=common))
+		return design
+
+	def test_CompileOrder(self):
+		for maxWorkers in (1, 2):
+			with TemporaryDirectory() as tempDirectory:
+				design = self._WriteDesign(Path(tempDirectory))
+
+				results = VHDLDependencyScanner().Scan(design, maxWorkers=maxWorkers)
+				self.assertEqual(7, len(results))
+
+				self.assertListEqual(
+					["filterpkg.vhdl", "types.vhdl", "filter.vhdl", "context.vhdl", "filter_a.vhdl", "counter.vhdl", "top.vhdl"],
+					[file.Path.name for file in design.CompileOrder()]
+				)
+				top = next(file for file in results if file.Path.name == "top.vhdl")
+				self.assertListEqual(["types.vhdl", "counter.vhdl", "filter.vhdl"], [file.Path.name for file in design.FileDependencies(top)])
+				self.assertListEqual(["common", "lib"], [library.Name for library in design.VHDLLibraryCompileOrder()])
+
+	def test_CacheFile(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			design = self._WriteDesign(tempPath)
+			cacheFile = tempPath / "cache" / "scan.pickle"
+
+			results = VHDLDependencyScanner(cacheFile).Scan(design, maxWorkers=1)
+			self.assertTrue(cacheFile.exists())
+
+			scanner = VHDLDependencyScanner(cacheFile)
+			self.assertEqual(7, len(scanner._results))
+			self.assertDictEqual(results, scanner.Scan(design, maxWorkers=1))
+
+			(tempPath / "types.vhdl").write_text("package types is end package;\n")
+			scanner.Scan(design, maxWorkers=1)
+			self.assertEqual(8, len(VHDLDependencyScanner(cacheFile)._results))
+
+			cacheFile.write_bytes(b"corrupted")
+			self.assertEqual(0, len(VHDLDependencyScanner(cacheFile)._results))
+
+	def test_FileNotFound(self):
+		design = Design("design", directory=Path("missing"), project=Project("project"))
+		FileSet("src", design=design).AddFile(VHDLSourceFile(Path("missing.vhdl")))
+
+		with self.assertRaises(Exception):
+			VHDLDependencyScanner().Scan(design)
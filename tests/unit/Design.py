@@ -31,11 +31,13 @@
 """Instantiation tests for the project model."""
 from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
 from pySVModel import VerilogVersion, SystemVerilogVersion
 from pyVHDLModel import VHDLVersion
 
-from pyEDAA.ProjectModel import Design, File, Project
+import pyEDAA.ProjectModel
+from pyEDAA.ProjectModel import Design, File, Project, FileSet, VHDLLibrary, VHDLSourceFile, VerilogSourceFile
 
 
 if __name__ == "__main__": # pragma: no cover
@@ -130,6 +132,25 @@ class Properties(TestCase):
 		self.assertEqual(verilogVersion, design.VerilogVersion)
 		self.assertEqual(svVersion, design.SVVersion)
 
+	def test_ChangeVersionsOfProject(self):
+		project = Project("project", vhdlVersion=VHDLVersion.VHDL2008)
+		design = Design("design", project=project)
+
+		self.assertEqual(VHDLVersion.VHDL2008, design.VHDLVersion)
+		# a design without own versions shares the project's snapshot
+		self.assertIs(project._EffectiveSettings(), design._EffectiveSettings())
+
+		project.VHDLVersion = VHDLVersion.VHDL2019
+		self.assertEqual(VHDLVersion.VHDL2019, design.VHDLVersion)
+
+		design.VHDLVersion = VHDLVersion.VHDL93
+		project.VHDLVersion = VHDLVersion.VHDL2008
+		self.assertEqual(VHDLVersion.VHDL93, design.VHDLVersion)
+		self.assertEqual(VHDLVersion.VHDL2008, project.VHDLVersion)
+
+		with self.assertRaises(Exception):
+			_ = design.VerilogVersion
+
 	def test_Files(self):
 		project = Design("project")
 
@@ -139,9 +160,142 @@ class Properties(TestCase):
 		self.assertListEqual([file], [f for f in project.Files()])
 
 
+class FileLookup(TestCase):
+	def test_GetFile(self):
+		projectDirectoryPath = Path.cwd() / "project"
+		project = Project("project", rootDirectory=projectDirectoryPath)
+		design = Design("design", directory=Path("designA"), project=project)
+		file1 = File(Path("file_A1.vhdl"), design=design)
+
+		self.assertIs(file1, design.GetFile("file_A1.vhdl"))
+		self.assertIs(file1, design.GetFile(projectDirectoryPath / "designA/file_A1.vhdl"))
+		self.assertIs(file1, design.GetFile(Path("../designA/./file_A1.vhdl")))
+		self.assertIn("file_A1.vhdl", design)
+		self.assertNotIn("file_A2.vhdl", design)
+		with self.assertRaises(Exception):
+			design.GetFile("file_A2.vhdl")
+
+		file2 = File(Path("file_A2.vhdl"), design=design)
+		self.assertIs(file2, design.GetFile("file_A2.vhdl"))
+
+	def test_GetFileAfterMove(self):
+		project = Project("project", rootDirectory=Path.cwd() / "project")
+		design = Design("design", directory=Path("designA"), project=project)
+		file = File(Path("file_B1.vhdl"), design=design)
+
+		self.assertNotIn("file_B1.vhdl", project)
+		self.assertIn("designA/file_B1.vhdl", project)
+
+		design.DefaultFileSet.Directory = Path("../designB")
+
+		self.assertIs(file, project.GetFile("designB/file_B1.vhdl"))
+		self.assertNotIn("designA/file_B1.vhdl", project)
+
+	def test_CaseInsensitive(self):
+		project = Project("project", rootDirectory=Path.cwd() / "project")
+		design = Design("design", directory=Path("designA"), project=project)
+		file = File(Path("file_A1.vhdl"), design=design)
+
+		self.assertNotIn("FILE_A1.vhdl", design)
+
+		design.CaseSensitivePaths = False
+		self.assertIs(file, design.GetFile("FILE_A1.vhdl"))
+
+
 class Validate(TestCase):
 	def test_Design(self):
 		project = Project("project", rootDirectory=Path("project"))
 		design = Design("design", directory=Path("designA"), project=project)
 
 		design.Validate()
+
+
+class CompileOrder(TestCase):
+	def _Design(self):
+		design = Design("design", directory=Path("design"), project=Project("project"))
+		fileSet = FileSet("src", design=design)
+		libraryA = VHDLLibrary("libA", design=design)
+		libraryB = VHDLLibrary("libB", design=design)
+		files = [
+			VHDLSourceFile(Path("a_top.vhdl"), vhdlLibrary=libraryA),
+			VHDLSourceFile(Path("a_pkg.vhdl"), vhdlLibrary=libraryA),
+			VHDLSourceFile(Path("b_pkg.vhdl"), vhdlLibrary=libraryB),
+			VerilogSourceFile(Path("c.v")),
+		]
+		fileSet.AddFiles(files)
+		fileSet.AddFile(File(Path("readme.txt")))
+		return design, files
+
+	def test_Files(self):
+		design, (aTop, aPkg, bPkg, c) = self._Design()
+		design.AddFileDependency(aTop, aPkg)
+		design.AddFileDependency(aTop, bPkg)
+		design.AddFileDependency(aTop, bPkg)
+		design.AddFileDependency(aPkg, bPkg)
+		design.AddFileDependency(aPkg, aPkg)
+
+		self.assertListEqual([bPkg, c, aPkg, aTop], design.CompileOrder())
+		self.assertListEqual([aPkg, bPkg], design.FileDependencies(aTop))
+		self.assertListEqual([], design.FileDependencies(c))
+		self.assertEqual(4, design._fileDependencyGraph.VertexCount)
+		self.assertEqual(3, design._fileDependencyGraph.EdgeCount)
+
+	def test_Components(self):
+		for merge in (True, False):
+			with self.subTest(merge=merge), patch.object(pyEDAA.ProjectModel, "_COMPONENT_MERGE", merge):
+				design = Design("design", directory=Path("design"), project=Project("project"))
+				fileSet = FileSet("src", design=design)
+				files = [File(Path(f"file{i}.txt")) for i in range(8)]
+				fileSet.AddFiles(files)
+
+				# component {0, 1, 2, 3} and component {4, 5}
+				for i in (1, 2, 3):
+					design.AddFileDependency(files[i], files[0])
+				design.AddFileDependency(files[5], files[4])
+				# component {6, 7}
+				design.AddFileDependency(files[6], files[7])
+
+				graph = design._fileDependencyGraph
+				self.assertEqual(3, graph.ComponentCount)
+
+				# merge a smaller source component into a larger one and a larger source component into a smaller one
+				design.AddFileDependency(files[4], files[3])
+				design.AddFileDependency(files[0], files[6])
+
+				self.assertEqual(1, graph.ComponentCount)
+				component, = graph.Components
+				vertices = {graph.GetVertexByID(file) for file in files}
+				self.assertSetEqual(vertices, component.Vertices)
+				for vertex in vertices:
+					self.assertIs(component, vertex.Component)
+
+	def test_NoDependencies(self):
+		design, files = self._Design()
+
+		self.assertListEqual(files, design.CompileOrder())
+		self.assertListEqual(files[:3], design.CompileOrder(VHDLSourceFile))
+
+	def test_VHDLLibraries(self):
+		design, (aTop, aPkg, bPkg, c) = self._Design()
+		libraryC = VHDLLibrary("libC", design=design)
+		self.assertListEqual(["libA", "libB", "libC"], [library.Name for library in design.VHDLLibraryCompileOrder()])
+
+		design.AddFileDependency(aPkg, bPkg)
+		libraryC.AddDependency(design.VHDLLibraries["libA"])
+		self.assertListEqual(["libB", "libA", "libC"], [library.Name for library in design.VHDLLibraryCompileOrder()])
+		self.assertListEqual([design.VHDLLibraries["libB"]], design.VHDLLibraries["libA"].Dependencies)
+
+	def test_Cycle(self):
+		design, (aTop, aPkg, bPkg, c) = self._Design()
+		design.AddFileDependency(c, aTop)
+		design.AddFileDependency(aTop, aPkg)
+		design.AddFileDependency(aPkg, bPkg)
+		design.AddFileDependency(bPkg, aTop)
+
+		with self.assertRaises(Exception) as context:
+			design.CompileOrder()
+		self.assertEqual("Dependency cycle between files: a_top.vhdl -> a_pkg.vhdl -> b_pkg.vhdl -> a_top.vhdl", str(context.exception))
+
+		with self.assertRaises(Exception) as context:
+			design.VHDLLibraryCompileOrder()
+		self.assertIn("libA -> libB -> libA", str(context.exception))
@@ -30,6 +30,7 @@
 #
 """Instantiation tests for the project model."""
 from pathlib import Path
+from sys     import getrecursionlimit
 from unittest import TestCase
 
 from pyEDAA.ProjectModel            import Design, FileSet, File, Project, FileTypes
@@ -144,6 +145,24 @@ class Properties(TestCase):
 
 		self.assertEqual(f"{projectDirectoryPath.as_posix()}/{designDirectory}/{filePath}", file.ResolvedPath.as_posix())
 
+	def test_ResolveDirectoryAfterChange(self):
+		projectDirectoryPath = Path.cwd() / "project"
+
+		project = Project("project", projectDirectoryPath)
+		design = Design("design", directory=Path("designA"), project=project)
+		fileset = FileSet("fileset", directory=Path("."), design=design)
+		file = File(Path("file_A1.vhdl"), design=design)
+
+		self.assertIs(file.ResolvedPath, file.ResolvedPath)
+		self.assertEqual(f"{projectDirectoryPath.as_posix()}/designA/file_A1.vhdl", file.ResolvedPath.as_posix())
+
+		design.Directory = Path("designB")
+		self.assertEqual(f"{projectDirectoryPath.as_posix()}/designB/file_A1.vhdl", file.ResolvedPath.as_posix())
+
+		fileset.Directory = Path("../lib")
+		file.FileSet = fileset
+		self.assertEqual(f"{projectDirectoryPath.as_posix()}/lib/file_A1.vhdl", file.ResolvedPath.as_posix())
+
 
 class Validate(TestCase):
 	def test_File(self):
@@ -195,3 +214,50 @@ class Attributes(TestCase):
 
 		self.assertEqual("15", fileSet[KeyValueAttribute]["id1"])
 		self.assertEqual("-5", file[KeyValueAttribute]["id1"])
+
+	def test_InheritedFromProjectAndDesign(self):
+		project = Project("project", rootDirectory=Path("project"))
+		design = Design("design", directory=Path("designA"), project=project)
+		parent = FileSet("parent", design=design)
+		fileSet = FileSet("fileset", design=design, parent=parent)
+		file = File(Path("file_A1.vhdl"), fileSet=fileSet)
+
+		with self.assertRaises(Exception):
+			_ = file[KeyValueAttribute]
+
+		projectAttribute = KeyValueAttribute()
+		project[KeyValueAttribute] = projectAttribute
+		self.assertIs(projectAttribute, file[KeyValueAttribute])
+		self.assertIs(projectAttribute, fileSet[KeyValueAttribute])
+
+		designAttribute = KeyValueAttribute()
+		design[KeyValueAttribute] = designAttribute
+		self.assertIs(designAttribute, file[KeyValueAttribute])
+		self.assertIs(projectAttribute, project[KeyValueAttribute])
+
+		parentAttribute = KeyValueAttribute()
+		parent[KeyValueAttribute] = parentAttribute
+		self.assertIs(parentAttribute, file[KeyValueAttribute])
+		self.assertIs(designAttribute, design[KeyValueAttribute])
+
+		otherParent = FileSet("other", design=design)
+		fileSet.Parent = otherParent
+		self.assertIs(designAttribute, file[KeyValueAttribute])
+
+	def test_DeeplyNestedFileSets(self):
+		project = Project("project", rootDirectory=Path("project"))
+		design = Design("design", directory=Path("designA"), project=project)
+		fileSets = [FileSet("fileset0", design=design)]
+		for i in range(1, 2 * getrecursionlimit()):
+			fileSets.append(FileSet(f"fileset{i}", design=design, parent=fileSets[-1]))
+		file = File(Path("file_A1.vhdl"), fileSet=fileSets[-1])
+
+		projectAttribute = KeyValueAttribute()
+		project[KeyValueAttribute] = projectAttribute
+		self.assertIs(projectAttribute, file[KeyValueAttribute])
+
+		# a change in the middle of the chain invalidates the caches below
+		middleAttribute = KeyValueAttribute()
+		fileSets[len(fileSets) // 2][KeyValueAttribute] = middleAttribute
+		self.assertIs(middleAttribute, file[KeyValueAttribute])
+		self.assertIs(projectAttribute, fileSets[0][KeyValueAttribute])
@@ -35,7 +35,8 @@ from unittest import TestCase
 from pySVModel import VerilogVersion, SystemVerilogVersion
 from pyVHDLModel import VHDLVersion
 
-from pyEDAA.ProjectModel import Design, FileSet, File, FileTypes, TextFile, Project, VHDLLibrary
+from pyEDAA.ProjectModel import Design, FileSet, File, FileTypes, TextFile, Project, VHDLLibrary, TraversalOrder
+from pyEDAA.ProjectModel import VHDLSourceFile, VerilogSourceFile, SystemVerilogSourceFile
 
 
 if __name__ == "__main__": # pragma: no cover
@@ -109,6 +110,29 @@ class Properties(TestCase):
 
 		self.assertEqual(f"{projectDirectoryPath.as_posix()}/{designDirectory}/{filesetDirectoy}", fileset.ResolvedPath.as_posix())
 
+	def test_ResolveDirectoryAfterChange(self):
+		projectDirectoryPath = Path.cwd() / "project"
+
+		project = Project("project", projectDirectoryPath)
+		design = Design("design", directory=Path("designA"), project=project)
+		parent = FileSet("parent", directory=Path("parent"), design=design)
+		fileset = FileSet("fileset", directory=Path("fileset"), design=design)
+
+		self.assertIs(fileset.ResolvedPath, fileset.ResolvedPath)
+		self.assertEqual(f"{projectDirectoryPath.as_posix()}/designA/fileset", fileset.ResolvedPath.as_posix())
+
+		fileset.Directory = Path("lib")
+		self.assertEqual(f"{projectDirectoryPath.as_posix()}/designA/lib", fileset.ResolvedPath.as_posix())
+
+		design.Directory = Path("designB")
+		self.assertEqual(f"{projectDirectoryPath.as_posix()}/designB/lib", fileset.ResolvedPath.as_posix())
+
+		fileset.Parent = parent
+		self.assertEqual(f"{projectDirectoryPath.as_posix()}/designB/parent/lib", fileset.ResolvedPath.as_posix())
+
+		project.RootDirectory = Path.cwd() / "other"
+		self.assertEqual(f"{(Path.cwd() / 'other').as_posix()}/designB/parent/lib", fileset.ResolvedPath.as_posix())
+
 	def test_SetProjectLater(self):
 		project = Project("project")
 		fileset = FileSet("fileset")
@@ -189,6 +213,31 @@ class Properties(TestCase):
 		self.assertEqual(verilogVersion, fileset.VerilogVersion)
 		self.assertEqual(svVersion, fileset.SVVersion)
 
+	def test_VersionsChangedInParents(self):
+		project = Project("project", vhdlVersion=VHDLVersion.VHDL93)
+		design = Design("design", project=project)
+		parent = FileSet("parent", design=design)
+		fileset = FileSet("fileset", design=design, parent=parent)
+		file = VHDLSourceFile(Path("file.vhdl"), fileSet=fileset)
+
+		self.assertEqual(VHDLVersion.VHDL93, file.VHDLVersion)
+
+		project.VHDLVersion = VHDLVersion.VHDL2002
+		self.assertEqual(VHDLVersion.VHDL2002, file.VHDLVersion)
+
+		design.VHDLVersion = VHDLVersion.VHDL2008
+		self.assertEqual(VHDLVersion.VHDL2008, fileset.VHDLVersion)
+		self.assertEqual(VHDLVersion.VHDL2008, file.VHDLVersion)
+
+		parent.VHDLVersion = VHDLVersion.VHDL2019
+		self.assertEqual(VHDLVersion.VHDL2019, file.VHDLVersion)
+
+		vhdlLibrary = VHDLLibrary("library")
+		with self.assertRaises(Exception):
+			_ = file.VHDLLibrary
+		parent.VHDLLibrary = vhdlLibrary
+		self.assertIs(vhdlLibrary, file.VHDLLibrary)
+
 
 class FileFilter(TestCase):
 	_design: Design
@@ -230,6 +279,181 @@ class FileFilter(TestCase):
 	def test_SourceFile(self):
 		pass
 
+	def test_HDLSourceFile(self):
+		fileset = FileSet("fileset3", design=self._design)
+		vhdlFile1 = VHDLSourceFile(Path("file1.vhdl"), fileSet=fileset)
+		textFile = TextFile(Path("text.txt"), fileSet=fileset)
+		verilogFile = VerilogSourceFile(Path("file2.v"), fileSet=fileset)
+		vhdlFile2 = VHDLSourceFile(Path("file3.vhdl"), fileSet=fileset)
+		svFile = SystemVerilogSourceFile(Path("file4.sv"), fileSet=fileset)
+
+		self.assertListEqual([vhdlFile1, vhdlFile2], [f for f in fileset.Files(fileType=FileTypes.VHDLSourceFile)])
+		self.assertListEqual([verilogFile], [f for f in fileset.Files(fileType=FileTypes.VerilogSourceFile)])
+		self.assertListEqual(
+			[vhdlFile1, verilogFile, vhdlFile2, svFile],
+			[f for f in fileset.Files(fileType=FileTypes.HDLSourceFile)]
+		)
+		self.assertListEqual([], [f for f in fileset.Files(fileType=FileTypes.PythonSourceFile)])
+		self.assertListEqual([textFile], [f for f in self._design.Files(fileType=FileTypes.TextFile, fileSet=fileset)])
+
+
+class AddPaths(TestCase):
+	def test_VHDLFiles(self):
+		design = Design("design", vhdlVersion=VHDLVersion.VHDL2008)
+		library = VHDLLibrary("library", design=design)
+		fileset = FileSet("fileset", design=design)
+		textFile = TextFile(Path("text.txt"), fileSet=fileset)
+
+		files = fileset.AddPaths(("file1.vhdl", Path("file2.vhdl")), VHDLSourceFile, vhdlLibrary="library", vhdlVersion=VHDLVersion.VHDL2019)
+
+		self.assertEqual(2, len(files))
+		self.assertEqual(Path("file1.vhdl"), files[0].Path)
+		self.assertEqual(Path("file2.vhdl"), files[1].Path)
+		self.assertListEqual([textFile] + files, [f for f in fileset.Files()])
+		self.assertListEqual(files, [f for f in fileset.Files(fileType=FileTypes.VHDLSourceFile)])
+		self.assertListEqual(files, [f for f in library.Files])
+		self.assertEqual(3, len(fileset))
+		for file in files:
+			self.assertIs(fileset, file.FileSet)
+			self.assertIs(design, file.Design)
+			self.assertIs(library, file.VHDLLibrary)
+			self.assertEqual(VHDLVersion.VHDL2019, file.VHDLVersion)
+
+	def test_SameFieldsAsInit(self):
+		design = Design("design")
+		library = VHDLLibrary("library", design=design)
+		fileset = FileSet("fileset", design=design)
+
+		bulkFile, = fileset.AddPaths(("file.vhdl", ), VHDLSourceFile, vhdlLibrary=library, vhdlVersion=VHDLVersion.VHDL2019)
+		file = VHDLSourceFile(Path("file.vhdl"), vhdlLibrary=library, vhdlVersion=VHDLVersion.VHDL2019, fileSet=fileset)
+
+		for field in ("_fileType", "_path", "_project", "_design", "_fileSet", "_attributes", "_resolvedPath", "_resolvedBase", "_vhdlLibrary", "_vhdlVersion"):
+			with self.subTest(field=field):
+				self.assertEqual(getattr(file, field), getattr(bulkFile, field))
+		self.assertListEqual([bulkFile, file], list(library.Files))
+
+	def test_DerivedFileType(self):
+		class CustomVHDLSourceFile(VHDLSourceFile):
+			def __init__(self, path: Path, vhdlLibrary: VHDLLibrary = None, vhdlVersion: VHDLVersion = None):
+				super().__init__(path, vhdlLibrary, vhdlVersion)
+
+		design = Design("design")
+		library = VHDLLibrary("library", design=design)
+		fileset = FileSet("fileset", design=design)
+
+		files = fileset.AddPaths(("file1.vhdl", "file2.vhdl"), CustomVHDLSourceFile, vhdlLibrary=library)
+
+		self.assertListEqual(files, list(library.Files))
+		for file in files:
+			self.assertIsInstance(file, CustomVHDLSourceFile)
+			self.assertIs(library, file.VHDLLibrary)
+			self.assertIs(fileset, file.FileSet)
+
+	def test_Errors(self):
+		fileset = FileSet("fileset", design=Design("design"))
+
+		with self.assertRaises(TypeError):
+			fileset.AddPaths(("text.txt", ), TextFile, vhdlVersion=VHDLVersion.VHDL2019)
+		with self.assertRaises(Exception):
+			fileset.AddPaths(("file.vhdl", ), VHDLSourceFile, vhdlLibrary="unknown")
+
+
+class Import(TestCase):
+	def test_ImportDirectory(self):
+		project = Project("project", rootDirectory=Path.cwd() / "project", vhdlVersion=VHDLVersion.VHDL2008)
+		vhdlLibrary = VHDLLibrary("library", project=project)
+		fileset = FileSet("fileset", design=project.DefaultDesign, vhdlLibrary=vhdlLibrary)
+
+		self.assertEqual(6, fileset.Import(Path(".")))
+
+		self.assertListEqual(
+			[Path(p) for p in ("designA/file_A1.vhdl", "designA/file_A2.vhdl", "designA/file_A3.v", "designB/file_B1.vhdl", "lib/file_P1.vhdl", "lib/file_P2.vhdl")],
+			[f.Path for f in fileset.Files()]
+		)
+		self.assertEqual(5, fileset.FileCount(FileTypes.VHDLSourceFile))
+		self.assertEqual(1, fileset.FileCount(FileTypes.VerilogSourceFile))
+		fileset.Validate()
+
+	def test_ImportWithPattern(self):
+		project = Project("project", rootDirectory=Path.cwd() / "project")
+		fileset = FileSet("fileset", design=project.DefaultDesign)
+
+		self.assertEqual(1, fileset.Import(Path("designA"), patterns=("*.v", "*.sv")))
+		self.assertEqual(0, fileset.Import(Path("."), patterns=("*.vhdl", ), recursive=False))
+
+		files = [f for f in fileset.Files()]
+		self.assertEqual(1, len(files))
+		self.assertEqual(Path("designA/file_A3.v"), files[0].Path)
+		self.assertIsInstance(files[0], VerilogSourceFile)
+
+
+class Traversal(TestCase):
+	def setUp(self) -> None:
+		self._root = FileSet("root")
+		self._a =    FileSet("a")
+		self._a1 =   FileSet("a1")
+		self._b =    FileSet("b")
+		self._a.Parent =  self._root
+		self._a1.Parent = self._a
+		self._b.Parent =  self._root
+
+		self._fileRoot = File(Path("root.file"), fileSet=self._root)
+		self._fileA =    File(Path("a.file"), fileSet=self._a)
+		self._fileA1 =   File(Path("a1.file"), fileSet=self._a1)
+		self._fileB =    File(Path("b.file"), fileSet=self._b)
+
+	def test_PreOrder(self):
+		self.assertListEqual([self._root, self._a, self._a1, self._b], [fs for fs in self._root.IterateFileSets(TraversalOrder.PreOrder)])
+		self.assertListEqual(
+			[self._fileRoot, self._fileA, self._fileA1, self._fileB],
+			[f for f in self._root.Files(order=TraversalOrder.PreOrder)]
+		)
+
+	def test_PostOrder(self):
+		self.assertListEqual([self._a1, self._a, self._b, self._root], [fs for fs in self._root.IterateFileSets(TraversalOrder.PostOrder)])
+		self.assertListEqual(
+			[self._fileA1, self._fileA, self._fileB, self._fileRoot],
+			[f for f in self._root.Files()]
+		)
+
+	def test_BreadthFirst(self):
+		self.assertListEqual([self._root, self._a, self._b, self._a1], [fs for fs in self._root.IterateFileSets(TraversalOrder.BreadthFirst)])
+		self.assertListEqual(
+			[self._fileRoot, self._fileA, self._fileB, self._fileA1],
+			[f for f in self._root.Files(order=TraversalOrder.BreadthFirst)]
+		)
+
+	def test_FileCount(self):
+		self.assertEqual(4, len(self._root))
+		self.assertEqual(2, len(self._a))
+		self.assertEqual(1, len(self._b))
+
+		TextFile(Path("a1.txt"), fileSet=self._a1)
+		self.assertEqual(5, len(self._root))
+		self.assertEqual(3, len(self._a))
+		self.assertEqual(1, self._root.FileCount(FileTypes.TextFile))
+		self.assertEqual(5, self._root.FileCount(FileTypes.Any))
+		self.assertEqual(0, self._root.FileCount(FileTypes.VHDLSourceFile))
+
+		self._a1.Parent = self._b
+		self.assertEqual(5, len(self._root))
+		self.assertEqual(1, len(self._a))
+		self.assertEqual(3, len(self._b))
+		self.assertEqual(1, self._b.FileCount(FileTypes.TextFile))
+		self.assertEqual(0, self._a.FileCount(FileTypes.TextFile))
+
+	def test_DeepHierarchy(self):
+		root = FileSet("root")
+		parent = root
+		for i in range(2000):
+			fileSet = FileSet(f"level{i}")
+			fileSet.Parent = parent
+			File(Path(f"file{i}.file"), fileSet=fileSet)
+			parent = fileSet
+
+		for order in TraversalOrder:
+			self.assertEqual(2000, len([f for f in root.Files(order=order)]))
+
 
 class Validate(TestCase):
 	def test_FileSet(self):
@@ -36,6 +36,8 @@ from pyVHDLModel import VHDLVersion
 from pySVModel import VerilogVersion, SystemVerilogVersion
 
 from pyEDAA.ProjectModel import FileSet, VHDLSourceFile, VHDLLibrary, VerilogSourceFile, SystemVerilogSourceFile, FileTypes, Project, Design
+from pyEDAA.ProjectModel import File, TextFile, TCLSourceFile, FileType, FileTypeRegistry
+from pyEDAA.ProjectModel.Xilinx import ISE, Vivado
 
 
 if __name__ == "__main__": # pragma: no cover
@@ -174,3 +176,49 @@ class SystemVerilogFile(TestCase):
 		file = SystemVerilogSourceFile(path, fileSet=fileset)
 
 		self.assertEqual(svVersion, file.SVVersion)
+
+
+class Registry(TestCase):
+	def test_Lookup(self):
+		registry = FileTypeRegistry()
+
+		self.assertIs(VHDLSourceFile, registry.GetFileType(Path("example.VHDL")))
+		self.assertIs(TCLSourceFile, registry.GetFileType(Path("run.tcl")))
+		self.assertIs(File, registry.GetFileType(Path("unknown.abc")))
+		self.assertIsNone(registry.get(".abc"))
+
+	def test_ParentAndDefault(self):
+		class SpecialVHDLFile(VHDLSourceFile):
+			pass
+
+		parent = FileTypeRegistry((SpecialVHDLFile, ), default=TextFile)
+		registry = FileTypeRegistry(parent=parent)
+		registry.Register(SystemVerilogSourceFile, (".abc", ))
+
+		self.assertIs(SpecialVHDLFile, registry.GetFileType(Path("example.vhd")))
+		self.assertIs(SystemVerilogSourceFile, registry.GetFileType(Path("example.abc")))
+		self.assertIs(SystemVerilogSourceFile, registry.GetFileType(Path("example.sv")))
+		self.assertIs(TextFile, registry.GetFileType(Path("unknown.xyz")))
+		self.assertIs(VHDLSourceFile, FileTypeRegistry().GetFileType(Path("example.vhd")))
+
+	def test_ToolSpecificFileTypes(self):
+		# tool-specific suffixes are only registered in the tool's registry
+		for suffix in (".xdc", ".xci", ".bd", ".wcfg", ".mem", ".coe", ".ucf"):
+			self.assertNotIn(suffix, FileType.FileSuffixes)
+			self.assertIs(File, FileTypeRegistry().GetFileType(Path(f"example{suffix}")))
+		self.assertIs(Vivado.XDCConstraintFile, Vivado.VivadoFileTypes.GetFileType(Path("example.xdc")))
+		self.assertIs(ISE.UCFConstraintFile, ISE.ISEFileTypes.GetFileType(Path("example.ucf")))
+
+		# same-named tool-specific classes don't replace the registered classes
+		for name in ("File", "VHDLSourceFile", "SystemVerilogSourceFile", "TCLSourceFile", "WaveformConfigFile"):
+			self.assertEqual(File.__module__, getattr(FileTypes, name).__module__)
+
+	def test_FileTypeOfSameNamedClasses(self):
+		fileSet = FileSet("fileset")
+		vhdlFile = VHDLSourceFile(Path("a.vhdl"), fileSet=fileSet)
+		vivadoFile = Vivado.VHDLSourceFile(Path("b.vhdl"), fileSet=fileSet)
+
+		self.assertIs(VHDLSourceFile, vhdlFile.FileType)
+		self.assertIs(Vivado.VHDLSourceFile, vivadoFile.FileType)
+		self.assertListEqual([vhdlFile, vivadoFile], list(fileSet.Files(VHDLSourceFile)))
+		self.assertListEqual([vivadoFile], list(fileSet.Files(Vivado.VHDLSourceFile)))
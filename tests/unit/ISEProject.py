@@ -0,0 +1,111 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2022 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Instantiation tests for the ISE project model."""
+from pathlib     import Path
+from tempfile    import TemporaryDirectory
+from unittest    import TestCase
+
+from pyVHDLModel import VHDLVersion
+
+from pyEDAA.ProjectModel            import File, VHDLSourceFile, VerilogSourceFile
+from pyEDAA.ProjectModel.Cache      import ParseCache
+from pyEDAA.ProjectModel.Xilinx.ISE import ISEProjectFile, AssociationAttribute, UCFConstraintFile
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class ProjectFile(TestCase):
+	_xisePath = Path("ISEProject/StopWatch/StopWatch.xise")
+
+	def test_Project(self):
+		xiseFile = ISEProjectFile(self._xisePath)
+		xiseFile.Parse()
+		project = xiseFile.ProjectModel
+
+		self.assertEqual("StopWatch", project.Name)
+		self.assertEqual("xc6slx45", project.Device)
+		self.assertEqual("Spartan6", project.Family)
+		self.assertEqual("csg324", project.Properties["Package"])
+		self.assertEqual("toplevel", project.DefaultDesign.TopLevel)
+		self.assertIs(VHDLVersion.VHDL2008, project.VHDLVersion)
+		self.assertListEqual(["lib_Utilities", "StopWatch", "lib_Unused"], list(project.DefaultDesign.VHDLLibraries.keys()))
+
+	def test_FileSets(self):
+		xiseFile = ISEProjectFile(self._xisePath)
+		xiseFile.Parse()
+		design = xiseFile.ProjectModel.DefaultDesign
+
+		self.assertListEqual(["default", "Implementation", "BehavioralSimulation"], list(design.FileSets.keys()))
+		self.assertEqual(8, design.FileCount())
+
+		implementation = design.FileSets["Implementation"]
+		self.assertListEqual(
+			["../src/Utilities.pkg.vhdl", "../src/StopWatch.pkg.vhdl", "../src/Counter.vhdl", "../src/seg7_Encoder.v", "../src/toplevel.vhdl", "../constraints/StopWatch.ucf"],
+			[file.Path.as_posix() for file in implementation.Files()]
+		)
+		self.assertEqual(1, implementation.FileCount(VerilogSourceFile))
+		self.assertEqual(1, implementation.FileCount(UCFConstraintFile))
+
+		simulationFile = next(design.FileSets["BehavioralSimulation"].Files())
+		self.assertEqual("../sim/toplevel_tb.vhdl", simulationFile.Path.as_posix())
+		self.assertListEqual(["BehavioralSimulation", "PostRouteSimulation"], simulationFile[AssociationAttribute])
+
+		documentation = next(design.DefaultFileSet.Files())
+		self.assertIs(File, type(documentation))
+		self.assertListEqual([], documentation[AssociationAttribute])
+
+	def test_Libraries(self):
+		xiseFile = ISEProjectFile(self._xisePath)
+		xiseFile.Parse()
+		design = xiseFile.ProjectModel.DefaultDesign
+
+		vhdlFiles = list(design.FileSets["Implementation"].Files(VHDLSourceFile))
+		self.assertIs(design.VHDLLibraries["lib_Utilities"], vhdlFiles[0].VHDLLibrary)
+		self.assertIs(design.VHDLLibraries["StopWatch"], vhdlFiles[1].VHDLLibrary)
+		self.assertIs(vhdlFiles[1].VHDLLibrary, vhdlFiles[2].VHDLLibrary)
+
+	def test_Cache(self):
+		with TemporaryDirectory() as tempDirectory:
+			cache = ParseCache(Path(tempDirectory))
+
+			xiseFile = ISEProjectFile(self._xisePath)
+			xiseFile.Parse(cache=cache)
+			cachedProject = cache.Load(xiseFile)
+			self.assertIsNotNone(cachedProject)
+			self.assertEqual(8, cachedProject.DefaultDesign.FileCount())
+
+	def test_FileNotFound(self):
+		with self.assertRaises(Exception):
+			ISEProjectFile(Path("ISEProject/StopWatch/Missing.xise")).Parse()
@@ -0,0 +1,277 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2022 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Instantiation tests for the ModelSim project model."""
+from os          import environ
+from pathlib     import Path
+from shutil      import copytree
+from tempfile    import TemporaryDirectory
+from unittest    import TestCase
+from unittest.mock import patch
+
+from pyVHDLModel import VHDLVersion
+
+from pyEDAA.ProjectModel                         import File, VHDLSourceFile, VerilogSourceFile
+from pyEDAA.ProjectModel.Cache                   import ParseCache
+from pyEDAA.ProjectModel.MentorGraphics.ModelSim import ModelSimINIFile, ModelSimProjectFile
+from pyEDAA.ProjectModel.MentorGraphics          import QuestaSim
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class LibraryMapping(TestCase):
+	_directory = Path("ModelSimProject").resolve()
+
+	def test_IncludeChain(self):
+		with patch.dict(environ, {"MODEL_TECH": "/opt/modelsim/bin", "XILINX_LIBS": "/opt/xilinx"}):
+			iniFile = ModelSimINIFile(Path("ModelSimProject/StopWatch/modelsim.ini"))
+			iniFile.Parse()
+
+		self.assertDictEqual(
+			{
+				"lib_Utilities": self._directory / "StopWatch/lib_Utilities",
+				"unisim":        Path("/opt/xilinx/unisim"),
+				"std":           Path("/opt/modelsim/bin/../std"),
+				"ieee":          Path("/opt/modelsim/bin/../ieee"),
+				"vital2000":     Path("/opt/modelsim/bin/../vital2000"),
+			},
+			iniFile.LibraryMapping
+		)
+
+	def test_EnvironmentChanged(self):
+		iniFile = ModelSimINIFile(Path("ModelSimProject/StopWatch/modelsim.ini"))
+		with patch.dict(environ, {"MODEL_TECH": "/opt/modelsim/bin"}):
+			iniFile.Parse()
+			self.assertEqual(Path("/opt/modelsim/bin/../std"), iniFile.LibraryMapping["std"])
+
+		with patch.dict(environ, {"MODEL_TECH": "/opt/questasim/bin"}):
+			iniFile.Parse()
+			self.assertEqual(Path("/opt/questasim/bin/../std"), iniFile.LibraryMapping["std"])
+
+	def test_IncludedFileChanged(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			(tempPath / "vendor.ini").write_text("[Library]\nunisim = unisim\n")
+			(tempPath / "modelsim.ini").write_text("[Library]\nothers = vendor.ini\nwork = work\n")
+
+			iniFile = ModelSimINIFile(tempPath / "modelsim.ini")
+			iniFile.Parse()
+			self.assertListEqual(["work", "unisim"], list(iniFile.LibraryMapping.keys()))
+
+			# parsing again returns an equal, but independent mapping
+			mapping = iniFile.LibraryMapping
+			mapping["other"] = Path("other")
+			iniFile.Parse()
+			self.assertNotIn("other", iniFile.LibraryMapping)
+
+			(tempPath / "vendor.ini").write_text("[Library]\nunisim = unisim\nunimacro = unimacro\n")
+			iniFile.Parse()
+			self.assertListEqual(["work", "unisim", "unimacro"], list(iniFile.LibraryMapping.keys()))
+
+	def test_UnsetVariable(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			# a file, which would be included, if '$MODEL_TECH/..' was read as a directory name
+			(tempPath / "modelsim.ini").write_text("[Library]\nwrong = wrong\n")
+			(tempPath / "project.ini").write_text(
+				"[Library]\nothers = $MODEL_TECH/../modelsim.ini\nwork = work\nunisim = %XILINX_LIBS%/unisim\n"
+			)
+
+			environment = {name: value for name, value in environ.items() if name not in ("MODEL_TECH", "XILINX_LIBS")}
+			with patch.dict(environ, environment, clear=True):
+				iniFile = ModelSimINIFile(tempPath / "project.ini")
+				iniFile.Parse()
+
+			self.assertDictEqual({"work": tempPath.resolve() / "work"}, iniFile.LibraryMapping)
+			self.assertDictEqual(
+				{"others": "$MODEL_TECH/../modelsim.ini", "unisim": "%XILINX_LIBS%/unisim"},
+				iniFile.UnresolvedLibraryMapping
+			)
+
+			with patch.dict(environ, {"MODEL_TECH": str(tempPath / "bin"), "XILINX_LIBS": "/opt/xilinx"}):
+				iniFile.Parse()
+
+			self.assertListEqual(["work", "unisim", "wrong"], list(iniFile.LibraryMapping.keys()))
+			self.assertEqual(Path("/opt/xilinx/unisim"), iniFile.LibraryMapping["unisim"])
+			self.assertDictEqual({}, iniFile.UnresolvedLibraryMapping)
+
+	def test_CircularInclude(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			(tempPath / "a.ini").write_text("[Library]\nothers = b.ini\n")
+			(tempPath / "b.ini").write_text("[Library]\nothers = a.ini\n")
+
+			with self.assertRaises(Exception):
+				ModelSimINIFile(tempPath / "a.ini").Parse()
+
+	def test_MissingInclude(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			(tempPath / "a.ini").write_text("[Library]\nothers = missing.ini\n")
+
+			with self.assertRaises(Exception):
+				ModelSimINIFile(tempPath / "a.ini").Parse()
+
+
+class ProjectFile(TestCase):
+	_mpfPath = Path("ModelSimProject/StopWatch/StopWatch.mpf")
+
+	def test_Project(self):
+		with patch.dict(environ, {"MODEL_TECH": "/opt/modelsim/bin", "XILINX_LIBS": "/opt/xilinx"}):
+			mpfFile = ModelSimProjectFile(self._mpfPath)
+			mpfFile.Parse()
+		project = mpfFile.ProjectModel
+
+		self.assertEqual("StopWatch", project.Name)
+		self.assertListEqual(
+			["StopWatch", "work", "lib_Utilities", "unisim", "std", "ieee", "vital2000"],
+			list(project.LibraryMapping.keys())
+		)
+		self.assertEqual(Path("ModelSimProject/StopWatch/StopWatch").resolve(), project.LibraryMapping["work"])
+		self.assertDictEqual({}, project.UnresolvedLibraryMapping)
+
+	def test_UnsetVariables(self):
+		environment = {name: value for name, value in environ.items() if name not in ("MODEL_TECH", "XILINX_LIBS")}
+		with patch.dict(environ, environment, clear=True):
+			mpfFile = ModelSimProjectFile(self._mpfPath)
+			mpfFile.Parse()
+		project = mpfFile.ProjectModel
+
+		# an unresolved entry shadows the library mapped by an included file
+		self.assertListEqual(["StopWatch", "work", "lib_Utilities"], list(project.LibraryMapping.keys()))
+		self.assertDictEqual(
+			{
+				"unisim":    "${XILINX_LIBS}/unisim",
+				"std":       "$MODEL_TECH/../std",
+				"ieee":      "$MODEL_TECH/../ieee",
+				"vital2000": "$MODEL_TECH/../vital2000",
+			},
+			project.UnresolvedLibraryMapping
+		)
+
+	def test_Files(self):
+		mpfFile = ModelSimProjectFile(self._mpfPath)
+		mpfFile.Parse()
+		design = mpfFile.ProjectModel.DefaultDesign
+
+		self.assertListEqual(["default", "rtl", "sim"], list(design.FileSets.keys()))
+		self.assertListEqual(["Encoder Sources"], list(design.FileSets["rtl"].FileSets.keys()))
+		self.assertEqual(6, design.FileCount())
+
+		# files are ordered by compile order within each fileset
+		self.assertListEqual(["../src/Utilities.pkg.vhdl"], [file.Path.as_posix() for file in design.DefaultFileSet.Files(fileSet=False)])
+		self.assertListEqual(["../src/StopWatch.pkg.vhdl", "../src/toplevel.vhdl"], [file.Path.as_posix() for file in design.FileSets["rtl"].Files(fileSet=False)])
+		self.assertEqual(1, design.FileSets["rtl"].FileSets["Encoder Sources"].FileCount(VerilogSourceFile))
+
+		testbench, waveform = design.FileSets["sim"].Files()
+		self.assertIs(VHDLVersion.VHDL2002, testbench.VHDLVersion)
+		self.assertIs(File, type(waveform))
+
+		utilities = next(design.DefaultFileSet.Files(VHDLSourceFile, fileSet=False))
+		self.assertIs(VHDLVersion.VHDL2008, utilities.VHDLVersion)
+		self.assertIs(design.VHDLLibraries["lib_Utilities"], utilities.VHDLLibrary)
+		self.assertIs(design.VHDLLibraries["StopWatch"], testbench.VHDLLibrary)
+
+	def test_InvalidCompileOrder(self):
+		with TemporaryDirectory() as tempDirectory:
+			mpfPath = Path(tempDirectory) / "project.mpf"
+			mpfPath.write_text(
+				"[Project]\n"
+				"Project_File_0 = a.vhdl\n"
+				"Project_File_P_0 = file_type vhdl folder {Top Level} compile_order first\n"
+			)
+
+			with self.assertRaises(Exception) as ctx:
+				ModelSimProjectFile(mpfPath).Parse()
+			self.assertIn(f"'{mpfPath!s}'", str(ctx.exception))
+			self.assertIn("line 3", str(ctx.exception))
+			self.assertIsInstance(ctx.exception.__cause__, ValueError)
+
+	def test_CircularFolders(self):
+		with TemporaryDirectory() as tempDirectory:
+			mpfPath = Path(tempDirectory) / "project.mpf"
+			mpfPath.write_text(
+				"[Project]\n"
+				"Project_File_0 = a.vhdl\n"
+				"Project_File_P_0 = file_type vhdl folder a compile_order 0\n"
+				"Project_Folder_0 = a\n"
+				"Project_Folder_P_0 = folder b\n"
+				"Project_Folder_1 = b\n"
+				"Project_Folder_P_1 = folder a\n"
+			)
+
+			with self.assertRaises(Exception) as ctx:
+				ModelSimProjectFile(mpfPath).Parse()
+			self.assertIn("Circular folder hierarchy", str(ctx.exception))
+
+	def test_Cache(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			copytree(Path("ModelSimProject"), tempPath / "ModelSimProject")
+			mpfPath = tempPath / "ModelSimProject/StopWatch/StopWatch.mpf"
+			cache = ParseCache(tempPath / "cache")
+
+			mpfFile = ModelSimProjectFile(mpfPath)
+			mpfFile.Parse(cache=cache)
+			self.assertIsNotNone(cache.Load(mpfFile))
+
+			# a change of an included modelsim.ini invalidates the entry
+			vendorINI = tempPath / "ModelSimProject/modelsim.ini"
+			vendorINI.write_text(vendorINI.read_text().replace("unisim = vendor/unisim", "unisim = vendor/unisim\nunimacro = vendor/unimacro"))
+			self.assertIsNone(cache.Load(mpfFile))
+			mpfFile.Parse(cache=cache)
+			self.assertIn("unimacro", mpfFile.ProjectModel.LibraryMapping)
+
+	def test_CacheEnvironmentChanged(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			cache = ParseCache(tempPath / "cache")
+			mpfFile = ModelSimProjectFile(self._mpfPath)
+
+			with patch.dict(environ, {"MODEL_TECH": "/opt/modelsim/bin"}):
+				mpfFile.Parse(cache=cache)
+				self.assertIsNotNone(cache.Load(mpfFile))
+
+			# a change of a referenced environment variable invalidates the entry
+			with patch.dict(environ, {"MODEL_TECH": "/opt/questasim/bin"}):
+				self.assertIsNone(cache.Load(mpfFile))
+				mpfFile.Parse(cache=cache)
+				self.assertEqual(Path("/opt/questasim/bin/../std"), mpfFile.ProjectModel.LibraryMapping["std"])
+				self.assertIsNotNone(cache.Load(mpfFile))
+
+	def test_QuestaSim(self):
+		mpfFile = QuestaSim.ModelSimProjectFile(self._mpfPath)
+		mpfFile.Parse()
+
+		self.assertEqual(6, mpfFile.ProjectModel.DefaultDesign.FileCount())
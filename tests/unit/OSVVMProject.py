@@ -0,0 +1,355 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2022 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Instantiation tests for the OSVVM project model."""
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pyVHDLModel import VHDLVersion
+
+from pyEDAA.ProjectModel       import VHDLSourceFile
+from pyEDAA.ProjectModel.OSVVM import OSVVMProjectFile, Diagnostic, DiagnosticSeverity, _Tokenize, _Expression
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Tokenizer(TestCase):
+	def test_SimpleCommands(self):
+		lines = [
+			"# comment\n",
+			"\n",
+			"library osvvm\n",
+			"  analyze   NamePkg.vhd\n",
+		]
+		self.assertListEqual([(3, ["library", "osvvm"]), (4, ["analyze", "NamePkg.vhd"])], list(_Tokenize(lines)))
+
+	def test_Words(self):
+		lines = [
+			'analyze "file name.vhd" ; analyze {other file.vhd};# comment\n',
+			"analyze [file join $dir a.vhd] \\\n",
+			"  -x\n",
+		]
+		self.assertListEqual(
+			[
+				(1, ["analyze", "file name.vhd"]),
+				(1, ["analyze", "other file.vhd"]),
+				(2, ["analyze", "[file join $dir a.vhd]", "-x"]),
+			],
+			list(_Tokenize(lines))
+		)
+
+	def test_LineContinuation(self):
+		lines = [
+			"analyze a.vhd \\\n",
+			"   b.vhd\n",
+			"analyze c.vhd\n",
+		]
+		self.assertListEqual([(1, ["analyze", "a.vhd", "b.vhd"]), (3, ["analyze", "c.vhd"])], list(_Tokenize(lines)))
+
+	def test_MultiLineBraces(self):
+		lines = [
+			'if {$::osvvm::ToolName eq "GHDL"} {\n',
+			"  analyze a.vhd\n",
+			"} else {\n",
+			"  analyze b.vhd\n",
+			"}\n",
+			"analyze c.vhd\n",
+		]
+		tokens = list(_Tokenize(lines))
+		self.assertEqual(2, len(tokens))
+		self.assertEqual(1, tokens[0][0])
+		self.assertListEqual(["if", '$::osvvm::ToolName eq "GHDL"', "\n  analyze a.vhd\n", "else", "\n  analyze b.vhd\n"], tokens[0][1])
+		self.assertEqual((6, ["analyze", "c.vhd"]), tokens[1])
+		self.assertListEqual([1, 3], [word.Line for word in tokens[0][1][2::2]])
+
+	def test_Incomplete(self):
+		with self.assertRaises(Exception):
+			list(_Tokenize(["if {true} {\n", "  analyze a.vhd\n"]))
+
+
+class ProjectFile(TestCase):
+	def test_LibrariesAndIncludes(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			(tempPath / "sub").mkdir()
+			(tempPath / "top.pro").write_text("library libA\nanalyze a.vhdl\ninclude sub/sub.pro\nanalyze c.vhdl\n")
+			(tempPath / "sub" / "sub.pro").write_text("library libB\nanalyze b.vhdl\n")
+
+			proFile = OSVVMProjectFile(tempPath / "top.pro")
+			proFile.Parse()
+			design = proFile.ProjectModel.DefaultDesign
+
+			self.assertListEqual(["b.vhdl", "a.vhdl", "c.vhdl"], [file.Path.name for file in design.Files(VHDLSourceFile)])
+			self.assertListEqual(["libB", "libA", "libB"], [file.VHDLLibrary.Name for file in design.Files(VHDLSourceFile)])
+			self.assertListEqual(["sub.pro"], list(design.DefaultFileSet.FileSets.keys()))
+
+	def test_Diagnostics(self):
+		with TemporaryDirectory() as tempDirectory:
+			proPath = Path(tempDirectory) / "top.pro"
+			proPath.write_text("analyze a.vhdl\nSetSaveWaves true\nunknown x\n")
+
+			diagnostics = []
+			proFile = OSVVMProjectFile(proPath)
+			proFile.Parse(diagnostics=diagnostics.append)
+
+			self.assertEqual(1, proFile.ProjectModel.DefaultDesign.FileCount())
+			self.assertListEqual(
+				[
+					Diagnostic(DiagnosticSeverity.Warning, proPath, 2, "Unsupported command 'SetSaveWaves'."),
+					Diagnostic(DiagnosticSeverity.Warning, proPath, 3, "Unsupported command 'unknown'."),
+				],
+				diagnostics
+			)
+
+			# without a sink, unsupported commands are skipped silently
+			proFile.Parse()
+
+	def test_Concurrent(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			for directory in ("common", "uart", "axi", "axi/common"):
+				(tempPath / directory).mkdir()
+			(tempPath / "top.pro").write_text("include common/common.pro\ninclude uart/uart.pro\ninclude axi/axi.pro\nanalyze top.vhdl\n")
+			(tempPath / "common" / "common.pro").write_text("library common\nanalyze c1.vhdl\nanalyze c2.vhdl\n")
+			(tempPath / "uart" / "uart.pro").write_text("library uart\nanalyze u1.vhdl\n")
+			(tempPath / "axi" / "axi.pro").write_text("include common/axi_common.pro\nlibrary axi\nanalyze a1.vhdl\n")
+			(tempPath / "axi" / "common" / "axi_common.pro").write_text("library axi\nanalyze ac1.vhdl\n")
+
+			sequentialFile = OSVVMProjectFile(tempPath / "top.pro")
+			sequentialFile.Parse()
+			concurrentFile = OSVVMProjectFile(tempPath / "top.pro")
+			concurrentFile.Parse(concurrent=True, maxWorkers=4)
+
+			for proFile in (sequentialFile, concurrentFile):
+				design = proFile.ProjectModel.DefaultDesign
+				self.assertListEqual(
+					["c1.vhdl", "c2.vhdl", "u1.vhdl", "ac1.vhdl", "a1.vhdl", "top.vhdl"],
+					[file.Path.name for file in design.Files(VHDLSourceFile)]
+				)
+				self.assertListEqual(["common.pro", "uart.pro", "axi.pro"], list(design.DefaultFileSet.FileSets.keys()))
+				self.assertListEqual(["axi_common.pro"], list(design.DefaultFileSet.FileSets["axi.pro"].FileSets.keys()))
+				self.assertListEqual(["common", "uart", "axi"], list(design.VHDLLibraries.keys()))
+
+	def test_ConcurrentMissingInclude(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			(tempPath / "top.pro").write_text("analyze a.vhdl\ninclude missing.pro\n")
+
+			with self.assertRaises(Exception):
+				OSVVMProjectFile(tempPath / "top.pro").Parse(concurrent=True)
+
+	def test_DiamondInclude(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			for directory in ("common", "tb1", "tb2"):
+				(tempPath / directory).mkdir()
+			(tempPath / "top.pro").write_text("include tb1/build.pro\ninclude tb2/build.pro\nanalyze top.vhdl\n")
+			(tempPath / "common" / "common.pro").write_text("library common\nanalyze c1.vhdl\n")
+			(tempPath / "tb1" / "build.pro").write_text("include ../common/common.pro\nanalyze tb1.vhdl\n")
+			(tempPath / "tb2" / "build.pro").write_text("library work\ninclude ../common/common.pro\nanalyze tb2.vhdl\n")
+
+			for concurrent in (False, True):
+				diagnostics = []
+				proFile = OSVVMProjectFile(tempPath / "top.pro")
+				proFile.Parse(diagnostics=diagnostics.append, concurrent=concurrent)
+				project = proFile.ProjectModel
+				design = project.DefaultDesign
+
+				self.assertListEqual(["c1.vhdl", "tb1.vhdl", "tb2.vhdl", "top.vhdl"], [file.Path.name for file in design.Files(VHDLSourceFile)])
+				# the re-included file selects library 'common' again
+				self.assertListEqual(["common", "common", "common", "common"], [file.VHDLLibrary.Name for file in design.Files(VHDLSourceFile)])
+				self.assertListEqual(["build.pro", "tb2/build.pro"], list(design.DefaultFileSet.FileSets.keys()))
+
+				root = (tempPath / "top.pro").resolve()
+				common = (tempPath / "common" / "common.pro").resolve()
+				tb1 = (tempPath / "tb1" / "build.pro").resolve()
+				tb2 = (tempPath / "tb2" / "build.pro").resolve()
+				self.assertDictEqual({root: [tb1, tb2], tb1: [common], common: [], tb2: [common]}, project.IncludeGraph)
+
+				self.assertEqual(1, len(diagnostics))
+				self.assertIs(DiagnosticSeverity.Info, diagnostics[0].Severity)
+				self.assertEqual((tb2, 2), (diagnostics[0].Path, diagnostics[0].Line))
+
+	def test_IncludeCycle(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			(tempPath / "top.pro").write_text("include a.pro\n")
+			(tempPath / "a.pro").write_text("analyze a.vhdl\ninclude b.pro\n")
+			(tempPath / "b.pro").write_text("\ninclude a.pro\n")
+
+			for concurrent in (False, True):
+				with self.assertRaises(Exception) as context:
+					OSVVMProjectFile(tempPath / "top.pro").Parse(concurrent=concurrent)
+
+				message = str(context.exception)
+				self.assertIn("top.pro:1 -> ", message)
+				self.assertIn("a.pro:2 -> ", message)
+				self.assertTrue(message.endswith("a.pro"))
+
+	def test_FileNotFound(self):
+		with TemporaryDirectory() as tempDirectory:
+			with self.assertRaises(Exception):
+				OSVVMProjectFile(Path(tempDirectory) / "missing.pro").Parse()
+
+
+class Expression(TestCase):
+	def test_Comparisons(self):
+		variables = {"osvvm::ToolName": "GHDL", "osvvm::VhdlVersion": "2019", "Flag": "true"}
+
+		for text, expected in (
+			('$::osvvm::ToolName eq "GHDL"', True),
+			('$::osvvm::ToolName ne "GHDL"', False),
+			("$::osvvm::VhdlVersion >= 2019", True),
+			("$::osvvm::VhdlVersion < 2008", False),
+			("${osvvm::VhdlVersion} == 2019.0", True),
+			("$Flag", True),
+			("!$Flag || 1", True),
+			('($Flag && 0) || $::osvvm::ToolName eq {NVC}', False),
+			("abc < abd", True),
+		):
+			with self.subTest(text=text):
+				self.assertIs(expected, _Expression(text, variables).Evaluate())
+
+	def test_Errors(self):
+		with self.assertRaises(KeyError):
+			_Expression("$undefined == 1", {})
+
+		for text in ("1 ==", "(1 == 1", "1 1", "maybe", "1 + 1"):
+			with self.subTest(text=text):
+				with self.assertRaises(Exception):
+					_Expression(text, {}).Evaluate()
+
+
+class Interpreter(TestCase):
+	_proPath = Path("OSVVMProject/OsvvmLibraries/OsvvmLibraries.pro")
+
+	def test_LibraryTree(self):
+		for concurrent in (False, True):
+			diagnostics = []
+			proFile = OSVVMProjectFile(self._proPath.resolve())
+			proFile.Parse(diagnostics=diagnostics.append, concurrent=concurrent, variables={"::osvvm::ToolName": "GHDL"})
+			project = proFile.ProjectModel
+			design = project.DefaultDesign
+
+			self.assertListEqual([], diagnostics)
+			self.assertListEqual(
+				[
+					"osvvm/NamePkg.vhd", "osvvm/ResolutionPkg.vhd", "osvvm/TbUtilPkg_ghdl.vhd", "osvvm/OsvvmContext.vhd",
+					"Common/src/ModelParametersPkg.vhd", "Common/src/AddressBusTransactionPkg.vhd",
+					"UART/testbench/TestCtrl_e.vhd", "UART/testbench/TbUart.vhd", "UART/testbench/TbUart_SendGet1.vhd",
+					"UART/src/UartTbPkg.vhd", "UART/src/UartTx.vhd",
+				],
+				[file.ResolvedPath.relative_to(self._proPath.parent.resolve()).as_posix() for file in design.Files(VHDLSourceFile)]
+			)
+			self.assertListEqual(["osvvm", "osvvm_common", "osvvm_uart", "osvvm_TbUart"], list(design.VHDLLibraries.keys()))
+			self.assertListEqual(["osvvm.pro", "Common.pro", "build.pro"], list(design.DefaultFileSet.FileSets.keys()))
+			self.assertListEqual(["testbench.pro"], list(design.DefaultFileSet.FileSets["build.pro"].FileSets.keys()))
+
+			self.assertListEqual(["Uart"], list(project.Testsuites.keys()))
+			testcases = project.Testsuites["Uart"].Testcases
+			self.assertListEqual(["TbUart_SendGet1", "TbUart_Alias"], list(testcases.keys()))
+			self.assertEqual("TbUart_SendGet1.vhd", testcases["TbUart_SendGet1"].File.Path.name)
+			self.assertEqual("TbUart_SendGet1", testcases["TbUart_Alias"].Toplevel)
+			self.assertIsNone(testcases["TbUart_Alias"].File)
+			self.assertEqual("osvvm_TbUart", testcases["TbUart_Alias"].VHDLLibrary.Name)
+
+	def test_VHDLVersionAndDefaults(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			(tempPath / "top.pro").write_text(
+				"analyze a.vhdl\n"
+				"SetVHDLVersion 2019\n"
+				"if {$::osvvm::VhdlVersion >= 2019} then {analyze b_2019.vhdl} {analyze b.vhdl}\n"
+				"simulate tb_b\n"
+			)
+
+			diagnostics = []
+			proFile = OSVVMProjectFile(tempPath / "top.pro")
+			proFile.Parse(diagnostics=diagnostics.append)
+			project = proFile.ProjectModel
+			files = list(project.DefaultDesign.Files(VHDLSourceFile))
+
+			self.assertListEqual([], diagnostics)
+			self.assertListEqual(["a.vhdl", "b_2019.vhdl"], [file.Path.name for file in files])
+			self.assertIs(VHDLVersion.VHDL2019, files[1].VHDLVersion)
+			self.assertListEqual(["tb_b"], list(project.Testsuites["Default"].Testcases.keys()))
+
+			(tempPath / "top.pro").write_text(
+				"SetVHDLVersion 2008\n"
+				"if {$::osvvm::VhdlVersion >= 2019} {analyze new.vhdl} else {analyze old.vhdl}\n"
+				"SetVHDLVersion 93\n"
+				"if {$::osvvm::VhdlVersion == 1993} {analyze vhdl93.vhdl}\n"
+			)
+			proFile = OSVVMProjectFile(tempPath / "top.pro")
+			proFile.Parse()
+			self.assertListEqual(["old.vhdl", "vhdl93.vhdl"], [file.Path.name for file in proFile.ProjectModel.DefaultDesign.Files(VHDLSourceFile)])
+
+			(tempPath / "top.pro").write_text("SetVHDLVersion 2042\n")
+			with self.assertRaises(Exception):
+				OSVVMProjectFile(tempPath / "top.pro").Parse()
+
+	def test_UnsupportedConstructs(self):
+		with TemporaryDirectory() as tempDirectory:
+			proPath = Path(tempDirectory) / "top.pro"
+			proPath.write_text(
+				"analyze $missing/a.vhdl\n"
+				"analyze [file join src b.vhdl]\n"
+				"if {[info exists x]} {\n"
+				"  analyze c.vhdl\n"
+				"}\n"
+				"if {1} {\n"
+				"  analyze d.vhdl\n"
+				"\n"
+				"  unknown\n"
+				"}\n"
+			)
+
+			diagnostics = []
+			proFile = OSVVMProjectFile(proPath)
+			proFile.Parse(diagnostics=diagnostics.append)
+
+			self.assertListEqual(["d.vhdl"], [file.Path.name for file in proFile.ProjectModel.DefaultDesign.Files(VHDLSourceFile)])
+			self.assertListEqual([1, 2, 3, 9], [diagnostic.Line for diagnostic in diagnostics])
+			self.assertTrue(all(diagnostic.Severity is DiagnosticSeverity.Warning for diagnostic in diagnostics))
+			self.assertIn("'missing'", diagnostics[0].Message)
+
+	def test_MalformedIf(self):
+		with TemporaryDirectory() as tempDirectory:
+			proPath = Path(tempDirectory) / "top.pro"
+			for text in ("if {1}\n", "if {0} {} elif {1} {}\n", "if {1 +} {}\n"):
+				with self.subTest(text=text):
+					proPath.write_text(text)
+					with self.assertRaises(Exception):
+						OSVVMProjectFile(proPath).Parse()
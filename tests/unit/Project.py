@@ -30,12 +30,14 @@
 #
 """Instantiation tests for the project model."""
 from pathlib import Path
+from sys     import getrecursionlimit
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 from pySVModel import VerilogVersion, SystemVerilogVersion
 from pyVHDLModel import VHDLVersion
 
-from pyEDAA.ProjectModel import Project
+from pyEDAA.ProjectModel import Project, FileSet, File, ValidationException
 
 
 if __name__ == "__main__": # pragma: no cover
@@ -113,3 +115,80 @@ class Validate(TestCase):
 		project = Project("project", rootDirectory=Path("project"))
 
 		project.Validate()
+
+	def test_Concurrent(self):
+		with TemporaryDirectory() as tempDirectory:
+			rootDirectory = Path(tempDirectory)
+			(rootDirectory / "src" / "sub").mkdir(parents=True)
+			(rootDirectory / "src" / "a.txt").touch()
+			(rootDirectory / "src" / "sub" / "b.txt").touch()
+
+			project = Project("project", rootDirectory=rootDirectory)
+			fileSet = FileSet("src", directory=Path("src"), design=project.DefaultDesign)
+			fileSet.AddFile(File(Path("a.txt")))
+			subFileSet = FileSet("sub", directory=Path("sub"), parent=fileSet)
+			subFileSet.AddFile(File(Path("b.txt")))
+
+			project.Validate()
+			project.Validate(concurrent=True)
+
+	def test_ConcurrentCollectsErrors(self):
+		with TemporaryDirectory() as tempDirectory:
+			rootDirectory = Path(tempDirectory)
+			(rootDirectory / "src").mkdir()
+			(rootDirectory / "src" / "a.txt").touch()
+			(rootDirectory / "src" / "c.txt").touch()
+
+			project = Project("project", rootDirectory=rootDirectory)
+			fileSet = FileSet("src", directory=Path("src"), design=project.DefaultDesign)
+			files = [File(Path(name)) for name in ("a.txt", "b.txt", "c.txt", "d.txt")]
+			fileSet.AddFiles(files)
+
+			with self.assertRaises(Exception):
+				project.Validate()
+
+			with self.assertRaises(ValidationException) as ctx:
+				project.Validate(concurrent=True, maxWorkers=4)
+
+			self.assertListEqual([files[1], files[3]], [entity for entity, _ in ctx.exception.Errors])
+
+	def test_ConcurrentErrorOrder(self):
+		with TemporaryDirectory() as tempDirectory:
+			rootDirectory = Path(tempDirectory)
+			(rootDirectory / "src" / "sub").mkdir(parents=True)
+
+			project = Project("project", rootDirectory=rootDirectory)
+			fileSet = FileSet("src", directory=Path("src"), design=project.DefaultDesign)
+			fileA = File(Path("a.txt"))
+			fileSet.AddFile(fileA)
+			subFileSet = FileSet("sub", directory=Path("sub"), parent=fileSet)
+			fileB = File(Path("b.txt"))
+			subFileSet.AddFile(fileB)
+			missingFileSet = FileSet("missing", directory=Path("missing"), parent=subFileSet)
+			fileC = File(Path("c.txt"))
+			missingFileSet.AddFile(fileC)
+
+			# a sequential validation visits sub-filesets before the files of a fileset
+			with self.assertRaises(Exception) as ctx:
+				project.Validate()
+			self.assertIn("'missing'", str(ctx.exception))
+
+			with self.assertRaises(ValidationException) as ctx:
+				project.Validate(concurrent=True, maxWorkers=4)
+
+			self.assertListEqual([missingFileSet, fileC, fileB, fileA], [entity for entity, _ in ctx.exception.Errors])
+
+	def test_ConcurrentDeeplyNestedFileSets(self):
+		with TemporaryDirectory() as tempDirectory:
+			rootDirectory = Path(tempDirectory)
+
+			project = Project("project", rootDirectory=rootDirectory)
+			fileSets = [FileSet("fileset0", directory=rootDirectory, design=project.DefaultDesign)]
+			for i in range(1, 2 * getrecursionlimit()):
+				fileSets.append(FileSet(f"fileset{i}", directory=rootDirectory, parent=fileSets[-1]))
+			file = File(Path("missing.txt"), fileSet=fileSets[-1])
+
+			with self.assertRaises(ValidationException) as ctx:
+				project.Validate(concurrent=True)
+
+			self.assertListEqual([file], [entity for entity, _ in ctx.exception.Errors])
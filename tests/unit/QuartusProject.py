@@ -0,0 +1,189 @@
+# ==================================================================================================================== #
+#               _____ ____    _        _      ____            _           _   __  __           _      _                #
+#   _ __  _   _| ____|  _ \  / \      / \    |  _ \ _ __ ___ (_) ___  ___| |_|  \/  | ___   __| | ___| |               #
+#  | '_ \| | | |  _| | | | |/ _ \    / _ \   | |_) | '__/ _ \| |/ _ \/ __| __| |\/| |/ _ \ / _` |/ _ \ |               #
+#  | |_) | |_| | |___| |_| / ___ \  / ___ \ _|  __/| | | (_) | |  __/ (__| |_| |  | | (_) | (_| |  __/ |               #
+#  | .__/ \__, |_____|____/_/   \_\/_/   \_(_)_|   |_|  \___// |\___|\___|\__|_|  |_|\___/ \__,_|\___|_|               #
+#  |_|    |___/                                            |__/                                                        #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2022 Patrick Lehmann - Boetzingen, Germany                                                            #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Instantiation tests for the Quartus project model."""
+from pathlib     import Path
+from tempfile    import TemporaryDirectory
+from unittest    import TestCase
+
+from pySVModel   import SystemVerilogVersion, VerilogVersion
+from pyVHDLModel import VHDLVersion
+
+from pyEDAA.ProjectModel                    import ConstraintFile, ProjectFile as Model_ProjectFile, TCLContent, VHDLSourceFile, VerilogSourceFile, SystemVerilogSourceFile
+from pyEDAA.ProjectModel.Cache              import ParseCache
+from pyEDAA.ProjectModel.Intel.QuartusPrime import QuartusProjectFile, QuartusSettingsFile, QuartusAssignments, Assignment, SDCConstraintFile
+from pyEDAA.ProjectModel.Altera             import Quartus as Altera
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Assignments(TestCase):
+	def test_ColumnStore(self):
+		assignments = QuartusAssignments()
+		assignments.Append("IO_STANDARD", "3.3-V LVTTL", "Clock")
+		assignments.Append("LOCATION", "PIN_AF14", "Clock")
+		assignments.Append("IO_STANDARD", "2.5 V", "Reset", entity="toplevel")
+
+		self.assertEqual(3, len(assignments))
+		self.assertListEqual(["IO_STANDARD", "LOCATION"], assignments.Names)
+		self.assertEqual(Assignment("IO_STANDARD", "2.5 V", "Reset", None, "toplevel", None), assignments[2])
+		self.assertListEqual(["Clock", "Reset"], [assignment.Target for assignment in assignments.Find("IO_STANDARD")])
+		self.assertListEqual([], list(assignments.Find("UNKNOWN")))
+		self.assertEqual("2.5 V", assignments.GetValue("IO_STANDARD"))
+		self.assertEqual("none", assignments.GetValue("UNKNOWN", "none"))
+		self.assertEqual(3, len(list(assignments)))
+
+	def test_NameIndex(self):
+		assignments = QuartusAssignments()
+		for i in range(100):
+			assignments.Append(f"NAME_{i % 7}", str(i), f"target{i}")
+
+		self.assertListEqual([str(i) for i in range(3, 100, 7)], [assignment.Value for assignment in assignments.Find("NAME_3")])
+		self.assertEqual("94", assignments.GetValue("NAME_3"))
+		self.assertEqual("99", assignments.GetValue("NAME_1"))
+
+
+class SettingsFile(TestCase):
+	_qsfPath = Path("QuartusProject/StopWatch/StopWatch.qsf")
+
+	def test_Project(self):
+		qsfFile = QuartusSettingsFile(self._qsfPath)
+		qsfFile.Parse()
+		project = qsfFile.ProjectModel
+
+		self.assertEqual("StopWatch", project.Name)
+		self.assertEqual("StopWatch", project.Revision)
+		self.assertEqual("Cyclone V", project.Family)
+		self.assertEqual("5CSEMA5F31C6", project.Device)
+		self.assertEqual("toplevel", project.DefaultDesign.TopLevel)
+		self.assertIs(VHDLVersion.VHDL2008, project.VHDLVersion)
+		self.assertIs(SystemVerilogVersion.SystemVerilog2005, project.SVVersion)
+		self.assertEqual("23 MM HEAT SINK WITH 200 LFPM AIRFLOW", project.GlobalAssignments.GetValue("POWER_PRESET_COOLING_SOLUTION"))
+		self.assertListEqual(["Top", "Top"], [assignment.SectionId for assignment in project.GlobalAssignments if assignment.Name.startswith("PARTITION")])
+
+	def test_Files(self):
+		qsfFile = QuartusSettingsFile(self._qsfPath)
+		qsfFile.Parse()
+		design = qsfFile.ProjectModel.DefaultDesign
+
+		self.assertEqual(7, design.FileCount())
+		vhdlFiles = list(design.Files(VHDLSourceFile))
+		self.assertListEqual(
+			["../src/Utilities.pkg.vhdl", "../src/StopWatch.pkg.vhdl", "../src/Counter.vhdl", "../src/toplevel.vhdl"],
+			[file.Path.as_posix() for file in vhdlFiles]
+		)
+		self.assertEqual("lib_Utilities", vhdlFiles[0].VHDLLibrary.Name)
+		self.assertIs(vhdlFiles[1].VHDLLibrary, vhdlFiles[2].VHDLLibrary)
+		self.assertIs(VHDLVersion.VHDL2019, vhdlFiles[2].VHDLVersion)
+		self.assertIs(VHDLVersion.VHDL2008, vhdlFiles[1].VHDLVersion)
+		self.assertIn("StopWatch", design.VHDLLibraries)
+
+		verilogFile = next(design.Files(VerilogSourceFile))
+		self.assertIs(VerilogVersion.Verilog2001, verilogFile.VerilogVersion)
+		self.assertEqual(1, design.FileCount(SystemVerilogSourceFile))
+		self.assertEqual(1, design.FileCount(SDCConstraintFile))
+
+	def test_InstanceAssignments(self):
+		qsfFile = QuartusSettingsFile(self._qsfPath)
+		qsfFile.Parse()
+		project = qsfFile.ProjectModel
+
+		self.assertDictEqual(
+			{"Clock": "PIN_AF14", "Reset": "PIN_AA14", "Seg7_Cathode[0]": "PIN_AE26", "Seg7_Cathode[1]": "PIN_AE27"},
+			project.PinAssignments()
+		)
+		ioStandards = list(project.InstanceAssignments.Find("IO_STANDARD"))
+		self.assertEqual(4, len(ioStandards))
+		self.assertEqual(Assignment("IO_STANDARD", "3.3-V LVTTL", "Seg7_Cathode[1]", None, None, None), ioStandards[3])
+		self.assertEqual(
+			Assignment("MULTICYCLE", "2", "display|seg[*]", "counter|cnt[*]", "toplevel", None),
+			next(project.InstanceAssignments.Find("MULTICYCLE"))
+		)
+
+	def test_FileNotFound(self):
+		with self.assertRaises(Exception):
+			QuartusSettingsFile(Path("QuartusProject/StopWatch/Missing.qsf")).Parse()
+
+
+class ProjectFile(TestCase):
+	_qpfPath = Path("QuartusProject/StopWatch/StopWatch.qpf")
+
+	def test_Revisions(self):
+		qpfFile = QuartusProjectFile(self._qpfPath)
+		qpfFile.Parse()
+
+		self.assertListEqual(["StopWatch", "StopWatch_debug"], qpfFile.Revisions)
+		self.assertEqual("StopWatch", qpfFile.ProjectModel.Revision)
+		self.assertEqual(7, qpfFile.ProjectModel.DefaultDesign.FileCount())
+
+		qpfFile.Parse(revision="StopWatch_debug")
+		self.assertEqual("StopWatch", qpfFile.ProjectModel.Name)
+		self.assertEqual("toplevel_debug", qpfFile.ProjectModel.DefaultDesign.TopLevel)
+		self.assertEqual(1, qpfFile.ProjectModel.DefaultDesign.FileCount())
+
+		with self.assertRaises(Exception):
+			qpfFile.Parse(revision="unknown")
+
+	def test_Cache(self):
+		with TemporaryDirectory() as tempDirectory:
+			cache = ParseCache(Path(tempDirectory))
+
+			qpfFile = QuartusProjectFile(self._qpfPath)
+			qpfFile.Parse(cache=cache)
+			cachedProject = cache.Load(qpfFile)
+			self.assertIsNotNone(cachedProject)
+			self.assertDictEqual(qpfFile.ProjectModel.PinAssignments(), cachedProject.PinAssignments())
+
+			# a different revision isn't served from cache
+			qpfFile.Parse(revision="StopWatch_debug", cache=cache)
+			self.assertEqual("StopWatch_debug", qpfFile.ProjectModel.Revision)
+
+	def test_Altera(self):
+		qpfFile = Altera.QuartusProjectFile(self._qpfPath)
+		qpfFile.Parse()
+
+		self.assertEqual(1, qpfFile.ProjectModel.DefaultDesign.FileCount(Altera.SDCConstraintFile))
+		self.assertEqual(1, qpfFile.ProjectModel.DefaultDesign.FileCount(SDCConstraintFile))
+
+	def test_AlteraFileTypes(self):
+		# the Altera project file is still a project file with Tcl content
+		self.assertTrue(issubclass(Altera.QuartusProjectFile, Model_ProjectFile))
+		self.assertTrue(issubclass(Altera.QuartusProjectFile, TCLContent))
+		self.assertTrue(issubclass(Altera.SDCConstraintFile, ConstraintFile))
+
+		# the same-named Altera class doesn't replace the Intel class as file type of files read by the Intel reader
+		qpfFile = QuartusProjectFile(self._qpfPath)
+		qpfFile.Parse()
+		self.assertEqual(1, qpfFile.ProjectModel.DefaultDesign.FileCount(SDCConstraintFile))
+		self.assertEqual(0, qpfFile.ProjectModel.DefaultDesign.FileCount(Altera.SDCConstraintFile))
@@ -103,3 +103,25 @@ class Instantiate(TestCase):
 		library = VHDLLibrary("library", design=design)
 
 		self.assertEqual(vhdlVersion, library.VHDLVersion)
+
+
+class Dependencies(TestCase):
+	def test_AddDependency(self):
+		design = Design("design")
+		libraryA = VHDLLibrary("libA", design=design)
+		libraryB = VHDLLibrary("libB", design=design)
+
+		libraryA.AddDependency(libraryB)
+		libraryA.AddDependency(libraryB)
+
+		self.assertListEqual([libraryB], libraryA.Dependencies)
+		self.assertListEqual([], libraryB.Dependencies)
+		self.assertEqual(1, design._vhdlLibraryDependencyGraph.EdgeCount)
+
+	def test_OtherDesign(self):
+		library = VHDLLibrary("lib", design=Design("design1"))
+
+		with self.assertRaises(Exception):
+			library.AddDependency(VHDLLibrary("lib", design=Design("design2")))
+		with self.assertRaises(Exception):
+			VHDLLibrary("lib").AddDependency(library)
@@ -29,10 +29,19 @@
 # ==================================================================================================================== #
 #
 """Instantiation tests for the project model."""
+from difflib import ndiff
 from pathlib import Path
+from shutil import copyfile
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
-from pyEDAA.ProjectModel.Xilinx.Vivado import VivadoProjectFile
+from pyVHDLModel import VHDLVersion
+
+from pyEDAA.ProjectModel.Xilinx.Vivado import VivadoProjectFile, UsedInAttribute, VivadoProject, DesignSourceSet, ConstraintSet
+from pyEDAA.ProjectModel.Xilinx.Vivado import SimulationSet, UtilitySet, SynthesisRun, ImplementationRun
+from pyEDAA.ProjectModel.Xilinx.Vivado import File, VHDLSourceFile, VerilogSourceFile, SystemVerilogSourceFile, TCLSourceFile, XDCConstraintFile
+from pyEDAA.ProjectModel.Xilinx.Vivado import IPCoreInstantiationFile, BlockDesignFile, WaveformConfigFile, MemoryInitializationFile, CoefficientFile
+from pyEDAA.ProjectModel.Xilinx.Vivado import IPCoreInstance, IPCoreAttribute
 
 if __name__ == "__main__": # pragma: no cover
 	print("ERROR: you called a testcase declaration file as an executable module.")
@@ -74,3 +83,326 @@ class FileSets(TestCase):
 		# 		print(f"    FileSet: {fileSetName}")
 		# 		for file in fileSet.Files():
 		# 			print(f"        {file.ResolvedPath}")
+
+	def test_StreamingAndDOM(self):
+		xprPath = Path.cwd() / "VivadoProject/StopWatch/project/StopWatch.xpr"
+
+		models = []
+		for streaming in (True, False):
+			xprFile = VivadoProjectFile(xprPath)
+			xprFile.Parse(streaming=streaming)
+			models.append(xprFile.ProjectModel)
+
+		for project in models:
+			fileSet = project.DefaultDesign.FileSets["src_StopWatch"]
+			self.assertEqual("toplevel", fileSet.TopLevel)
+			self.assertEqual(8, len(fileSet))
+
+			file = fileSet._files[0]
+			self.assertEqual(Path("../src/Utilities.pkg.vhdl"), file.Path)
+			self.assertEqual(VHDLVersion.VHDL93, file.VHDLVersion)
+			self.assertEqual("lib_Stopwatch", file.VHDLLibrary.Name)
+			self.assertListEqual(["synthesis", "simulation"], file[UsedInAttribute])
+
+			xdcFile = project.DefaultDesign.FileSets["const_StopWatch"]._files[1]
+			self.assertListEqual(["synthesis", "implementation"], xdcFile[UsedInAttribute])
+
+		streamed, dom = models
+		for streamedFileSet, domFileSet in zip(streamed.DefaultDesign.FileSets.values(), dom.DefaultDesign.FileSets.values()):
+			self.assertEqual(streamedFileSet.Name, domFileSet.Name)
+			self.assertEqual(streamedFileSet.TopLevel, domFileSet.TopLevel)
+			self.assertListEqual([f.Path for f in streamedFileSet.Files()], [f.Path for f in domFileSet.Files()])
+
+
+class Configuration(TestCase):
+	def _Parse(self, streaming: bool = True) -> VivadoProject:
+		xprFile = VivadoProjectFile(Path.cwd() / "VivadoProject/StopWatch/project/StopWatch.xpr")
+		xprFile.Parse(streaming=streaming)
+		return xprFile.ProjectModel
+
+	def test_Project(self):
+		project = self._Parse()
+
+		self.assertEqual("xc7a100tcsg324-1", project.Part)
+		self.assertListEqual(["read", "write"], project.Configuration["IPCachePermission"])
+		self.assertIs(project.DefaultDesign.FileSets["sim_StopWatch"], project.ActiveSimulationSet)
+		self.assertListEqual(["XSim", "ModelSim", "Questa", "Riviera", "ActiveHDL"], list(project.Simulators.keys()))
+		self.assertListEqual(["Vivado Simulator"], project.Simulators["XSim"]["Description"])
+
+	def test_FileSets(self):
+		project = self._Parse()
+		fileSets = project.DefaultDesign.FileSets
+
+		self.assertIsInstance(fileSets["src_StopWatch"], DesignSourceSet)
+		self.assertIsInstance(fileSets["utils_1"], UtilitySet)
+
+		constraintSet = fileSets["const_StopWatch"]
+		self.assertIsInstance(constraintSet, ConstraintSet)
+		self.assertEqual("XDC", constraintSet.ConstraintsType)
+
+		simulationSet = fileSets["sim_StopWatch"]
+		self.assertIsInstance(simulationSet, SimulationSet)
+		self.assertIs(fileSets["src_StopWatch"], simulationSet.SourceSet)
+		self.assertEqual("lib_Test", simulationSet.TopLibrary)
+		self.assertEqual("toplevel_tb", simulationSet.TopLevel)
+		self.assertListEqual(["-timeprecision_vhdl 1fs"], simulationSet.Options["xsim.elaborate.xelab.more_options"])
+
+	def test_Runs(self):
+		for streaming in (True, False):
+			project = self._Parse(streaming)
+			fileSets = project.DefaultDesign.FileSets
+
+			self.assertEqual(6, len(project.Runs))
+			self.assertListEqual(["synth_Encoder", "synth_Display", "synth_StopWatch"], [run.Name for run in project.SynthesisRuns()])
+			self.assertListEqual(["impl_Encoder", "impl_Display", "impl_StopWatch"], [run.Name for run in project.ImplementationRuns()])
+
+			synthesisRun = project.Runs["synth_StopWatch"]
+			self.assertIsInstance(synthesisRun, SynthesisRun)
+			self.assertTrue(synthesisRun.IsCurrent)
+			self.assertEqual("Vivado Synthesis Defaults", synthesisRun.Strategy)
+			self.assertEqual("Vivado Synthesis 2018", synthesisRun.Flow)
+			self.assertDictEqual({"synth_design": {"Assert": "1"}}, synthesisRun.Steps)
+			self.assertIs(fileSets["src_StopWatch"], synthesisRun.SourceSet)
+			self.assertIs(fileSets["const_StopWatch"], synthesisRun.ConstraintSet)
+
+			implementationRun = project.Runs["impl_Display"]
+			self.assertIsInstance(implementationRun, ImplementationRun)
+			self.assertFalse(implementationRun.IsCurrent)
+			self.assertEqual("Vivado Implementation Defaults", implementationRun.Strategy)
+			self.assertEqual(9, len(implementationRun.Steps))
+			self.assertIs(project.Runs["synth_Display"], implementationRun.SynthesisRun)
+			self.assertIs(fileSets["src_Display"], implementationRun.SourceSet)
+			self.assertIs(fileSets["const_Display"], implementationRun.ConstraintSet)
+
+
+class FileTypes(TestCase):
+	def test_Classification(self):
+		suffixes = {
+			"a.vhd": VHDLSourceFile, "b.v": VerilogSourceFile, "c.sv": SystemVerilogSourceFile, "d.tcl": TCLSourceFile,
+			"e.xdc": XDCConstraintFile, "f.xci": IPCoreInstantiationFile, "g.bd": BlockDesignFile, "h.wcfg": WaveformConfigFile,
+			"i.mem": MemoryInitializationFile, "j.coe": CoefficientFile, "k.unknown": File
+		}
+
+		with TemporaryDirectory() as tempDirectory:
+			xprPath = Path(tempDirectory) / "types.xpr"
+			with xprPath.open("w") as file:
+				file.write('<?xml version="1.0" encoding="UTF-8"?>\n<Project><FileSets><FileSet Name="sources_1" Type="DesignSrcs">\n')
+				for name in suffixes:
+					file.write(f'<File Path="$PPRDIR/{name}"><FileInfo><Attr Name="UsedIn" Val="synthesis"/></FileInfo></File>\n')
+				file.write('</FileSet></FileSets></Project>\n')
+
+			xprFile = VivadoProjectFile(xprPath)
+			xprFile.Parse()
+
+		files = list(xprFile.ProjectModel.DefaultDesign.FileSets["sources_1"].Files())
+		self.assertListEqual(list(suffixes.values()), [file.__class__ for file in files])
+		for file in files:
+			self.assertListEqual(["synthesis"], file[UsedInAttribute])
+
+
+class Writing(TestCase):
+	def test_RoundTrip(self):
+		xprFile = VivadoProjectFile(Path.cwd() / "VivadoProject/StopWatch/project/StopWatch.xpr")
+		xprFile.Parse()
+		project = xprFile.ProjectModel
+
+		with TemporaryDirectory() as tempDirectory:
+			writtenFile = VivadoProjectFile(Path(tempDirectory) / "StopWatch.xpr")
+			self.assertTrue(writtenFile.Write(project))
+			writtenFile.Parse()
+
+		written = writtenFile.ProjectModel
+		self.assertListEqual(list(project.DefaultDesign.FileSets.keys()), list(written.DefaultDesign.FileSets.keys()))
+		for fileSet in project.DefaultDesign.FileSets.values():
+			writtenFileSet = written.DefaultDesign.FileSets[fileSet.Name]
+			self.assertIs(fileSet.__class__, writtenFileSet.__class__)
+			self.assertEqual(fileSet.TopLevel, writtenFileSet.TopLevel)
+			self.assertListEqual([file.Path for file in fileSet.Files()], [file.Path for file in writtenFileSet.Files()])
+			self.assertListEqual([file[UsedInAttribute] for file in fileSet.Files()], [file[UsedInAttribute] for file in writtenFileSet.Files()])
+
+		self.assertListEqual(list(project.Runs.keys()), list(written.Runs.keys()))
+		self.assertDictEqual({"synth_design": {"Assert": "1"}}, written.Runs["synth_StopWatch"].Steps)
+		self.assertIs(written.Runs["synth_Display"], written.Runs["impl_Display"].SynthesisRun)
+		self.assertEqual(project.Part, written.Part)
+		self.assertDictEqual(project.Simulators, written.Simulators)
+
+	def test_RoundTripVHDLVersions(self):
+		versions = {"a.vhdl": VHDLVersion.VHDL93, "b.vhdl": VHDLVersion.VHDL2008, "c.vhdl": VHDLVersion.VHDL2019}
+
+		with TemporaryDirectory() as tempDirectory:
+			xprPath = Path(tempDirectory) / "RoundTrip.xpr"
+			project = VivadoProject("RoundTrip", rootDirectory=Path(tempDirectory))
+			fileSet = DesignSourceSet("sources_1", design=project.DefaultDesign)
+			for name, version in versions.items():
+				fileSet.AddFile(VHDLSourceFile(Path(name), vhdlVersion=version))
+
+			xprFile = VivadoProjectFile(xprPath)
+			self.assertTrue(xprFile.Write(project))
+
+			writtenFile = VivadoProjectFile(xprPath)
+			writtenFile.Parse()
+			self.assertFalse(writtenFile.Write(incremental=True))
+
+		files = list(writtenFile.ProjectModel.DefaultDesign.FileSets["sources_1"].Files())
+		self.assertDictEqual(versions, {file.Path.name: file.VHDLVersion for file in files})
+
+	def test_Incremental(self):
+		with TemporaryDirectory() as tempDirectory:
+			xprPath = Path(tempDirectory) / "StopWatch.xpr"
+			copyfile(Path.cwd() / "VivadoProject/StopWatch/project/StopWatch.xpr", xprPath)
+			original = xprPath.read_text().splitlines()
+
+			xprFile = VivadoProjectFile(xprPath)
+			xprFile.Parse()
+			self.assertFalse(xprFile.Write(incremental=True))
+
+			fileSet = xprFile.ProjectModel.DefaultDesign.FileSets["sim_StopWatch"]
+			fileSet.TopLevel = "other_tb"
+			fileSet.AddFile(VHDLSourceFile(Path("../tb/other.tb.vhdl")))
+			self.assertTrue(xprFile.Write(incremental=True))
+			updated = xprPath.read_text().splitlines()
+
+			reparsedFile = VivadoProjectFile(xprPath)
+			reparsedFile.Parse()
+
+		changed = [line for line in ndiff(original, updated) if line[0] in "+-"]
+		self.assertListEqual([
+			'+       <File Path="$PPRDIR/../tb/other.tb.vhdl"/>',
+			'-         <Option Name="TopModule" Val="toplevel_tb"/>',
+			'+         <Option Name="TopModule" Val="other_tb"/>',
+		], changed)
+
+		reparsedFileSet = reparsedFile.ProjectModel.DefaultDesign.FileSets["sim_StopWatch"]
+		self.assertEqual("other_tb", reparsedFileSet.TopLevel)
+		self.assertEqual(Path("../tb/other.tb.vhdl"), list(reparsedFileSet.Files())[-1].Path)
+
+	def test_IncrementalModifiedFile(self):
+		comment = b"<!-- modified -->\n"
+		contents = []
+		with TemporaryDirectory() as tempDirectory:
+			for modified in (False, True):
+				xprPath = Path(tempDirectory) / f"StopWatch_{modified}.xpr"
+				copyfile(Path.cwd() / "VivadoProject/StopWatch/project/StopWatch.xpr", xprPath)
+
+				xprFile = VivadoProjectFile(xprPath)
+				xprFile.Parse()
+				if modified:
+					# the file changed after parsing, so it's scanned again
+					xprPath.write_bytes(xprPath.read_bytes() + comment)
+
+				design = xprFile.ProjectModel.DefaultDesign
+				design.FileSets["src_Display"].TopLevel = "other"
+				fileSet = SimulationSet("sim_Other", design=design)
+				fileSet.AddFile(VHDLSourceFile(Path("../tb/other.tb.vhdl")))
+				self.assertTrue(xprFile.Write(incremental=True))
+				contents.append(xprPath.read_bytes())
+
+			reparsedFile = VivadoProjectFile(xprPath)
+			reparsedFile.Parse()
+
+		self.assertEqual(contents[0] + comment, contents[1])
+
+		fileSets = reparsedFile.ProjectModel.DefaultDesign.FileSets
+		self.assertEqual("sim_Other", list(fileSets.keys())[-1])
+		self.assertIsInstance(fileSets["sim_Other"], SimulationSet)
+		self.assertEqual("other", fileSets["src_Display"].TopLevel)
+		self.assertEqual(29 + 1, reparsedFile.ProjectModel.DefaultDesign.FileCount())
+
+
+XCI_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<spirit:design xmlns:xilinx="http://www.xilinx.com" xmlns:spirit="http://www.spiritconsortium.org/XMLSchema/SPIRIT/1685-2009">
+  <spirit:vendor>xilinx.com</spirit:vendor>
+  <spirit:library>xci</spirit:library>
+  <spirit:name>unknown</spirit:name>
+  <spirit:version>1.0</spirit:version>
+  <spirit:componentInstances>
+    <spirit:componentInstance>
+      <spirit:instanceName>clk_wiz_0</spirit:instanceName>
+      <spirit:componentRef spirit:vendor="xilinx.com" spirit:library="ip" spirit:name="clk_wiz" spirit:version="6.0"/>
+      <spirit:configurableElementValues>
+        <spirit:configurableElementValue spirit:referenceId="MODELPARAM_VALUE.C_CLKOUT1_DIVIDE">10</spirit:configurableElementValue>
+        <spirit:configurableElementValue spirit:referenceId="PARAM_VALUE.CLKOUT1_REQUESTED_OUT_FREQ">100.000</spirit:configurableElementValue>
+        <spirit:configurableElementValue spirit:referenceId="PROJECT_PARAM.ARCHITECTURE">artix7</spirit:configurableElementValue>
+        <spirit:configurableElementValue spirit:referenceId="RUNTIME_PARAM.OUTPUTDIR">../../../../StopWatch.gen/sources_1/ip/clk_wiz_0</spirit:configurableElementValue>
+      </spirit:configurableElementValues>
+    </spirit:componentInstance>
+  </spirit:componentInstances>
+</spirit:design>
+"""
+
+XCI_JSON = """{
+  "schema": "xilinx.com:schema:json_instance:1.0",
+  "ip_inst": {
+    "xci_name": "fifo_0",
+    "component_reference": "xilinx.com:ip:fifo_generator:13.2",
+    "ip_revision": "5",
+    "gen_directory": "../../../../StopWatch.gen/sources_1/ip/fifo_0",
+    "parameters": {
+      "component_parameters": {
+        "Component_Name": [ { "value": "fifo_0", "resolve_type": "user", "usage": "all" } ],
+        "Input_Depth": [ { "value": "1024", "resolve_type": "user", "format": "long", "usage": "all" } ]
+      },
+      "model_parameters": {
+        "C_DIN_WIDTH": [ { "value": "18", "resolve_type": "generated", "format": "long", "usage": "all" } ]
+      },
+      "project_parameters": {
+        "ARCHITECTURE": [ { "value": "artix7" } ]
+      }
+    }
+  }
+}
+"""
+
+
+class IPCores(TestCase):
+	def test_ParseFormats(self):
+		xmlInstance = IPCoreInstance.Parse(XCI_XML.encode())
+		self.assertEqual("clk_wiz_0", xmlInstance.Name)
+		self.assertEqual("xilinx.com:ip:clk_wiz:6.0", xmlInstance.VLNV)
+		self.assertEqual("clk_wiz", xmlInstance.CoreName)
+		self.assertEqual("6.0", xmlInstance.Version)
+		self.assertDictEqual({"CLKOUT1_REQUESTED_OUT_FREQ": "100.000"}, xmlInstance.Parameters)
+		self.assertDictEqual({"C_CLKOUT1_DIVIDE": "10"}, xmlInstance.ModelParameters)
+		self.assertDictEqual({"ARCHITECTURE": "artix7"}, xmlInstance.ProjectParameters)
+		self.assertEqual("../../../../StopWatch.gen/sources_1/ip/clk_wiz_0", xmlInstance.OutputDirectory)
+
+		jsonInstance = IPCoreInstance.Parse(XCI_JSON.encode())
+		self.assertEqual("fifo_0", jsonInstance.Name)
+		self.assertEqual("xilinx.com", jsonInstance.Vendor)
+		self.assertEqual("fifo_generator", jsonInstance.CoreName)
+		self.assertDictEqual({"Component_Name": "fifo_0", "Input_Depth": "1024"}, jsonInstance.Parameters)
+		self.assertDictEqual({"C_DIN_WIDTH": "18"}, jsonInstance.ModelParameters)
+		self.assertEqual("../../../../StopWatch.gen/sources_1/ip/fifo_0", jsonInstance.OutputDirectory)
+
+		with self.assertRaises(Exception):
+			IPCoreInstance.Parse(b"<spirit:design/>")
+
+	def test_ParseProject(self):
+		with TemporaryDirectory() as tempDirectory:
+			tempPath = Path(tempDirectory)
+			ipDirectory = tempPath / "ip"
+			ipDirectory.mkdir()
+			(ipDirectory / "clk_wiz_0.xci").write_text(XCI_XML)
+			(ipDirectory / "clk_wiz_copy.xci").write_text(XCI_XML)
+			(ipDirectory / "fifo_0.xci").write_text(XCI_JSON)
+
+			xprPath = tempPath / "ip.xpr"
+			with xprPath.open("w") as file:
+				file.write('<?xml version="1.0" encoding="UTF-8"?>\n<Project><FileSets><FileSet Name="sources_1" Type="DesignSrcs">\n')
+				for name in ("clk_wiz_0", "clk_wiz_copy", "fifo_0"):
+					file.write(f'<File Path="$PPRDIR/ip/{name}.xci"/>\n')
+				file.write('</FileSet></FileSets></Project>\n')
+
+			for maxWorkers in (2, 1):
+				xprFile = VivadoProjectFile(xprPath)
+				xprFile.Parse()
+				xprFile.ParseIPCores(maxWorkers=maxWorkers)
+
+				files = list(xprFile.ProjectModel.DefaultDesign.Files(IPCoreInstantiationFile))
+				self.assertListEqual(["clk_wiz_0", "clk_wiz_0", "fifo_0"], [file.IPCore.Name for file in files])
+				self.assertIs(files[0].IPCore, files[1].IPCore)
+				self.assertIs(files[0].IPCore, files[0][IPCoreAttribute])
+
+			single = IPCoreInstantiationFile(ipDirectory / "fifo_0.xci")
+			self.assertIsNone(single.IPCore)
+			self.assertEqual("xilinx.com:ip:fifo_generator:13.2", single.Parse().VLNV)